@@ -19,6 +19,7 @@ from prowler.lib.check.check import (
     list_fixers,
     list_services,
     parse_checks_from_folder,
+    prefetch_service_clients,
     print_categories,
     print_checks,
     print_compliance_frameworks,
@@ -34,19 +35,24 @@ from prowler.lib.check.custom_checks_metadata import (
     parse_custom_checks_metadata_file,
     update_checks_metadata,
 )
+from prowler.lib.check.models import count_findings_by
 from prowler.lib.cli.parser import ProwlerArgumentParser
 from prowler.lib.logger import logger, set_logging_config
-from prowler.lib.outputs.compliance.compliance import display_compliance_table
+from prowler.lib.outputs.compliance.compliance import (
+    Compliance_Counters,
+    display_compliance_table,
+)
 from prowler.lib.outputs.json.json import close_json
 from prowler.lib.outputs.outputs import extract_findings_statistics
 from prowler.lib.outputs.slack import send_slack_message
 from prowler.lib.outputs.summary_table import display_summary_table
-from prowler.providers.aws.lib.s3.s3 import send_to_s3_bucket
+from prowler.providers.aws.lib.s3.s3 import send_outputs_to_s3_bucket
 from prowler.providers.aws.lib.security_hub.security_hub import (
+    Security_Hub_Findings_Batches,
     batch_send_to_security_hub,
+    get_security_hub_enabled_regions,
     prepare_security_hub_findings,
     resolve_security_hub_previous_findings,
-    verify_security_hub_integration_enabled_per_region,
 )
 from prowler.providers.common.common import set_global_provider_object
 from prowler.providers.common.quick_inventory import run_provider_quick_inventory
@@ -120,6 +126,14 @@ def prowler():
     logger.debug("Loading compliance frameworks from .json files")
 
     bulk_compliance_frameworks = bulk_load_compliance_frameworks(provider)
+    # Parse the compliance frameworks to output, the rest map their checks from a manifest
+    if not (
+        args.list_compliance
+        or args.list_compliance_requirements
+        or args.list_checks
+        or args.list_checks_json
+    ):
+        bulk_compliance_frameworks.load(args.output_formats)
     # Complete checks metadata with the compliance framework specification
     bulk_checks_metadata = update_checks_metadata_with_compliance(
         bulk_compliance_frameworks, bulk_checks_metadata
@@ -211,24 +225,66 @@ def prowler():
     # Execute checks
     findings = []
 
+    # The fixer needs all the findings, so they are not streamed
+    stream_findings = args.stream_findings and not global_provider.output_options.fixer
+    findings_handlers = []
+    # The compliance tables are only displayed in a default execution,
+    # their counters are updated with the findings of every check once they are reported
+    compliance_counters = None
+    if not args.only_logs and default_execution:
+        compliance_overview = False
+        if not compliance_framework:
+            compliance_framework = get_available_compliance_frameworks(provider)
+            # If there are compliance frameworks, print compliance overview
+            compliance_overview = bool(compliance_framework)
+        compliance_counters = Compliance_Counters(
+            bulk_checks_metadata, compliance_framework
+        )
+        findings_handlers.append(compliance_counters.extend)
+    security_hub_findings_batches = None
+    # The streamed findings are sent to AWS Security Hub while the checks are executed
+    if stream_findings and provider == "aws" and args.security_hub:
+        security_hub_findings_batches = Security_Hub_Findings_Batches(
+            global_provider,
+            global_provider.output_options,
+            get_security_hub_enabled_regions(
+                global_provider, args.security_hub_cache_ttl
+            ),
+            global_provider.session.current_session,
+        )
+        findings_handlers.append(security_hub_findings_batches.extend)
+
     if len(checks_to_execute):
+        # Build the services used by the checks concurrently if --prefetch-services
+        if args.prefetch_services:
+            prefetch_service_clients(checks_to_execute, global_provider)
+
         findings = execute_checks(
             checks_to_execute,
             global_provider,
             custom_checks_metadata,
             global_provider.mutelist_file_path,
             args.config_file,
+            args.parallel_checks,
+            stream_findings,
+            findings_handlers,
         )
     else:
         logger.error(
             "There are no checks to execute. Please, check your input arguments"
         )
 
+    # The threads shared by the AWS services are not needed once the checks are executed
+    if provider == "aws":
+        global_provider.thread_pool.shutdown()
+
     # Prowler Fixer
     if global_provider.output_options.fixer:
         print(f"{Style.BRIGHT}\nRunning Prowler Fixer, please wait...{Style.RESET_ALL}")
         # Check if there are any FAIL findings
-        if any("FAIL" in finding.status for finding in findings):
+        if any(
+            "FAIL" in status for (status,), _ in count_findings_by(findings, "status")
+        ):
             fixed_findings = run_fixer(findings)
             if not fixed_findings:
                 print(
@@ -269,58 +325,52 @@ def prowler():
                     mode,
                 )
 
-            # Send output to S3 if needed (-B / -D)
-            if provider == "aws" and (
-                args.output_bucket or args.output_bucket_no_assume
-            ):
-                output_bucket = args.output_bucket
-                bucket_session = global_provider.session.current_session
-                # Check if -D was input
-                if args.output_bucket_no_assume:
-                    output_bucket = args.output_bucket_no_assume
-                    bucket_session = global_provider.session.original_session
-                send_to_s3_bucket(
-                    global_provider.output_options.output_filename,
-                    args.output_directory,
-                    mode,
-                    output_bucket,
-                    bucket_session,
-                )
+        # Send the outputs to S3 if needed (-B / -D)
+        if provider == "aws" and (args.output_bucket or args.output_bucket_no_assume):
+            output_bucket = args.output_bucket
+            bucket_session = global_provider.session.current_session
+            # Check if -D was input
+            if args.output_bucket_no_assume:
+                output_bucket = args.output_bucket_no_assume
+                bucket_session = global_provider.session.original_session
+            send_outputs_to_s3_bucket(
+                global_provider.output_options.output_filename,
+                args.output_directory,
+                args.output_formats,
+                output_bucket,
+                bucket_session,
+            )
 
     # AWS Security Hub Integration
     if provider == "aws" and args.security_hub:
         print(
             f"{Style.BRIGHT}\nSending findings to AWS Security Hub, please wait...{Style.RESET_ALL}"
         )
-        # Verify where AWS Security Hub is enabled
-        aws_security_enabled_regions = []
-        security_hub_regions = (
-            global_provider.get_available_aws_service_regions("securityhub")
-            if not global_provider.identity.audited_regions
-            else global_provider.identity.audited_regions
-        )
-        for region in security_hub_regions:
-            # Save the regions where AWS Security Hub is enabled
-            if verify_security_hub_integration_enabled_per_region(
-                global_provider.identity.partition,
-                region,
-                global_provider.session.current_session,
-                global_provider.identity.account,
-            ):
-                aws_security_enabled_regions.append(region)
+        if security_hub_findings_batches:
+            # Send the remaining streamed findings to Security Hub
+            findings_sent_to_security_hub = security_hub_findings_batches.send()
+            security_hub_findings_per_region = (
+                security_hub_findings_batches.findings_ids_per_region
+            )
+        else:
+            # Verify where AWS Security Hub is enabled
+            aws_security_enabled_regions = get_security_hub_enabled_regions(
+                global_provider, args.security_hub_cache_ttl
+            )
 
-        # Prepare the findings to be sent to Security Hub
-        security_hub_findings_per_region = prepare_security_hub_findings(
-            findings,
-            global_provider,
-            global_provider.output_options,
-            aws_security_enabled_regions,
-        )
+            # Prepare the findings to be sent to Security Hub
+            security_hub_findings_per_region = prepare_security_hub_findings(
+                findings,
+                global_provider,
+                global_provider.output_options,
+                aws_security_enabled_regions,
+            )
 
-        # Send the findings to Security Hub
-        findings_sent_to_security_hub = batch_send_to_security_hub(
-            security_hub_findings_per_region, global_provider.session.current_session
-        )
+            # Send the findings to Security Hub
+            findings_sent_to_security_hub = batch_send_to_security_hub(
+                security_hub_findings_per_region,
+                global_provider.session.current_session,
+            )
 
         print(
             f"{Style.BRIGHT}{Fore.GREEN}\n{findings_sent_to_security_hub} findings sent to AWS Security Hub!{Style.RESET_ALL}"
@@ -348,20 +398,16 @@ def prowler():
         )
         # Only display compliance table if there are findings (not all MANUAL) and it is a default execution
         if (
-            findings and not all(finding.status == "MANUAL" for finding in findings)
+            findings
+            and not all(
+                status == "MANUAL"
+                for (status,), _ in count_findings_by(findings, "status")
+            )
         ) and default_execution:
-            compliance_overview = False
-            if not compliance_framework:
-                compliance_framework = get_available_compliance_frameworks(provider)
-                if (
-                    compliance_framework
-                ):  # If there are compliance frameworks, print compliance overview
-                    compliance_overview = True
             for compliance in sorted(compliance_framework):
                 # Display compliance table
                 display_compliance_table(
-                    findings,
-                    bulk_checks_metadata,
+                    compliance_counters,
                     compliance,
                     global_provider.output_options.output_filename,
                     global_provider.output_options.output_directory,
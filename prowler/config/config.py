@@ -51,6 +51,16 @@ aws_services_json_file = "aws_regions_by_service.json"
 
 # gcp_zones_json_file = "gcp_zones.json"
 
+# Checks catalog cache
+checks_catalog_directory = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "prowler",
+)
+# AWS Security Hub enabled regions cache
+security_hub_cache_file = os.path.join(
+    checks_catalog_directory, "security_hub_enabled_regions.json"
+)
+
 default_output_directory = getcwd() + "/output"
 output_file_timestamp = timestamp.strftime("%Y%m%d%H%M%S")
 timestamp_iso = timestamp.isoformat(sep=" ", timespec="seconds")
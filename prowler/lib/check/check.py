@@ -1,4 +1,5 @@
 import functools
+import hashlib
 import importlib
 import json
 import os
@@ -6,6 +7,7 @@ import re
 import shutil
 import sys
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pkgutil import walk_packages
 from types import ModuleType
 from typing import Any
@@ -14,43 +16,170 @@ from alive_progress import alive_bar
 from colorama import Fore, Style
 
 import prowler
-from prowler.config.config import orange_color
-from prowler.lib.check.compliance_models import load_compliance_framework
+from prowler.config.config import (
+    checks_catalog_directory,
+    orange_color,
+    prowler_version,
+)
+from prowler.lib.check.compliance_models import Compliance_Frameworks
 from prowler.lib.check.custom_checks_metadata import update_check_metadata
-from prowler.lib.check.models import Check, load_check_metadata
+from prowler.lib.check.models import (
+    Check,
+    Findings_Counter,
+    Findings_Store,
+    build_check_metadata,
+    load_check_metadata,
+)
 from prowler.lib.logger import logger
 from prowler.lib.mutelist.mutelist import mutelist_findings
+from prowler.lib.outputs.file_descriptors import close_file_descriptors
 from prowler.lib.outputs.outputs import report
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.common.models import Audit_Metadata
 
+# Maximum number of service clients built at the same time by prefetch_service_clients
+MAX_PREFETCH_WORKERS = 10
+
+# Checks catalogs already loaded in this execution with their fingerprint
+checks_catalogs = {}
+
 
 # Load all checks metadata
 def bulk_load_checks_metadata(provider: str) -> dict:
     bulk_check_metadata = {}
-    checks = recover_checks_from_provider(provider)
-    # Build list of check's metadata files
-    for check_info in checks:
-        # Build check path name
-        check_name = check_info[0]
-        check_path = check_info[1]
-        # Ignore fixer files
-        if check_name.endswith("_fixer"):
-            continue
-        # Append metadata file extension
-        metadata_file = f"{check_path}/{check_name}.metadata.json"
-        # Load metadata
-        check_metadata = load_check_metadata(metadata_file)
+    checks_catalog = load_checks_catalog(provider)
+    for check in checks_catalog.values():
+        # The catalog metadata was validated when the catalog was built and its digest verified when loaded
+        check_metadata = build_check_metadata(check["Metadata"])
         bulk_check_metadata[check_metadata.CheckID] = check_metadata
 
     return bulk_check_metadata
 
 
+def load_checks_catalog(provider: str) -> dict:
+    """
+    load_checks_catalog returns the checks catalog of the provider, a dict with the path, service, fixer and metadata of each check.
+
+    The catalog is saved in the checks_catalog_directory and it is only built again, discovering the checks, when the Prowler version or the provider's checks files change.
+    The saved catalog starts with a line with its fingerprint and the digest of the checks, so a catalog modified after it was built and its metadata validated is built again.
+    """
+    fingerprint = get_checks_catalog_fingerprint(provider)
+    if provider in checks_catalogs and checks_catalogs[provider][0] == fingerprint:
+        return checks_catalogs[provider][1]
+
+    checks_catalog = None
+    checks_catalog_file = f"{checks_catalog_directory}/{provider}_checks_catalog.json"
+    try:
+        with open(checks_catalog_file, "rb") as catalog_file:
+            checks_catalog_header = json.loads(catalog_file.readline())
+            if checks_catalog_header["Fingerprint"] == fingerprint:
+                checks_catalog_content = catalog_file.read()
+                if (
+                    hashlib.sha256(checks_catalog_content).hexdigest()
+                    == checks_catalog_header["Digest"]
+                ):
+                    checks_catalog = json.loads(checks_catalog_content)
+                else:
+                    logger.warning(
+                        f"The {provider} checks catalog was modified, building it again"
+                    )
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.warning(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+    if checks_catalog is None:
+        logger.info(f"Building the {provider} checks catalog")
+        checks_catalog = build_checks_catalog(provider)
+        try:
+            os.makedirs(checks_catalog_directory, exist_ok=True)
+            checks_catalog_content = json.dumps(checks_catalog).encode()
+            checks_catalog_header = {
+                "Fingerprint": fingerprint,
+                "Digest": hashlib.sha256(checks_catalog_content).hexdigest(),
+            }
+            # Write a temporary file first so concurrent executions never read a partial catalog
+            temporary_file = f"{checks_catalog_file}.{os.getpid()}"
+            with open(temporary_file, "wb") as catalog_file:
+                catalog_file.write(json.dumps(checks_catalog_header).encode() + b"\n")
+                catalog_file.write(checks_catalog_content)
+            os.replace(temporary_file, checks_catalog_file)
+        except Exception as error:
+            logger.info(
+                f"The {provider} checks catalog could not be saved -- {error.__class__.__name__}: {error}"
+            )
+
+    checks_catalogs[provider] = (fingerprint, checks_catalog)
+    return checks_catalog
+
+
+def get_checks_catalog_fingerprint(provider: str) -> dict:
+    """
+    get_checks_catalog_fingerprint returns the Prowler version, the path and the number and last modification of the checks files of the provider, to know if the checks catalog is outdated.
+
+    Only the services and checks directories and the Python and metadata files of the checks are inspected, not the rest of the services files.
+    """
+    services_path = os.path.join(
+        os.path.dirname(prowler.__file__), "providers", provider, "services"
+    )
+    files = 0
+    last_modification = 0
+    for service_directory in __scan_directories__(services_path):
+        last_modification = max(last_modification, service_directory.stat().st_mtime_ns)
+        for check_directory in __scan_directories__(service_directory.path):
+            last_modification = max(
+                last_modification, check_directory.stat().st_mtime_ns
+            )
+            with os.scandir(check_directory.path) as check_files:
+                for check_file in check_files:
+                    if check_file.name.endswith((".py", ".metadata.json")):
+                        files += 1
+                        last_modification = max(
+                            last_modification, check_file.stat().st_mtime_ns
+                        )
+    return {
+        "Version": prowler_version,
+        "Path": services_path,
+        "Files": files,
+        "LastModification": last_modification,
+    }
+
+
+def __scan_directories__(path: str) -> list:
+    """__scan_directories__ returns the directories in the given path, without the compiled files ones"""
+    with os.scandir(path) as entries:
+        return [
+            entry for entry in entries if entry.is_dir() and entry.name != "__pycache__"
+        ]
+
+
+def build_checks_catalog(provider: str) -> dict:
+    """build_checks_catalog discovers all the checks of the provider and loads their metadata"""
+    checks_catalog = {}
+    for check_name, check_path in discover_checks(provider, include_fixers=True):
+        # The fixer goes right after its check
+        if check_name.endswith("_fixer"):
+            check_name = check_name.removesuffix("_fixer")
+            if check_name in checks_catalog:
+                checks_catalog[check_name]["Fixer"] = True
+            continue
+        check_metadata = load_check_metadata(f"{check_path}/{check_name}.metadata.json")
+        checks_catalog[check_name] = {
+            "CheckPath": check_path,
+            "Service": os.path.basename(os.path.dirname(check_path)),
+            "Fixer": False,
+            "Metadata": json.loads(check_metadata.json()),
+        }
+    return checks_catalog
+
+
 # Bulk load all compliance frameworks specification
-def bulk_load_compliance_frameworks(provider: str) -> dict:
-    """Bulk load all compliance frameworks specification into a dict"""
+def bulk_load_compliance_frameworks(provider: str) -> Compliance_Frameworks:
+    """Bulk load all compliance frameworks specification into a mapping, each one is parsed on first access"""
     try:
-        bulk_compliance_frameworks = {}
+        compliance_specification_files = {}
         available_compliance_framework_modules = list_compliance_modules()
         for compliance_framework in available_compliance_framework_modules:
             if provider in compliance_framework.name:
@@ -68,14 +197,14 @@ def bulk_load_compliance_frameworks(provider: str) -> dict:
                         # Open Compliance file in JSON
                         # cis_v1.4_aws.json --> cis_v1.4_aws
                         compliance_framework_name = filename.split(".json")[0]
-                        # Store the compliance info
-                        bulk_compliance_frameworks[compliance_framework_name] = (
-                            load_compliance_framework(file_path)
+                        # Store the compliance specification file to be parsed on demand
+                        compliance_specification_files[compliance_framework_name] = (
+                            file_path
                         )
     except Exception as e:
         logger.error(f"{e.__class__.__name__}[{e.__traceback__.tb_lineno}] -- {e}")
 
-    return bulk_compliance_frameworks
+    return Compliance_Frameworks(compliance_specification_files)
 
 
 # Exclude checks to run
@@ -291,24 +420,23 @@ def print_compliance_requirements(
     bulk_compliance_frameworks: dict, compliance_frameworks: list
 ):
     for compliance_framework in compliance_frameworks:
-        for key in bulk_compliance_frameworks.keys():
-            framework = bulk_compliance_frameworks[key].Framework
-            provider = bulk_compliance_frameworks[key].Provider
-            version = bulk_compliance_frameworks[key].Version
-            requirements = bulk_compliance_frameworks[key].Requirements
-            # We can list the compliance requirements for a given framework using the
-            # bulk_compliance_frameworks keys since they are the compliance specification file name
-            if compliance_framework == key:
+        # We can list the compliance requirements for a given framework using the
+        # bulk_compliance_frameworks keys since they are the compliance specification file name
+        if compliance_framework in bulk_compliance_frameworks:
+            framework = bulk_compliance_frameworks[compliance_framework].Framework
+            provider = bulk_compliance_frameworks[compliance_framework].Provider
+            version = bulk_compliance_frameworks[compliance_framework].Version
+            requirements = bulk_compliance_frameworks[compliance_framework].Requirements
+            print(
+                f"Listing {framework} {version} {provider} Compliance Requirements:\n"
+            )
+            for requirement in requirements:
+                checks = ""
+                for check in requirement.Checks:
+                    checks += f" {Fore.YELLOW}\t\t{check}\n{Style.RESET_ALL}"
                 print(
-                    f"Listing {framework} {version} {provider} Compliance Requirements:\n"
+                    f"Requirement Id: {Fore.MAGENTA}{requirement.Id}{Style.RESET_ALL}\n\t- Description: {requirement.Description}\n\t- Checks:\n{checks}"
                 )
-                for requirement in requirements:
-                    checks = ""
-                    for check in requirement.Checks:
-                        checks += f" {Fore.YELLOW}\t\t{check}\n{Style.RESET_ALL}"
-                    print(
-                        f"Requirement Id: {Fore.MAGENTA}{requirement.Id}{Style.RESET_ALL}\n\t- Description: {requirement.Description}\n\t- Checks:\n{checks}"
-                    )
 
 
 def list_checks_json(provider: str, check_list: set):
@@ -379,25 +507,19 @@ def recover_checks_from_provider(
     """
     Recover all checks from the selected provider and service
 
+    The checks of the whole provider are read from its checks catalog, while the ones of a single service are discovered from its package
+
     Returns a list of tuples with the following format (check_name, check_path)
     """
     try:
-        checks = []
-        modules = list_modules(provider, service)
-        for module_name in modules:
-            # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
-            check_module_name = module_name.name
-            # We need to exclude common shared libraries in services
-            if (
-                check_module_name.count(".") == 6
-                and "lib" not in check_module_name
-                and (not check_module_name.endswith("_fixer") or include_fixers)
-            ):
-                check_path = module_name.module_finder.path
-                # Check name is the last part of the check_module_name
-                check_name = check_module_name.split(".")[-1]
-                check_info = (check_name, check_path)
-                checks.append(check_info)
+        if service:
+            checks = discover_checks(provider, service, include_fixers)
+        else:
+            checks = []
+            for check_name, check in load_checks_catalog(provider).items():
+                checks.append((check_name, check["CheckPath"]))
+                if include_fixers and check["Fixer"]:
+                    checks.append((f"{check_name}_fixer", check["CheckPath"]))
     except ModuleNotFoundError:
         logger.critical(f"Service {service} was not found for the {provider} provider.")
         sys.exit(1)
@@ -408,6 +530,33 @@ def recover_checks_from_provider(
         return checks
 
 
+def discover_checks(
+    provider: str, service: str = None, include_fixers: bool = False
+) -> list[tuple]:
+    """
+    Discover the checks from the selected provider and service walking their packages
+
+    Returns a list of tuples with the following format (check_name, check_path)
+    """
+    checks = []
+    modules = list_modules(provider, service)
+    for module_name in modules:
+        # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+        check_module_name = module_name.name
+        # We need to exclude common shared libraries in services
+        if (
+            check_module_name.count(".") == 6
+            and "lib" not in check_module_name
+            and (not check_module_name.endswith("_fixer") or include_fixers)
+        ):
+            check_path = module_name.module_finder.path
+            # Check name is the last part of the check_module_name
+            check_name = check_module_name.split(".")[-1]
+            check_info = (check_name, check_path)
+            checks.append(check_info)
+    return checks
+
+
 def list_compliance_modules():
     """
     list_compliance_modules returns the available compliance frameworks and returns their path
@@ -543,15 +692,110 @@ def run_fixer(check_findings: list) -> int:
         )
 
 
+def recover_service_clients_from_checks(checks_to_execute: list, provider: str) -> list:
+    """
+    Recover the service client modules imported by the given checks
+
+    The check's source files are read without importing them, so the service clients are not built.
+    Returns a sorted list of modules like "prowler.providers.{provider}.services.{service}.{service}_client"
+    """
+    service_clients = set()
+    client_import = re.compile(
+        rf"from (prowler\.providers\.{provider}\.services\.\w+\.\w+_client) import"
+    )
+    for check_name in checks_to_execute:
+        try:
+            # Recover service from check name
+            service = check_name.split("_")[0]
+            check_file = f"{prowler.__path__[0]}/providers/{provider}/services/{service}/{check_name}/{check_name}.py"
+            if os.path.isfile(check_file):
+                with open_file(check_file) as f:
+                    service_clients.update(client_import.findall(f.read()))
+        except Exception as error:
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+    return sorted(service_clients)
+
+
+def prefetch_service_clients(
+    checks_to_execute: list,
+    global_provider: Any,
+    max_workers: int = MAX_PREFETCH_WORKERS,
+) -> list:
+    """
+    Build the service clients used by the given checks concurrently before executing them
+
+    Importing a "<service>_client" module instantiates its service, which retrieves all the
+    service's resources, so doing it here with a bounded pool of threads lets the checks only
+    process data that is already loaded. Clients that fail to be built are skipped and imported
+    again by their checks, keeping the current error handling.
+    Returns the list of service client modules built.
+    """
+    service_clients = recover_service_clients_from_checks(
+        checks_to_execute, global_provider.type
+    )
+    prefetched_clients = []
+    if not service_clients:
+        return prefetched_clients
+
+    # The services read the checks to execute from the Audit Metadata
+    global_provider.audit_metadata = Audit_Metadata(
+        services_scanned=0,
+        expected_checks=checks_to_execute,
+        completed_checks=0,
+        audit_progress=0,
+    )
+
+    if not global_provider.output_options.only_logs:
+        print(
+            f"{Style.BRIGHT}Loading {len(service_clients)} services, please wait...{Style.RESET_ALL}"
+        )
+    logger.info(
+        f"Prefetching {len(service_clients)} service clients with {max_workers} workers"
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(importlib.import_module, service_client): service_client
+            for service_client in service_clients
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+                prefetched_clients.append(futures[future])
+            except Exception as error:
+                logger.error(
+                    f"{futures[future]} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+    return sorted(prefetched_clients)
+
+
 def execute_checks(
     checks_to_execute: list,
     global_provider: Any,
     custom_checks_metadata: Any,
     mutelist_file: str,
     config_file: str,
-) -> list:
-    # List to store all the check's findings
-    all_findings = []
+    parallel_checks: int = 1,
+    stream_findings: bool = False,
+    findings_handlers: list = None,
+) -> Findings_Store | Findings_Counter:
+    """
+    Execute the given checks and return all their findings in a Findings_Store
+
+    If parallel_checks is greater than 1 the checks are run concurrently using a pool
+    of parallel_checks threads, but their findings are muted, reported and returned in
+    the same order as the serial execution, so the outputs do not change.
+
+    The findings of each check are passed to the findings_handlers once they are reported.
+    The output files opened to report them are closed before returning.
+    If stream_findings is True they are dropped after that and only their counts are returned
+    in a Findings_Counter, so the memory does not grow with the number of findings.
+    """
+    if findings_handlers is None:
+        findings_handlers = []
+    # Store all the check's findings by columns, or only count them if they are streamed
+    all_findings = Findings_Counter() if stream_findings else Findings_Store()
     # Services and checks executed for the Audit Status
     services_executed = set()
     checks_executed = set()
@@ -583,97 +827,161 @@ def execute_checks(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    # Execution with the --only-logs flag
-    if global_provider.output_options.only_logs:
-        for check_name in checks_to_execute:
-            # Recover service from check name
-            service = check_name.split("_")[0]
-            try:
-                check_findings = execute(
-                    service,
-                    check_name,
-                    global_provider.type,
-                    global_provider.identity,
-                    services_executed,
-                    checks_executed,
-                    custom_checks_metadata,
-                )
-                all_findings.extend(check_findings)
+    # The verbose and fixer modes print each check while it runs,
+    # so they are always executed serially to keep that output readable
+    if global_provider.output_options.verbose or global_provider.output_options.fixer:
+        parallel_checks = 1
+
+    check_executor = None
+    check_findings_futures = {}
+    checks_to_submit = iter(checks_to_execute)
+    if parallel_checks > 1:
+        logger.info(f"Executing checks with {parallel_checks} parallel workers")
+        check_executor = ThreadPoolExecutor(max_workers=parallel_checks)
+
+    def submit_checks():
+        # At most parallel_checks checks are submitted and not consumed at a time,
+        # so the findings waiting to be reported are bounded
+        while check_executor and len(check_findings_futures) < parallel_checks:
+            check_name = next(checks_to_submit, None)
+            if check_name is None:
+                break
+            check_findings_futures[check_name] = check_executor.submit(
+                run_check_module,
+                check_name.split("_")[0],
+                check_name,
+                global_provider,
+                custom_checks_metadata,
+            )
 
-            # If check does not exists in the provider or is from another provider
-            except ModuleNotFoundError:
-                logger.error(
-                    f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                )
-            except Exception as error:
-                logger.error(
-                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-    else:
-        # Prepare your messages
-        messages = [f"Config File: {Fore.YELLOW}{config_file}{Style.RESET_ALL}"]
-        if mutelist_file:
-            messages.append(
-                f"Mutelist File: {Fore.YELLOW}{mutelist_file}{Style.RESET_ALL}"
+    def execute_check(check_name: str):
+        # Recover service from check name
+        service = check_name.split("_")[0]
+        try:
+            check_findings = execute(
+                service,
+                check_name,
+                global_provider,
+                services_executed,
+                checks_executed,
+                custom_checks_metadata,
+                # The future is released once consumed to not keep its findings until the end
+                check_findings_futures.pop(check_name, None),
             )
-        if global_provider.type == "aws":
-            messages.append(
-                f"Scanning unused services and resources: {Fore.YELLOW}{global_provider.scan_unused_services}{Style.RESET_ALL}"
+            all_findings.extend(check_findings)
+            for findings_handler in findings_handlers:
+                findings_handler(check_findings)
+
+        # If check does not exists in the provider or is from another provider
+        except ModuleNotFoundError:
+            # TODO: add more loggin here, we need the original exception -- traceback.print_last()
+            logger.error(
+                f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
             )
-        report_title = (
-            f"{Style.BRIGHT}Using the following configuration:{Style.RESET_ALL}"
-        )
-        print_boxes(messages, report_title)
-        # Default execution
-        checks_num = len(checks_to_execute)
-        plural_string = "checks"
-        singular_string = "check"
+        except Exception as error:
+            # TODO: add more loggin here, we need the original exception -- traceback.print_last()
+            logger.error(
+                f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        submit_checks()
 
-        check_noun = plural_string if checks_num > 1 else singular_string
-        print(
-            f"{Style.BRIGHT}Executing {checks_num} {check_noun}, please wait...{Style.RESET_ALL}"
-        )
-        with alive_bar(
-            total=len(checks_to_execute),
-            ctrl_c=False,
-            bar="blocks",
-            spinner="classic",
-            stats=False,
-            enrich_print=False,
-        ) as bar:
+    try:
+        submit_checks()
+        # Execution with the --only-logs flag
+        if global_provider.output_options.only_logs:
             for check_name in checks_to_execute:
-                # Recover service from check name
-                service = check_name.split("_")[0]
-                bar.title = (
-                    f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
+                execute_check(check_name)
+        else:
+            # Prepare your messages
+            messages = [f"Config File: {Fore.YELLOW}{config_file}{Style.RESET_ALL}"]
+            if mutelist_file:
+                messages.append(
+                    f"Mutelist File: {Fore.YELLOW}{mutelist_file}{Style.RESET_ALL}"
                 )
-                try:
-                    check_findings = execute(
-                        service,
-                        check_name,
-                        global_provider,
-                        services_executed,
-                        checks_executed,
-                        custom_checks_metadata,
-                    )
-                    all_findings.extend(check_findings)
+            if global_provider.type == "aws":
+                messages.append(
+                    f"Scanning unused services and resources: {Fore.YELLOW}{global_provider.scan_unused_services}{Style.RESET_ALL}"
+                )
+            if parallel_checks > 1:
+                messages.append(
+                    f"Parallel checks: {Fore.YELLOW}{parallel_checks}{Style.RESET_ALL}"
+                )
+            report_title = (
+                f"{Style.BRIGHT}Using the following configuration:{Style.RESET_ALL}"
+            )
+            print_boxes(messages, report_title)
+            # Default execution
+            checks_num = len(checks_to_execute)
+            plural_string = "checks"
+            singular_string = "check"
 
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {global_provider.type.upper()} provider"
-                    )
-                except Exception as error:
-                    # TODO: add more loggin here, we need the original exception -- traceback.print_last()
-                    logger.error(
-                        f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            check_noun = plural_string if checks_num > 1 else singular_string
+            print(
+                f"{Style.BRIGHT}Executing {checks_num} {check_noun}, please wait...{Style.RESET_ALL}"
+            )
+            with alive_bar(
+                total=len(checks_to_execute),
+                ctrl_c=False,
+                bar="blocks",
+                spinner="classic",
+                stats=False,
+                enrich_print=False,
+            ) as bar:
+                for check_name in checks_to_execute:
+                    # Recover service from check name
+                    service = check_name.split("_")[0]
+                    bar.title = (
+                        f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
                     )
-                bar()
-            bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
+                    execute_check(check_name)
+                    bar()
+                bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
+    finally:
+        if check_executor:
+            check_executor.shutdown(wait=True, cancel_futures=True)
+        # The output files opened by report are flushed and closed once all the checks are reported, even if the execution fails
+        close_file_descriptors(global_provider.output_options.file_descriptors)
     return all_findings
 
 
+def run_check_module(
+    service: str,
+    check_name: str,
+    global_provider: Any,
+    custom_checks_metadata: Any,
+) -> list:
+    """
+    Import the check's module, apply the custom metadata if any and run the check
+
+    This only builds the check's findings, it does not update the audit metadata nor
+    report them, so it is safe to call it from the parallel check workers.
+    Args:
+        service (str): check's service
+        check_name (str): check's name
+        global_provider (Any): provider object
+        custom_checks_metadata (Any): custom checks metadata
+    Returns:
+        list: list of findings
+    """
+    # Import check module
+    check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
+    lib = import_check(check_module_path)
+    # Recover functions from check
+    check_to_execute = getattr(lib, check_name)
+    check_class = check_to_execute()
+
+    # Update check metadata to reflect that in the outputs
+    if custom_checks_metadata and custom_checks_metadata["Checks"].get(
+        check_class.CheckID
+    ):
+        check_class = update_check_metadata(
+            check_class, custom_checks_metadata["Checks"][check_class.CheckID]
+        )
+
+    # Run check
+    return run_check(check_class, global_provider.output_options)
+
+
 def execute(
     service: str,
     check_name: str,
@@ -681,26 +989,19 @@ def execute(
     services_executed: set,
     checks_executed: set,
     custom_checks_metadata: Any,
+    check_findings_future: Future = None,
 ):
     try:
-        # Import check module
-        check_module_path = f"prowler.providers.{global_provider.type}.services.{service}.{check_name}.{check_name}"
-        lib = import_check(check_module_path)
-        # Recover functions from check
-        check_to_execute = getattr(lib, check_name)
-        check_class = check_to_execute()
-
-        # Update check metadata to reflect that in the outputs
-        if custom_checks_metadata and custom_checks_metadata["Checks"].get(
-            check_class.CheckID
-        ):
-            check_class = update_check_metadata(
-                check_class, custom_checks_metadata["Checks"][check_class.CheckID]
+        # Recover the check's findings from the parallel workers or run it now
+        if check_findings_future:
+            check_findings = check_findings_future.result()
+            # Release the future right away so it does not keep the check's findings
+            check_findings_future = None
+        else:
+            check_findings = run_check_module(
+                service, check_name, global_provider, custom_checks_metadata
             )
 
-        # Run check
-        check_findings = run_check(check_class, global_provider.output_options)
-
         # Update Audit Status
         services_executed.add(service)
         checks_executed.add(check_name)
@@ -2,55 +2,72 @@ import sys
 
 from pydantic import parse_obj_as
 
-from prowler.lib.check.compliance_models import Compliance_Base_Model
+from prowler.lib.check.compliance_models import (
+    Compliance_Base_Model,
+    Compliance_Frameworks,
+)
 from prowler.lib.check.models import Check_Metadata_Model
 from prowler.lib.logger import logger
 
 
+def get_compliance_frameworks_manifests(bulk_compliance_frameworks: dict) -> list:
+    """get_compliance_frameworks_manifests returns the compliance frameworks without parsing the ones not parsed yet"""
+    if isinstance(bulk_compliance_frameworks, Compliance_Frameworks):
+        return bulk_compliance_frameworks.manifests()
+    return list(bulk_compliance_frameworks.values())
+
+
+def get_checks_compliance_index(bulk_compliance_frameworks: dict) -> dict:
+    """
+    get_checks_compliance_index returns an index with the compliance of every check, built in a single pass over the compliance frameworks.
+
+    Each (framework, requirement) pair gets one Compliance_Base_Model, shared by all the checks of the requirement, with the requirement itself instead of a copy.
+    The requirements without checks (Manual Controls) are indexed under the "manual_check" key.
+    The compliance frameworks not parsed yet are indexed from their manifest, without the requirement attributes.
+
+        Example:
+
+    {
+        "iam_root_mfa_enabled": [Compliance_Base_Model(Framework="CIS", Version="1.4", Requirements=[<1.5>]), ...],
+        "manual_check": [...],
+    }
+    """
+    checks_compliance_index = {}
+    for framework in get_compliance_frameworks_manifests(bulk_compliance_frameworks):
+        for requirement in framework.Requirements:
+            # construct skips the validation, which would copy the requirement
+            compliance = Compliance_Base_Model.construct(
+                Framework=framework.Framework,
+                Provider=framework.Provider,
+                Version=framework.Version,
+                Description=framework.Description,
+                Requirements=[requirement],
+            )
+            # dict.fromkeys removes the duplicated checks keeping their order
+            for check in dict.fromkeys(requirement.Checks or ["manual_check"]):
+                checks_compliance_index.setdefault(check, []).append(compliance)
+    return checks_compliance_index
+
+
 def update_checks_metadata_with_compliance(
     bulk_compliance_frameworks: dict, bulk_checks_metadata: dict
 ):
     """Update the check metadata model with the compliance framework"""
     try:
+        checks_compliance_index = get_checks_compliance_index(
+            bulk_compliance_frameworks
+        )
         for check in bulk_checks_metadata:
-            check_compliance = []
-            for framework in bulk_compliance_frameworks.values():
-                for requirement in framework.Requirements:
-                    compliance_requirements = []
-                    # Verify if check is in the requirement
-                    if check in requirement.Checks:
-                        # Include the requirement into the check's framework requirements
-                        compliance_requirements.append(requirement)
-                        # Create the Compliance_Model
-                        compliance = Compliance_Base_Model(
-                            Framework=framework.Framework,
-                            Provider=framework.Provider,
-                            Version=framework.Version,
-                            Description=framework.Description,
-                            Requirements=compliance_requirements,
-                        )
-                        # Include the compliance framework for the check
-                        check_compliance.append(compliance)
             # Save it into the check's metadata
-            bulk_checks_metadata[check].Compliance = check_compliance
+            bulk_checks_metadata[check].Compliance = checks_compliance_index.get(
+                check, []
+            )
 
         # Add requirements of Manual Controls
-        for framework in bulk_compliance_frameworks.values():
-            for requirement in framework.Requirements:
-                compliance_requirements = []
-                # Verify if requirement is Manual
-                if not requirement.Checks:
-                    compliance_requirements.append(requirement)
-                    # Create the Compliance_Model
-                    compliance = Compliance_Base_Model(
-                        Framework=framework.Framework,
-                        Provider=framework.Provider,
-                        Version=framework.Version,
-                        Description=framework.Description,
-                        Requirements=compliance_requirements,
-                    )
-                    # Include the compliance framework for the check
-                    check_compliance.append(compliance)
+        if bulk_compliance_frameworks:
+            framework = get_compliance_frameworks_manifests(bulk_compliance_frameworks)[
+                -1
+            ]
             # Create metadata for Manual Control
             manual_check_metadata = {
                 "Provider": framework.Provider.lower(),
@@ -78,7 +95,9 @@ def update_checks_metadata_with_compliance(
             manual_check = parse_obj_as(Check_Metadata_Model, manual_check_metadata)
             # Save it into the check's metadata
             bulk_checks_metadata["manual_check"] = manual_check
-            bulk_checks_metadata["manual_check"].Compliance = check_compliance
+            bulk_checks_metadata["manual_check"].Compliance = (
+                checks_compliance_index.get("manual_check", [])
+            )
 
         return bulk_checks_metadata
     except Exception as e:
@@ -1,4 +1,6 @@
+import json
 import sys
+from collections.abc import Mapping
 from enum import Enum
 from typing import Optional, Union
 
@@ -231,3 +233,76 @@ def load_compliance_framework(
         sys.exit(1)
     else:
         return compliance_framework
+
+
+def load_compliance_framework_manifest(
+    compliance_specification_file: str,
+) -> Compliance_Base_Model:
+    """load_compliance_framework_manifest loads the framework and the requirements ids and checks of a Compliance Framework Specification without validating the requirement attributes"""
+    with open(compliance_specification_file) as compliance_specification:
+        compliance_framework = json.load(compliance_specification)
+    return Compliance_Base_Model.construct(
+        Framework=compliance_framework["Framework"],
+        Provider=compliance_framework["Provider"],
+        Version=compliance_framework.get("Version"),
+        Description=compliance_framework["Description"],
+        Requirements=[
+            Compliance_Requirement.construct(
+                Id=requirement["Id"],
+                Description=requirement["Description"],
+                Name=requirement.get("Name"),
+                Attributes=[],
+                Checks=requirement["Checks"],
+            )
+            for requirement in compliance_framework["Requirements"]
+        ],
+    )
+
+
+class Compliance_Frameworks(Mapping):
+    """
+    Compliance_Frameworks maps the compliance framework name to its specification, parsed on first access.
+
+    The manifests only hold the requirements ids and checks, enough to map the checks to the frameworks.
+    """
+
+    def __init__(self, compliance_specification_files: dict):
+        self._compliance_specification_files = compliance_specification_files
+        self._frameworks = {}
+        self._manifests = {}
+
+    def __getitem__(self, compliance_framework: str) -> Compliance_Base_Model:
+        if compliance_framework not in self._frameworks:
+            self._frameworks[compliance_framework] = load_compliance_framework(
+                self._compliance_specification_files[compliance_framework]
+            )
+            self._manifests.pop(compliance_framework, None)
+        return self._frameworks[compliance_framework]
+
+    def __iter__(self):
+        return iter(self._compliance_specification_files)
+
+    def __len__(self) -> int:
+        return len(self._compliance_specification_files)
+
+    def load(self, compliance_frameworks: list):
+        """load parses the given compliance frameworks specification"""
+        for compliance_framework in compliance_frameworks:
+            if compliance_framework in self:
+                _ = self[compliance_framework]
+
+    def manifests(self) -> list:
+        """manifests returns the parsed compliance frameworks and the manifest of the rest"""
+        manifests = []
+        for compliance_framework in self:
+            if compliance_framework in self._frameworks:
+                manifests.append(self._frameworks[compliance_framework])
+            else:
+                if compliance_framework not in self._manifests:
+                    self._manifests[compliance_framework] = (
+                        load_compliance_framework_manifest(
+                            self._compliance_specification_files[compliance_framework]
+                        )
+                    )
+                manifests.append(self._manifests[compliance_framework])
+        return manifests
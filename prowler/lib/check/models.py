@@ -1,8 +1,12 @@
+import hashlib
 import os
 import re
 import sys
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
+from itertools import repeat
 
 from pydantic import BaseModel, ValidationError, validator
 
@@ -82,6 +86,23 @@ class Check_Metadata_Model(BaseModel):
         return severity
 
 
+# Checks' metadata already validated indexed by its JSON representation,
+# the findings of the same check share the same Check_Metadata_Model object
+checks_metadata_registry: dict[str, Check_Metadata_Model] = {}
+
+
+def parse_check_metadata(metadata: str) -> Check_Metadata_Model:
+    """parse_check_metadata returns the Check_Metadata_Model for the given check's metadata JSON, validating it only the first time it is seen.
+
+    The returned object is shared by all the findings of the check, so it must not be modified in place.
+    """
+    check_metadata = checks_metadata_registry.get(metadata)
+    if check_metadata is None:
+        check_metadata = Check_Metadata_Model.parse_raw(metadata)
+        checks_metadata_registry[metadata] = check_metadata
+    return check_metadata
+
+
 class Check(ABC, Check_Metadata_Model):
     """Prowler Check"""
 
@@ -119,7 +140,7 @@ class Check_Report:
 
     def __init__(self, metadata):
         self.status = ""
-        self.check_metadata = Check_Metadata_Model.parse_raw(metadata)
+        self.check_metadata = parse_check_metadata(metadata)
         self.status_extended = ""
         self.resource_details = ""
         self.resource_tags = []
@@ -191,6 +212,266 @@ class Check_Report_Kubernetes(Check_Report):
         self.namespace = ""
 
 
+# Value of the attributes that a finding does not have
+MISSING_VALUE = object()
+# Number of findings after which the columns with mostly distinct values stop being dictionary encoded
+FINDINGS_STORE_ENCODING_SAMPLE = 1000
+
+
+def get_finding_value_key(value):
+    """get_finding_value_key returns the key used to store once the equal values of the findings"""
+    # Most of the values are strings, which are their own key
+    if value.__class__ is str:
+        return value
+    if isinstance(value, (list, dict)):
+        return (value.__class__, repr(value))
+    try:
+        hash(value)
+    except TypeError:
+        # The values that cannot be hashed, like the check metadata, are stored once per object
+        return (value.__class__, id(value))
+    return (value.__class__, value)
+
+
+class Findings_Store(Sequence):
+    """
+    Findings_Store keeps the findings of a scan by columns instead of a list of Check_Report objects.
+
+    Every attribute of the findings is a column. The columns with repeated values, like the check metadata, the status
+    or the region, hold each distinct value once and an array with the index of the value of every finding.
+    The columns with mostly distinct values, like the resource ARN, hold the values of every finding.
+    The findings are rebuilt as Check_Report objects when they are accessed, they share their values so they must not be modified.
+    """
+
+    def __init__(self, findings: list = None):
+        self._length = 0
+        # Attribute -> array with the index of the value of every finding, or the values of every finding
+        self._columns = {}
+        # Attribute -> distinct values, only for the dictionary encoded columns
+        self._values = {}
+        # Attribute -> value key -> index of the value, only for the dictionary encoded columns
+        self._indexes = {}
+        self._add_column("__class__")
+        if findings:
+            self.extend(findings)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get_finding(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Findings_Store index out of range")
+        return self._get_finding(index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self._get_finding(index)
+
+    def _add_column(self, attribute: str):
+        # The index 0 is the value of the findings without the attribute
+        self._columns[attribute] = array("I", repeat(0, self._length))
+        self._values[attribute] = [MISSING_VALUE]
+        self._indexes[attribute] = {get_finding_value_key(MISSING_VALUE): 0}
+
+    def _get_value_index(self, attribute: str, value) -> int:
+        key = get_finding_value_key(value)
+        index = self._indexes[attribute].get(key)
+        if index is None:
+            index = len(self._values[attribute])
+            self._values[attribute].append(value)
+            self._indexes[attribute][key] = index
+        return index
+
+    def _get_value(self, attribute: str, index: int):
+        if attribute not in self._columns:
+            return MISSING_VALUE
+        if attribute in self._indexes:
+            return self._values[attribute][self._columns[attribute][index]]
+        return self._columns[attribute][index]
+
+    def _get_finding(self, index: int):
+        finding_class = self._get_value("__class__", index)
+        finding = finding_class.__new__(finding_class)
+        for attribute in self._columns:
+            value = self._get_value(attribute, index)
+            if value is not MISSING_VALUE and attribute != "__class__":
+                finding.__dict__[attribute] = value
+        return finding
+
+    def _decode_column(self, attribute: str):
+        # Storing every value is cheaper than indexing a column with mostly distinct values
+        values = self._values.pop(attribute)
+        self._columns[attribute] = [values[index] for index in self._columns[attribute]]
+        del self._indexes[attribute]
+
+    def append(self, finding):
+        """append stores the given finding"""
+        values = vars(finding)
+        for attribute in values:
+            if attribute not in self._columns:
+                self._add_column(attribute)
+        for attribute, column in self._columns.items():
+            if attribute == "__class__":
+                value = finding.__class__
+            else:
+                value = values.get(attribute, MISSING_VALUE)
+            if attribute in self._indexes:
+                column.append(self._get_value_index(attribute, value))
+            else:
+                column.append(value)
+        self._length += 1
+        if self._length == FINDINGS_STORE_ENCODING_SAMPLE:
+            for attribute in list(self._indexes):
+                if len(self._values[attribute]) > self._length / 2:
+                    self._decode_column(attribute)
+
+    def extend(self, findings: list):
+        """extend stores the given findings"""
+        for finding in findings:
+            self.append(finding)
+
+    def count_by(self, *attributes: str) -> list:
+        """
+        count_by returns the values of the given attributes with their number of findings, in order of appearance, without rebuilding the findings.
+
+            Example:
+
+        findings.count_by("status", "muted") -> [(("PASS", False), 10), (("FAIL", False), 2)]
+        """
+        keys = []
+        for attribute in attributes:
+            if attribute not in self._columns:
+                keys.append(repeat(0, self._length))
+            elif attribute in self._indexes:
+                keys.append(self._columns[attribute])
+            else:
+                keys.append(map(get_finding_value_key, self._columns[attribute]))
+        counts = {}
+        for index, key in enumerate(zip(*keys)):
+            if key in counts:
+                counts[key][1] += 1
+            else:
+                counts[key] = [index, 1]
+        return [
+            (
+                tuple(
+                    None if value is MISSING_VALUE else value
+                    for value in (
+                        self._get_value(attribute, index) for attribute in attributes
+                    )
+                ),
+                count,
+            )
+            for index, count in counts.values()
+        ]
+
+
+class Findings_Counter:
+    """
+    Findings_Counter counts the findings instead of keeping them, to stream the findings of a scan with bounded memory.
+
+    The findings are counted by check, status and muted, which is enough for the statistics and the summary and compliance tables.
+    The distinct resources are counted exactly keeping a 64 bits digest of their IDs, smaller than the IDs themselves.
+    Iterating the counter rebuilds the counted findings with only their check metadata, status and muted, grouped by check.
+    """
+
+    counted_attributes = ("check_metadata", "status", "muted")
+
+    def __init__(self):
+        self._length = 0
+        # Check, status and muted keys -> [finding class, check metadata, status, muted, count]
+        self._counts = {}
+        # Digests of the distinct resource IDs
+        self._resources = set()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        for (
+            finding_class,
+            check_metadata,
+            status,
+            muted,
+            count,
+        ) in self._counts.values():
+            finding = finding_class.__new__(finding_class)
+            finding.__dict__.update(
+                check_metadata=check_metadata, status=status, muted=muted
+            )
+            for _ in range(count):
+                yield finding
+
+    def append(self, finding):
+        """append counts the given finding"""
+        values = (
+            finding.__class__,
+            finding.check_metadata,
+            finding.status,
+            finding.muted,
+        )
+        key = tuple(get_finding_value_key(value) for value in values)
+        if key not in self._counts:
+            self._counts[key] = [*values, 0]
+        self._counts[key][-1] += 1
+        self.__add_resource__(getattr(finding, "resource_id", None))
+        self._length += 1
+
+    def extend(self, findings: list):
+        """extend counts the given findings"""
+        for finding in findings:
+            self.append(finding)
+
+    def __add_resource__(self, resource_id):
+        # The representation tells apart a missing resource ID from the "None" one
+        self._resources.add(
+            int.from_bytes(
+                hashlib.blake2b(repr(resource_id).encode(), digest_size=8).digest(),
+                "big",
+            )
+        )
+
+    def count_resources(self) -> int:
+        """count_resources returns the number of distinct resources"""
+        return len(self._resources)
+
+    def count_by(self, *attributes: str) -> list:
+        """count_by returns the values of the given attributes with their number of findings, in order of appearance, only for the counted attributes"""
+        if not set(attributes).issubset(self.counted_attributes):
+            raise ValueError(f"The findings are not counted by {attributes}")
+        counts = {}
+        for _, *values, count in self._counts.values():
+            counted_values = dict(zip(self.counted_attributes, values))
+            finding_values = tuple(
+                counted_values[attribute] for attribute in attributes
+            )
+            key = tuple(get_finding_value_key(value) for value in finding_values)
+            if key not in counts:
+                counts[key] = [finding_values, 0]
+            counts[key][1] += count
+        return [(finding_values, count) for finding_values, count in counts.values()]
+
+
+def count_findings_by(findings: list, *attributes: str) -> list:
+    """count_findings_by returns the values of the given attributes with their number of findings, in order of appearance"""
+    if isinstance(findings, (Findings_Store, Findings_Counter)):
+        return findings.count_by(*attributes)
+    counts = {}
+    for finding in findings:
+        finding_values = tuple(
+            getattr(finding, attribute, None) for attribute in attributes
+        )
+        key = tuple(get_finding_value_key(value) for value in finding_values)
+        if key not in counts:
+            counts[key] = [finding_values, 0]
+        counts[key][1] += 1
+    return [(finding_values, count) for finding_values, count in counts.values()]
+
+
 # Testing Pending
 def load_check_metadata(metadata_file: str) -> Check_Metadata_Model:
     """load_check_metadata loads and parse a Check's metadata file"""
@@ -201,3 +482,19 @@ def load_check_metadata(metadata_file: str) -> Check_Metadata_Model:
         sys.exit(1)
     else:
         return check_metadata
+
+
+def build_check_metadata(check_metadata: dict) -> Check_Metadata_Model:
+    """build_check_metadata returns the Check_Metadata_Model of a metadata already validated, like the ones saved in the checks catalog, without validating it again"""
+    remediation = check_metadata["Remediation"]
+    return Check_Metadata_Model.construct(
+        **{
+            **check_metadata,
+            "Remediation": Remediation.construct(
+                Code=Code.construct(**remediation["Code"]),
+                Recommendation=Recommendation.construct(
+                    **remediation["Recommendation"]
+                ),
+            ),
+        }
+    )
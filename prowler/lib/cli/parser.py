@@ -1,6 +1,6 @@
 import argparse
 import sys
-from argparse import RawTextHelpFormatter
+from argparse import ArgumentTypeError, RawTextHelpFormatter
 
 from dashboard.lib.arguments.arguments import init_dashboard_parser
 from prowler.config.config import (
@@ -182,6 +182,11 @@ Detailed documentation at https://docs.prowler.com
             default=False,
             help="Set the output timestamp format as unix timestamps instead of iso format timestamps (default mode).",
         )
+        common_outputs_parser.add_argument(
+            "--stream-findings",
+            action="store_true",
+            help="Drop the findings of each check once they are reported, keeping only their counts for the summary and compliance tables, so the memory does not grow with the number of findings. The outputs are the same. Not available with the fixer.",
+        )
 
     def __init_logging_parser__(self):
         # Logging Options
@@ -279,6 +284,18 @@ Detailed documentation at https://docs.prowler.com
             nargs="?",
             help="Specify external directory with custom checks (each check must have a folder with the required files, see more in https://docs.prowler.cloud/en/latest/tutorials/misc/#custom-checks).",
         )
+        common_checks_parser.add_argument(
+            "--parallel-checks",
+            type=validate_parallel_checks,
+            default=1,
+            metavar="N",
+            help="Number of checks to be executed in parallel, by default 1 (serial execution). The output is the same as the serial execution.",
+        )
+        common_checks_parser.add_argument(
+            "--prefetch-services",
+            action="store_true",
+            help="Retrieve the resources of all the services used by the checks to execute concurrently before running them.",
+        )
 
     def __init_list_checks_parser__(self):
         # List checks options
@@ -377,3 +394,14 @@ Detailed documentation at https://docs.prowler.com
             action="store_true",
             help="Send a summary of the execution with a Slack APP in your channel. Environment variables SLACK_API_TOKEN and SLACK_CHANNEL_ID are required (see more in https://docs.prowler.cloud/en/latest/tutorials/integrations/#slack).",
         )
+
+
+def validate_parallel_checks(parallel_checks: str) -> int:
+    """validate_parallel_checks validates that the number of parallel checks is a positive integer"""
+    try:
+        parallel_checks = int(parallel_checks)
+    except ValueError:
+        raise ArgumentTypeError("--parallel-checks must be an integer")
+    if parallel_checks < 1:
+        raise ArgumentTypeError("--parallel-checks must be greater than 0")
+    return parallel_checks
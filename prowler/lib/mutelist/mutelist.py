@@ -33,6 +33,146 @@ mutelist_schema = Schema(
 )
 
 
+class Mutelist(dict):
+    """
+    Mutelist compiled to check if the findings are muted.
+
+    It behaves like the mutelist dict it is built from, but all the Regions, Resources, Tags
+    and Exceptions patterns are compiled once and the checks of every account are indexed by
+    the check name, so checking a finding does not depend on the size of the mutelist.
+    The mutelist content must not be modified once it is built.
+    """
+
+    def __init__(self, mutelist: dict):
+        super().__init__(mutelist)
+        # Compiled checks per account, in the same order than the mutelist
+        self._muted_checks = {}
+        for account, account_mutelist in mutelist.get("Accounts", {}).items():
+            self._muted_checks[account] = [
+                __compile_muted_check__(muted_check, muted_check_info)
+                for muted_check, muted_check_info in account_mutelist.get(
+                    "Checks", {}
+                ).items()
+            ]
+        # Muted checks that need to be evaluated for each (account, check)
+        self._muted_checks_index = {}
+
+    def __get_muted_checks__(self, audited_account: str, check: str) -> list:
+        """__get_muted_checks__ returns the compiled checks of the accounts that apply to the audited account that need to be evaluated for the check"""
+        muted_checks = self._muted_checks_index.get((audited_account, check))
+        if muted_checks is None:
+            muted_checks = []
+            for account, account_muted_checks in self._muted_checks.items():
+                if account == audited_account or account == "*":
+                    # Checks with exceptions are always evaluated since they stop the evaluation
+                    # of the following checks of the account when the finding is excepted
+                    muted_checks.append(
+                        [
+                            muted_check
+                            for muted_check in account_muted_checks
+                            if muted_check["Exceptions"]
+                            or __is_check_matched__(muted_check, check)
+                        ]
+                    )
+            self._muted_checks_index[(audited_account, check)] = muted_checks
+        return muted_checks
+
+    def is_muted(
+        self,
+        audited_account: str,
+        check: str,
+        finding_region: str,
+        finding_resource: str,
+        finding_tags,
+    ) -> bool:
+        """is_muted returns True if the finding is muted, with the same behaviour as the is_muted function"""
+        try:
+            for account_muted_checks in self.__get_muted_checks__(
+                audited_account, check
+            ):
+                is_check_muted = False
+                for muted_check in account_muted_checks:
+                    # Check if the finding is excepted
+                    if is_excepted(
+                        muted_check["Exceptions"],
+                        audited_account,
+                        finding_region,
+                        finding_resource,
+                        finding_tags,
+                    ):
+                        # Break loop and keep the current value since is excepted
+                        break
+                    if (
+                        __is_check_matched__(muted_check, check)
+                        and is_muted_in_region(muted_check["Regions"], finding_region)
+                        and is_muted_in_tags(muted_check["Tags"], finding_tags)
+                        and is_muted_in_resource(
+                            muted_check["Resources"], finding_resource
+                        )
+                    ):
+                        is_check_muted = True
+                if is_check_muted:
+                    return True
+            return False
+        except Exception as error:
+            logger.critical(
+                f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+            )
+            sys.exit(1)
+
+
+def __compile_pattern__(pattern: str):
+    """__compile_pattern__ returns the compiled regular expression for the mutelist pattern, or the pattern itself if it is not a valid regular expression so it fails when it is used, as re.search does."""
+    if pattern == "*":
+        pattern = ".*"
+    try:
+        return re.compile(pattern)
+    except (re.error, TypeError):
+        return pattern
+
+
+def __compile_muted_check__(muted_check: str, muted_check_info: dict) -> dict:
+    """__compile_muted_check__ returns the mutelist check entry with all its patterns compiled"""
+    # map lambda to awslambda
+    muted_check = re.sub("^lambda", "awslambda", muted_check)
+    muted_tags = muted_check_info.get("Tags", "*")
+    # We need to set the muted_tags if None, "" or [], so the falsy helps
+    if not muted_tags:
+        muted_tags = "*"
+    exceptions = muted_check_info.get("Exceptions")
+    return {
+        "Check": muted_check,
+        "CheckPattern": __compile_pattern__(muted_check),
+        "Regions": [
+            __compile_pattern__(region)
+            for region in muted_check_info.get("Regions") or []
+        ],
+        "Resources": [
+            __compile_pattern__(resource)
+            for resource in muted_check_info.get("Resources") or []
+        ],
+        "Tags": [__compile_pattern__(tag) for tag in muted_tags],
+        "Exceptions": (
+            {
+                key: [__compile_pattern__(item) for item in items or []]
+                for key, items in exceptions.items()
+            }
+            if exceptions
+            else exceptions
+        ),
+    }
+
+
+def __is_check_matched__(muted_check: dict, check: str) -> bool:
+    """__is_check_matched__ returns True if the compiled mutelist check entry applies to the check"""
+    # If there is a *, it affects to all checks
+    return bool(
+        "*" == muted_check["Check"]
+        or check == muted_check["Check"]
+        or re.search(muted_check["CheckPattern"], check)
+    )
+
+
 def parse_mutelist_file(
     mutelist_path: str, aws_session: Session = None, aws_account: str = None
 ):
@@ -104,7 +244,7 @@ def parse_mutelist_file(
                 f"{error.__class__.__name__} -- Mutelist YAML is malformed - {error}[{error.__traceback__.tb_lineno}]"
             )
             sys.exit(1)
-        return mutelist
+        return Mutelist(mutelist)
     except Exception as error:
         logger.critical(
             f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
@@ -116,12 +256,16 @@ def mutelist_findings(
     global_provider: Any,
     check_findings: list[Any],
 ):
+    # The mutelist is compiled once in parse_mutelist_file
+    mutelist = global_provider.mutelist
+    if not isinstance(mutelist, Mutelist):
+        mutelist = Mutelist(mutelist)
     # Check if finding is muted
     for finding in check_findings:
         # TODO: Move this mapping to the execute_check function and pass that output to the mutelist and the report
         if global_provider.type == "aws":
             finding.muted = is_muted(
-                global_provider.mutelist,
+                mutelist,
                 global_provider.identity.account,
                 finding.check_metadata.CheckID,
                 finding.region,
@@ -130,7 +274,7 @@ def mutelist_findings(
             )
         elif global_provider.type == "azure":
             finding.muted = is_muted(
-                global_provider.mutelist,
+                mutelist,
                 finding.subscription,
                 finding.check_metadata.CheckID,
                 # TODO: add region to the findings when we add Azure Locations
@@ -141,7 +285,7 @@ def mutelist_findings(
             )
         elif global_provider.type == "gcp":
             finding.muted = is_muted(
-                global_provider.mutelist,
+                mutelist,
                 finding.project_id,
                 finding.check_metadata.CheckID,
                 finding.location,
@@ -150,7 +294,7 @@ def mutelist_findings(
             )
         elif global_provider.type == "kubernetes":
             finding.muted = is_muted(
-                global_provider.mutelist,
+                mutelist,
                 global_provider.identity.cluster,
                 finding.check_metadata.CheckID,
                 finding.namespace,
@@ -169,6 +313,16 @@ def is_muted(
     finding_tags,
 ):
     try:
+        # Use the compiled mutelist if available
+        if isinstance(mutelist, Mutelist):
+            return mutelist.is_muted(
+                audited_account,
+                check,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            )
+
         # By default is not muted
         is_finding_muted = False
 
@@ -73,15 +73,63 @@ def write_compliance_row_cis(
         )
 
 
+def add_cis_table_findings(
+    compliance_table: dict,
+    check,
+    status: str,
+    muted: bool,
+    findings_count: int,
+    compliance_framework: str,
+):
+    """add_cis_table_findings adds to the CIS table counters the given number of findings of the check with the same status"""
+    sections = compliance_table["sections"]
+    # Each finding is counted once in the totals
+    counted = False
+    for compliance in check.Compliance:
+        if compliance.Framework == "CIS" and compliance.Version in compliance_framework:
+            compliance_table["provider"] = compliance.Provider
+            for requirement in compliance.Requirements:
+                for attribute in requirement.Attributes:
+                    section = attribute.Section
+                    # Check if Section exists
+                    if section not in sections:
+                        sections[section] = {
+                            "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
+                            "Level 1": {"FAIL": 0, "PASS": 0},
+                            "Level 2": {"FAIL": 0, "PASS": 0},
+                            "Muted": 0,
+                        }
+                    if muted:
+                        if not counted:
+                            counted = True
+                            compliance_table["muted_count"] += findings_count
+                            sections[section]["Muted"] += findings_count
+                    elif status in ("FAIL", "PASS") and not counted:
+                        counted = True
+                        compliance_table[f"{status.lower()}_count"] += findings_count
+                    if "Level 1" in attribute.Profile:
+                        if not muted:
+                            if status == "FAIL":
+                                sections[section]["Level 1"]["FAIL"] += findings_count
+                            else:
+                                sections[section]["Level 1"]["PASS"] += findings_count
+                    elif "Level 2" in attribute.Profile:
+                        if not muted:
+                            if status == "FAIL":
+                                sections[section]["Level 2"]["FAIL"] += findings_count
+                            else:
+                                sections[section]["Level 2"]["PASS"] += findings_count
+
+
 def get_cis_table(
-    findings: list,
-    bulk_checks_metadata: dict,
+    compliance_table: dict,
+    findings_count: int,
     compliance_framework: str,
     output_filename: str,
     output_directory: str,
     compliance_overview: bool,
 ):
-    sections = {}
+    sections = compliance_table["sections"]
     cis_compliance_table = {
         "Provider": [],
         "Section": [],
@@ -89,54 +137,14 @@ def get_cis_table(
         "Level 2": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
-    for index, finding in enumerate(findings):
-        check = bulk_checks_metadata[finding.check_metadata.CheckID]
-        check_compliances = check.Compliance
-        for compliance in check_compliances:
-            if (
-                compliance.Framework == "CIS"
-                and compliance.Version in compliance_framework
-            ):
-                for requirement in compliance.Requirements:
-                    for attribute in requirement.Attributes:
-                        section = attribute.Section
-                        # Check if Section exists
-                        if section not in sections:
-                            sections[section] = {
-                                "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
-                                "Level 1": {"FAIL": 0, "PASS": 0},
-                                "Level 2": {"FAIL": 0, "PASS": 0},
-                                "Muted": 0,
-                            }
-                        if finding.muted:
-                            if index not in muted_count:
-                                muted_count.append(index)
-                                sections[section]["Muted"] += 1
-                        else:
-                            if finding.status == "FAIL" and index not in fail_count:
-                                fail_count.append(index)
-                            elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
-                        if "Level 1" in attribute.Profile:
-                            if not finding.muted:
-                                if finding.status == "FAIL":
-                                    sections[section]["Level 1"]["FAIL"] += 1
-                                else:
-                                    sections[section]["Level 1"]["PASS"] += 1
-                        elif "Level 2" in attribute.Profile:
-                            if not finding.muted:
-                                if finding.status == "FAIL":
-                                    sections[section]["Level 2"]["FAIL"] += 1
-                                else:
-                                    sections[section]["Level 2"]["PASS"] += 1
+    pass_count = compliance_table["pass_count"]
+    fail_count = compliance_table["fail_count"]
+    muted_count = compliance_table["muted_count"]
 
     # Add results to table
     sections = dict(sorted(sections.items()))
     for section in sections:
-        cis_compliance_table["Provider"].append(compliance.Provider)
+        cis_compliance_table["Provider"].append(compliance_table["provider"])
         cis_compliance_table["Section"].append(section)
         if sections[section]["Level 1"]["FAIL"] > 0:
             cis_compliance_table["Level 1"].append(
@@ -158,16 +166,16 @@ def get_cis_table(
             f"{orange_color}{sections[section]['Muted']}{Style.RESET_ALL}"
         )
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nCompliance Status of {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Framework:"
         )
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / len(findings) * 100, 2)}% ({len(fail_count)}) FAIL{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / len(findings) * 100, 2)}% ({len(pass_count)}) PASS{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / len(findings) * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / findings_count * 100, 2)}% ({fail_count}) FAIL{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / findings_count * 100, 2)}% ({pass_count}) PASS{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
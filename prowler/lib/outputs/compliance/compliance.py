@@ -1,16 +1,22 @@
 import sys
 
-from prowler.lib.check.models import Check_Report
+from prowler.lib.check.models import Check_Report, count_findings_by
 from prowler.lib.logger import logger
 from prowler.lib.outputs.compliance.aws_well_architected_framework import (
     write_compliance_row_aws_well_architected_framework,
 )
-from prowler.lib.outputs.compliance.cis import get_cis_table, write_compliance_row_cis
+from prowler.lib.outputs.compliance.cis import (
+    add_cis_table_findings,
+    get_cis_table,
+    write_compliance_row_cis,
+)
 from prowler.lib.outputs.compliance.ens_rd2022_aws import (
+    add_ens_rd2022_aws_table_findings,
     get_ens_rd2022_aws_table,
     write_compliance_row_ens_rd2022_aws,
 )
 from prowler.lib.outputs.compliance.generic import (
+    add_generic_compliance_table_findings,
     get_generic_compliance_table,
     write_compliance_row_generic,
 )
@@ -18,6 +24,7 @@ from prowler.lib.outputs.compliance.iso27001_2013_aws import (
     write_compliance_row_iso27001_2013_aws,
 )
 from prowler.lib.outputs.compliance.mitre_attack.mitre_attack import (
+    add_mitre_attack_table_findings,
     get_mitre_attack_table,
     write_compliance_row_mitre_attack,
 )
@@ -140,51 +147,83 @@ def fill_compliance(
         )
 
 
+def get_compliance_table_functions(compliance_framework: str) -> tuple:
+    """get_compliance_table_functions returns the functions to add the findings to the table of the given compliance framework and to display it"""
+    if "ens_rd2022_aws" == compliance_framework:
+        return add_ens_rd2022_aws_table_findings, get_ens_rd2022_aws_table
+    elif "cis_" in compliance_framework:
+        return add_cis_table_findings, get_cis_table
+    elif "mitre_attack" in compliance_framework:
+        return add_mitre_attack_table_findings, get_mitre_attack_table
+    else:
+        return add_generic_compliance_table_findings, get_generic_compliance_table
+
+
+class Compliance_Counters:
+    """
+    Compliance_Counters keeps the counters of the tables of the given compliance frameworks.
+
+    The counters are updated in a single pass with the findings of every check once they are reported,
+    adding at once the findings of a check with the same status, and the tables are displayed from them.
+    """
+
+    def __init__(self, bulk_checks_metadata: dict, compliance_frameworks: list):
+        self.bulk_checks_metadata = bulk_checks_metadata
+        self.findings_count = 0
+        self.compliance_tables = {
+            compliance_framework: {
+                "provider": "",
+                "sections": {},
+                "pass_count": 0,
+                "fail_count": 0,
+                "muted_count": 0,
+            }
+            for compliance_framework in compliance_frameworks
+        }
+
+    def extend(self, findings: list):
+        """extend adds the given findings to the counters of every compliance table"""
+        for (check_metadata, status, muted), count in count_findings_by(
+            findings, "check_metadata", "status", "muted"
+        ):
+            check = self.bulk_checks_metadata.get(check_metadata.CheckID)
+            if not check:
+                continue
+            for (
+                compliance_framework,
+                compliance_table,
+            ) in self.compliance_tables.items():
+                add_table_findings, _ = get_compliance_table_functions(
+                    compliance_framework
+                )
+                add_table_findings(
+                    compliance_table,
+                    check,
+                    status,
+                    muted,
+                    count,
+                    compliance_framework,
+                )
+        self.findings_count += len(findings)
+
+
 def display_compliance_table(
-    findings: list,
-    bulk_checks_metadata: dict,
+    compliance_counters: Compliance_Counters,
     compliance_framework: str,
     output_filename: str,
     output_directory: str,
     compliance_overview: bool,
 ):
     try:
-        if "ens_rd2022_aws" == compliance_framework:
-            get_ens_rd2022_aws_table(
-                findings,
-                bulk_checks_metadata,
-                compliance_framework,
-                output_filename,
-                output_directory,
-                compliance_overview,
-            )
-        elif "cis_" in compliance_framework:
-            get_cis_table(
-                findings,
-                bulk_checks_metadata,
-                compliance_framework,
-                output_filename,
-                output_directory,
-                compliance_overview,
-            )
-        elif "mitre_attack" in compliance_framework:
-            get_mitre_attack_table(
-                findings,
-                bulk_checks_metadata,
-                compliance_framework,
-                output_filename,
-                output_directory,
-                compliance_overview,
-            )
-        else:
-            get_generic_compliance_table(
-                findings,
-                bulk_checks_metadata,
-                compliance_framework,
-                output_filename,
-                output_directory,
-                compliance_overview,
-            )
+        _, get_table = get_compliance_table_functions(compliance_framework)
+        get_table(
+            compliance_counters.compliance_tables[compliance_framework],
+            compliance_counters.findings_count,
+            compliance_framework,
+            output_filename,
+            output_directory,
+            compliance_overview,
+        )
     except Exception as error:
         logger.critical(
             f"{error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
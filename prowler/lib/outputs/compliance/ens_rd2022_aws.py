@@ -1,11 +1,9 @@
-from csv import DictWriter
-
 from colorama import Fore, Style
 from tabulate import tabulate
 
 from prowler.config.config import orange_color, timestamp
 from prowler.lib.outputs.compliance.models import Check_Output_CSV_ENS_RD2022
-from prowler.lib.outputs.csv.csv import generate_csv_fields
+from prowler.lib.outputs.csv.csv import generate_csv_fields, get_csv_writer
 from prowler.lib.utils.utils import outputs_unix_timestamp
 
 
@@ -14,11 +12,7 @@ def write_compliance_row_ens_rd2022_aws(
 ):
     compliance_output = "ens_rd2022_aws"
     csv_header = generate_csv_fields(Check_Output_CSV_ENS_RD2022)
-    csv_writer = DictWriter(
-        file_descriptors[compliance_output],
-        fieldnames=csv_header,
-        delimiter=";",
-    )
+    csv_writer = get_csv_writer(file_descriptors[compliance_output], csv_header)
     for requirement in compliance.Requirements:
         requirement_description = requirement.Description
         requirement_id = requirement.Id
@@ -52,15 +46,73 @@ def write_compliance_row_ens_rd2022_aws(
             csv_writer.writerow(compliance_row.__dict__)
 
 
+def add_ens_rd2022_aws_table_findings(
+    compliance_table: dict,
+    check,
+    status: str,
+    muted: bool,
+    findings_count: int,
+    compliance_framework: str,
+):
+    """add_ens_rd2022_aws_table_findings adds to the ENS table counters the given number of findings of the check with the same status"""
+    marcos = compliance_table["sections"]
+    # Each finding is counted once in the totals
+    counted = False
+    for compliance in check.Compliance:
+        if (
+            compliance.Framework == "ENS"
+            and compliance.Provider == "AWS"
+            and compliance.Version == "RD2022"
+        ):
+            compliance_table["provider"] = compliance.Provider
+            for requirement in compliance.Requirements:
+                for attribute in requirement.Attributes:
+                    marco_categoria = f"{attribute.Marco}/{attribute.Categoria}"
+                    # Check if Marco/Categoria exists
+                    if marco_categoria not in marcos:
+                        marcos[marco_categoria] = {
+                            "Estado": f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}",
+                            "Opcional": 0,
+                            "Alto": 0,
+                            "Medio": 0,
+                            "Bajo": 0,
+                            "Muted": 0,
+                        }
+                    if muted:
+                        if not counted:
+                            counted = True
+                            compliance_table["muted_count"] += findings_count
+                            marcos[marco_categoria]["Muted"] += findings_count
+                    else:
+                        if status == "FAIL":
+                            if attribute.Tipo != "recomendacion" and not counted:
+                                counted = True
+                                compliance_table["fail_count"] += findings_count
+                                marcos[marco_categoria][
+                                    "Estado"
+                                ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
+                        elif status == "PASS" and not counted:
+                            counted = True
+                            compliance_table["pass_count"] += findings_count
+                    if attribute.Nivel == "opcional":
+                        marcos[marco_categoria]["Opcional"] += findings_count
+                    elif attribute.Nivel == "alto":
+                        marcos[marco_categoria]["Alto"] += findings_count
+                    elif attribute.Nivel == "medio":
+                        marcos[marco_categoria]["Medio"] += findings_count
+                    elif attribute.Nivel == "bajo":
+                        marcos[marco_categoria]["Bajo"] += findings_count
+
+
 def get_ens_rd2022_aws_table(
-    findings: list,
-    bulk_checks_metadata: dict,
+    compliance_table: dict,
+    findings_count: int,
     compliance_framework: str,
     output_filename: str,
     output_directory: str,
     compliance_overview: bool,
 ):
-    marcos = {}
+    marcos = compliance_table["sections"]
     ens_compliance_table = {
         "Proveedor": [],
         "Marco/Categoria": [],
@@ -71,59 +123,13 @@ def get_ens_rd2022_aws_table(
         "Opcional": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
-    for index, finding in enumerate(findings):
-        check = bulk_checks_metadata[finding.check_metadata.CheckID]
-        check_compliances = check.Compliance
-        for compliance in check_compliances:
-            if (
-                compliance.Framework == "ENS"
-                and compliance.Provider == "AWS"
-                and compliance.Version == "RD2022"
-            ):
-                for requirement in compliance.Requirements:
-                    for attribute in requirement.Attributes:
-                        marco_categoria = f"{attribute.Marco}/{attribute.Categoria}"
-                        # Check if Marco/Categoria exists
-                        if marco_categoria not in marcos:
-                            marcos[marco_categoria] = {
-                                "Estado": f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}",
-                                "Opcional": 0,
-                                "Alto": 0,
-                                "Medio": 0,
-                                "Bajo": 0,
-                                "Muted": 0,
-                            }
-                        if finding.muted:
-                            if index not in muted_count:
-                                muted_count.append(index)
-                                marcos[marco_categoria]["Muted"] += 1
-                        else:
-                            if finding.status == "FAIL":
-                                if (
-                                    attribute.Tipo != "recomendacion"
-                                    and index not in fail_count
-                                ):
-                                    fail_count.append(index)
-                                    marcos[marco_categoria][
-                                        "Estado"
-                                    ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
-                            elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
-                        if attribute.Nivel == "opcional":
-                            marcos[marco_categoria]["Opcional"] += 1
-                        elif attribute.Nivel == "alto":
-                            marcos[marco_categoria]["Alto"] += 1
-                        elif attribute.Nivel == "medio":
-                            marcos[marco_categoria]["Medio"] += 1
-                        elif attribute.Nivel == "bajo":
-                            marcos[marco_categoria]["Bajo"] += 1
+    pass_count = compliance_table["pass_count"]
+    fail_count = compliance_table["fail_count"]
+    muted_count = compliance_table["muted_count"]
 
     # Add results to table
     for marco in sorted(marcos):
-        ens_compliance_table["Proveedor"].append(compliance.Provider)
+        ens_compliance_table["Proveedor"].append(compliance_table["provider"])
         ens_compliance_table["Marco/Categoria"].append(marco)
         ens_compliance_table["Estado"].append(marcos[marco]["Estado"])
         ens_compliance_table["Opcional"].append(
@@ -142,16 +148,16 @@ def get_ens_rd2022_aws_table(
             f"{orange_color}{marcos[marco]['Muted']}{Style.RESET_ALL}"
         )
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nEstado de Cumplimiento de {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL}:"
         )
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / len(findings) * 100, 2)}% ({len(fail_count)}) NO CUMPLE{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / len(findings) * 100, 2)}% ({len(pass_count)}) CUMPLE{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / len(findings) * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / findings_count * 100, 2)}% ({fail_count}) NO CUMPLE{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / findings_count * 100, 2)}% ({pass_count}) CUMPLE{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
@@ -1,11 +1,9 @@
-from csv import DictWriter
-
 from colorama import Fore, Style
 from tabulate import tabulate
 
 from prowler.config.config import orange_color, timestamp
 from prowler.lib.outputs.compliance.models import Check_Output_CSV_Generic_Compliance
-from prowler.lib.outputs.csv.csv import generate_csv_fields
+from prowler.lib.outputs.csv.csv import generate_csv_fields, get_csv_writer
 from prowler.lib.utils.utils import outputs_unix_timestamp
 
 
@@ -20,11 +18,7 @@ def write_compliance_row_generic(
 
     compliance_output = compliance_output.lower().replace("-", "_")
     csv_header = generate_csv_fields(Check_Output_CSV_Generic_Compliance)
-    csv_writer = DictWriter(
-        file_descriptors[compliance_output],
-        fieldnames=csv_header,
-        delimiter=";",
-    )
+    csv_writer = get_csv_writer(file_descriptors[compliance_output], csv_header)
     for requirement in compliance.Requirements:
         requirement_description = requirement.Description
         requirement_id = requirement.Id
@@ -53,48 +47,53 @@ def write_compliance_row_generic(
             csv_writer.writerow(compliance_row.__dict__)
 
 
+def add_generic_compliance_table_findings(
+    compliance_table: dict,
+    check,
+    status: str,
+    muted: bool,
+    findings_count: int,
+    compliance_framework: str,
+):
+    """add_generic_compliance_table_findings adds to the compliance table counters the given number of findings of the check with the same status"""
+    for compliance in check.Compliance:
+        if (
+            compliance.Framework.upper()
+            in compliance_framework.upper().replace("_", "-")
+            and compliance.Version in compliance_framework.upper()
+            and compliance.Provider in compliance_framework.upper()
+        ):
+            # Each finding is counted once if the framework has attributes for the check
+            if any(requirement.Attributes for requirement in compliance.Requirements):
+                if muted:
+                    compliance_table["muted_count"] += findings_count
+                elif status in ("FAIL", "PASS"):
+                    compliance_table[f"{status.lower()}_count"] += findings_count
+                return
+
+
 def get_generic_compliance_table(
-    findings: list,
-    bulk_checks_metadata: dict,
+    compliance_table: dict,
+    findings_count: int,
     compliance_framework: str,
     output_filename: str,
     output_directory: str,
     compliance_overview: bool,
 ):
-    pass_count = []
-    fail_count = []
-    muted_count = []
-    for index, finding in enumerate(findings):
-        check = bulk_checks_metadata[finding.check_metadata.CheckID]
-        check_compliances = check.Compliance
-        for compliance in check_compliances:
-            if (
-                compliance.Framework.upper()
-                in compliance_framework.upper().replace("_", "-")
-                and compliance.Version in compliance_framework.upper()
-                and compliance.Provider in compliance_framework.upper()
-            ):
-                for requirement in compliance.Requirements:
-                    for attribute in requirement.Attributes:
-                        if finding.muted:
-                            if index not in muted_count:
-                                muted_count.append(index)
-                        else:
-                            if finding.status == "FAIL" and index not in fail_count:
-                                fail_count.append(index)
-                            elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
+    pass_count = compliance_table["pass_count"]
+    fail_count = compliance_table["fail_count"]
+    muted_count = compliance_table["muted_count"]
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nCompliance Status of {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Framework:"
         )
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / len(findings) * 100, 2)}% ({len(fail_count)}) FAIL{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / len(findings) * 100, 2)}% ({len(pass_count)}) PASS{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / len(findings) * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / findings_count * 100, 2)}% ({fail_count}) FAIL{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / findings_count * 100, 2)}% ({pass_count}) PASS{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
@@ -1,8 +1,6 @@
-from csv import DictWriter
-
 from prowler.config.config import timestamp
 from prowler.lib.outputs.compliance.models import Check_Output_CSV_AWS_ISO27001_2013
-from prowler.lib.outputs.csv.csv import generate_csv_fields
+from prowler.lib.outputs.csv.csv import generate_csv_fields, get_csv_writer
 from prowler.lib.utils.utils import outputs_unix_timestamp
 
 
@@ -17,11 +15,7 @@ def write_compliance_row_iso27001_2013_aws(
 
     compliance_output = compliance_output.lower().replace("-", "_")
     csv_header = generate_csv_fields(Check_Output_CSV_AWS_ISO27001_2013)
-    csv_writer = DictWriter(
-        file_descriptors[compliance_output],
-        fieldnames=csv_header,
-        delimiter=";",
-    )
+    csv_writer = get_csv_writer(file_descriptors[compliance_output], csv_header)
     for requirement in compliance.Requirements:
         requirement_description = requirement.Description
         requirement_id = requirement.Id
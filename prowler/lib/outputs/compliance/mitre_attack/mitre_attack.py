@@ -1,4 +1,3 @@
-from csv import DictWriter
 from importlib import import_module
 
 from colorama import Fore, Style
@@ -6,7 +5,7 @@ from tabulate import tabulate
 
 from prowler.config.config import orange_color, timestamp
 from prowler.lib.logger import logger
-from prowler.lib.outputs.csv.csv import generate_csv_fields
+from prowler.lib.outputs.csv.csv import generate_csv_fields, get_csv_writer
 from prowler.lib.outputs.utils import unroll_list
 from prowler.lib.utils.utils import outputs_unix_timestamp
 
@@ -24,11 +23,7 @@ def write_compliance_row_mitre_attack(file_descriptors, finding, compliance, pro
         mitre_attack_model = getattr(module, mitre_attack_model_name)
         compliance_output = compliance_output.lower().replace("-", "_")
         csv_header = generate_csv_fields(mitre_attack_model)
-        csv_writer = DictWriter(
-            file_descriptors[compliance_output],
-            fieldnames=csv_header,
-            delimiter=";",
-        )
+        csv_writer = get_csv_writer(file_descriptors[compliance_output], csv_header)
         for requirement in compliance.Requirements:
 
             if compliance.Provider == "AWS":
@@ -98,53 +93,61 @@ def write_compliance_row_mitre_attack(file_descriptors, finding, compliance, pro
         )
 
 
+def add_mitre_attack_table_findings(
+    compliance_table: dict,
+    check,
+    status: str,
+    muted: bool,
+    findings_count: int,
+    compliance_framework: str,
+):
+    """add_mitre_attack_table_findings adds to the MITRE ATT&CK table counters the given number of findings of the check with the same status"""
+    tactics = compliance_table["sections"]
+    # Each finding is counted once in the totals
+    counted = False
+    for compliance in check.Compliance:
+        if (
+            "MITRE-ATTACK" in compliance.Framework
+            and compliance.Version in compliance_framework
+        ):
+            compliance_table["provider"] = compliance.Provider
+            for requirement in compliance.Requirements:
+                for tactic in requirement.Tactics:
+                    if tactic not in tactics:
+                        tactics[tactic] = {"FAIL": 0, "PASS": 0, "Muted": 0}
+                    if muted:
+                        if not counted:
+                            counted = True
+                            compliance_table["muted_count"] += findings_count
+                            tactics[tactic]["Muted"] += findings_count
+                    elif status in ("FAIL", "PASS") and not counted:
+                        counted = True
+                        compliance_table[f"{status.lower()}_count"] += findings_count
+                        tactics[tactic][status] += findings_count
+
+
 def get_mitre_attack_table(
-    findings: list,
-    bulk_checks_metadata: dict,
+    compliance_table: dict,
+    findings_count: int,
     compliance_framework: str,
     output_filename: str,
     output_directory: str,
     compliance_overview: bool,
 ):
-    tactics = {}
+    tactics = compliance_table["sections"]
     mitre_compliance_table = {
         "Provider": [],
         "Tactic": [],
         "Status": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
-    for index, finding in enumerate(findings):
-        check = bulk_checks_metadata[finding.check_metadata.CheckID]
-        check_compliances = check.Compliance
-        for compliance in check_compliances:
-            if (
-                "MITRE-ATTACK" in compliance.Framework
-                and compliance.Version in compliance_framework
-            ):
-                for requirement in compliance.Requirements:
-                    for tactic in requirement.Tactics:
-                        if tactic not in tactics:
-                            tactics[tactic] = {"FAIL": 0, "PASS": 0, "Muted": 0}
-                        if finding.muted:
-                            if index not in muted_count:
-                                muted_count.append(index)
-                                tactics[tactic]["Muted"] += 1
-                        else:
-                            if finding.status == "FAIL":
-                                if index not in fail_count:
-                                    fail_count.append(index)
-                                    tactics[tactic]["FAIL"] += 1
-                            elif finding.status == "PASS":
-                                if index not in pass_count:
-                                    pass_count.append(index)
-                                    tactics[tactic]["PASS"] += 1
+    pass_count = compliance_table["pass_count"]
+    fail_count = compliance_table["fail_count"]
+    muted_count = compliance_table["muted_count"]
     # Add results to table
     tactics = dict(sorted(tactics.items()))
     for tactic in tactics:
-        mitre_compliance_table["Provider"].append(compliance.Provider)
+        mitre_compliance_table["Provider"].append(compliance_table["provider"])
         mitre_compliance_table["Tactic"].append(tactic)
         if tactics[tactic]["FAIL"] > 0:
             mitre_compliance_table["Status"].append(
@@ -158,16 +161,16 @@ def get_mitre_attack_table(
             f"{orange_color}{tactics[tactic]['Muted']}{Style.RESET_ALL}"
         )
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nCompliance Status of {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Framework:"
         )
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / len(findings) * 100, 2)}% ({len(fail_count)}) FAIL{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / len(findings) * 100, 2)}% ({len(pass_count)}) PASS{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / len(findings) * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / findings_count * 100, 2)}% ({fail_count}) FAIL{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / findings_count * 100, 2)}% ({pass_count}) PASS{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
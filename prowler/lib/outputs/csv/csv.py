@@ -1,18 +1,28 @@
 from csv import DictWriter
+from functools import lru_cache
+from io import TextIOWrapper
 from typing import Any
 
+# DictWriter of each output file, created once while the file is open
+csv_writers = {}
+
+
+def get_csv_writer(file_descriptor: TextIOWrapper, fieldnames: list) -> DictWriter:
+    """get_csv_writer returns the DictWriter of the output file, created only once per file and fields until the file is closed with close_file_descriptors"""
+    csv_writer = csv_writers.get(file_descriptor)
+    if csv_writer is None or csv_writer.fieldnames != fieldnames:
+        csv_writer = DictWriter(file_descriptor, fieldnames=fieldnames, delimiter=";")
+        csv_writers[file_descriptor] = csv_writer
+    return csv_writer
+
 
 def write_csv(file_descriptor, headers, row):
-    csv_writer = DictWriter(
-        file_descriptor,
-        fieldnames=headers,
-        delimiter=";",
-    )
-    csv_writer.writerow(row.__dict__)
+    get_csv_writer(file_descriptor, headers).writerow(row.__dict__)
 
 
+@lru_cache(maxsize=None)
 def generate_csv_fields(format: Any) -> list[str]:
-    """Generates the CSV headers for the given class"""
+    """Generates the CSV headers for the given class. They are computed once per class, so the returned list must not be modified"""
     csv_fields = []
     # __fields__ is always available in the Pydantic's BaseModel class
     for field in format.__dict__.get("__fields__").keys():
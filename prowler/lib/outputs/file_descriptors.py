@@ -24,7 +24,7 @@ from prowler.lib.outputs.compliance.models import (
     Check_Output_CSV_Generic_Compliance,
     Check_Output_CSV_KUBERNETES_CIS,
 )
-from prowler.lib.outputs.csv.csv import generate_csv_fields
+from prowler.lib.outputs.csv.csv import csv_writers, generate_csv_fields
 from prowler.lib.utils.utils import file_exists, open_file
 
 
@@ -207,3 +207,16 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, provi
         )
 
     return file_descriptors
+
+
+def close_file_descriptors(file_descriptors: dict):
+    """close_file_descriptors flushes and closes all the output files opened during the scan"""
+    for output_mode in list(file_descriptors):
+        try:
+            file_descriptor = file_descriptors.pop(output_mode)
+            csv_writers.pop(file_descriptor, None)
+            file_descriptor.close()
+        except Exception as error:
+            logger.error(
+                f"{output_mode} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
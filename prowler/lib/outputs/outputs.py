@@ -1,9 +1,9 @@
 import json
-from csv import DictWriter
 
 from colorama import Fore, Style
 
 from prowler.config.config import available_compliance_frameworks, orange_color
+from prowler.lib.check.models import Findings_Counter, count_findings_by
 from prowler.lib.logger import logger
 from prowler.lib.outputs.common import (
     fill_common_finding_data,
@@ -16,7 +16,7 @@ from prowler.lib.outputs.compliance.compliance import (
     fill_compliance,
     get_check_compliance,
 )
-from prowler.lib.outputs.csv.csv import generate_csv_fields
+from prowler.lib.outputs.csv.csv import generate_csv_fields, get_csv_writer
 from prowler.lib.outputs.file_descriptors import fill_file_descriptors
 from prowler.lib.outputs.json_asff.json_asff import fill_json_asff
 from prowler.lib.outputs.json_ocsf.json_ocsf import fill_json_ocsf
@@ -45,6 +45,12 @@ def stdout_report(finding, color, verbose, status, fix):
 
 
 def report(check_findings, provider):
+    """
+    report prints the findings of a check and writes them to the output files
+
+    The output files are opened by the first report and kept in provider.output_options.file_descriptors,
+    so they must be closed with close_file_descriptors once all the findings are reported.
+    """
     try:
         output_options = provider.output_options
         file_descriptors = {}
@@ -58,13 +64,30 @@ def report(check_findings, provider):
 
             # Generate the required output files
             if output_options.output_modes and not output_options.fixer:
-                # We have to create the required output files
-                file_descriptors = fill_file_descriptors(
-                    output_options.output_modes,
-                    output_options.output_directory,
-                    output_options.output_filename,
-                    provider,
+                # The output files are created once and kept open during the whole scan,
+                # the caller must close them with close_file_descriptors, as execute_checks does
+                if not output_options.file_descriptors:
+                    output_options.file_descriptors = fill_file_descriptors(
+                        output_options.output_modes,
+                        output_options.output_directory,
+                        output_options.output_filename,
+                        provider,
+                    )
+                file_descriptors = output_options.file_descriptors
+
+            if file_descriptors:
+                input_compliance_frameworks = list(
+                    set(output_options.output_modes).intersection(
+                        available_compliance_frameworks
+                    )
                 )
+                # Common Output Data
+                provider_data_mapping = get_provider_data_mapping(provider)
+                csv_writer = None
+                if "csv" in file_descriptors:
+                    csv_writer = get_csv_writer(
+                        file_descriptors["csv"], generate_csv_fields(FindingOutput)
+                    )
 
             for finding in check_findings:
                 # Print findings by stdout
@@ -83,11 +106,6 @@ def report(check_findings, provider):
                         not output_options.status
                         or finding.status in output_options.status
                     ):
-                        input_compliance_frameworks = list(
-                            set(output_options.output_modes).intersection(
-                                available_compliance_frameworks
-                            )
-                        )
                         fill_compliance(
                             output_options,
                             finding,
@@ -117,7 +135,6 @@ def report(check_findings, provider):
                                 file_descriptors["json-asff"].write(",")
 
                         # Common Output Data
-                        provider_data_mapping = get_provider_data_mapping(provider)
                         common_finding_data = fill_common_finding_data(
                             finding, output_options.unix_timestamp
                         )
@@ -140,19 +157,13 @@ def report(check_findings, provider):
                             file_descriptors["json-ocsf"].write(",")
 
                         # CSV
-                        if "csv" in file_descriptors:
+                        if csv_writer:
                             finding_output.compliance = unroll_dict(
                                 finding_output.compliance
                             )
                             finding_output.account_tags = unroll_list(
                                 finding_output.account_tags, ","
                             )
-                            csv_writer = DictWriter(
-                                file_descriptors["csv"],
-                                fieldnames=generate_csv_fields(FindingOutput),
-                                delimiter=";",
-                            )
-
                             csv_writer.writerow(finding_output.dict())
 
         else:  # No service resources in the whole account
@@ -162,10 +173,6 @@ def report(check_findings, provider):
         # Separator between findings and bar
         if output_options.verbose:
             print()
-        if file_descriptors:
-            # Close all file descriptors
-            for file_descriptor in file_descriptors:
-                file_descriptors.get(file_descriptor).close()
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -206,21 +213,26 @@ def extract_findings_statistics(findings: list) -> dict:
     findings_count = 0
     all_fails_are_muted = True
 
-    for finding in findings:
-        # Save the resource_id
-        resources.add(finding.resource_id)
-        if finding.status == "PASS":
-            total_pass += 1
-            findings_count += 1
-        if finding.status == "FAIL":
-            total_fail += 1
-            findings_count += 1
-            if not finding.muted and all_fails_are_muted:
+    # Save the resource_id
+    if isinstance(findings, Findings_Counter):
+        resources_count = findings.count_resources()
+    else:
+        for (resource_id,), _ in count_findings_by(findings, "resource_id"):
+            resources.add(resource_id)
+        resources_count = len(resources)
+    for (status, muted), count in count_findings_by(findings, "status", "muted"):
+        if status == "PASS":
+            total_pass += count
+            findings_count += count
+        if status == "FAIL":
+            total_fail += count
+            findings_count += count
+            if not muted and all_fails_are_muted:
                 all_fails_are_muted = False
 
     stats["total_pass"] = total_pass
     stats["total_fail"] = total_fail
-    stats["resources_count"] = len(resources)
+    stats["resources_count"] = resources_count
     stats["findings_count"] = findings_count
     stats["all_fails_are_muted"] = all_fails_are_muted
 
@@ -9,6 +9,7 @@ from prowler.config.config import (
     json_ocsf_file_suffix,
     orange_color,
 )
+from prowler.lib.check.models import count_findings_by
 from prowler.lib.logger import logger
 
 
@@ -40,8 +41,14 @@ def display_summary_table(
             entity_type = "Context"
             audited_entities = provider.identity.context
 
+        # Group the findings by check, keeping the order of the services
+        findings_counts = count_findings_by(
+            findings, "check_metadata", "status", "muted"
+        )
         # Check if there are findings and that they are not all MANUAL
-        if findings and not all(finding.status == "MANUAL" for finding in findings):
+        if findings_counts and not all(
+            status == "MANUAL" for (_, status, _), _ in findings_counts
+        ):
             current = {
                 "Service": "",
                 "Provider": "",
@@ -64,10 +71,10 @@ def display_summary_table(
                 "Muted": [],
             }
             pass_count = fail_count = muted_count = 0
-            for finding in findings:
+            for (check_metadata, status, muted), count in findings_counts:
                 # If new service and not first, add previous row
                 if (
-                    current["Service"] != finding.check_metadata.ServiceName
+                    current["Service"] != check_metadata.ServiceName
                     and current["Service"]
                 ):
                     add_service_to_table(findings_table, current)
@@ -76,26 +83,26 @@ def display_summary_table(
                         "Critical"
                     ] = current["High"] = current["Medium"] = current["Low"] = 0
 
-                current["Service"] = finding.check_metadata.ServiceName
-                current["Provider"] = finding.check_metadata.Provider
-
-                current["Total"] += 1
-                if finding.muted:
-                    muted_count += 1
-                    current["Muted"] += 1
-                if finding.status == "PASS":
-                    pass_count += 1
-                    current["Pass"] += 1
-                elif finding.status == "FAIL":
-                    fail_count += 1
-                    if finding.check_metadata.Severity == "critical":
-                        current["Critical"] += 1
-                    elif finding.check_metadata.Severity == "high":
-                        current["High"] += 1
-                    elif finding.check_metadata.Severity == "medium":
-                        current["Medium"] += 1
-                    elif finding.check_metadata.Severity == "low":
-                        current["Low"] += 1
+                current["Service"] = check_metadata.ServiceName
+                current["Provider"] = check_metadata.Provider
+
+                current["Total"] += count
+                if muted:
+                    muted_count += count
+                    current["Muted"] += count
+                if status == "PASS":
+                    pass_count += count
+                    current["Pass"] += count
+                elif status == "FAIL":
+                    fail_count += count
+                    if check_metadata.Severity == "critical":
+                        current["Critical"] += count
+                    elif check_metadata.Severity == "high":
+                        current["High"] += count
+                    elif check_metadata.Severity == "medium":
+                        current["Medium"] += count
+                    elif check_metadata.Severity == "low":
+                        current["Low"] += count
 
             # Add final service
 
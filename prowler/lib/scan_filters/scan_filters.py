@@ -1,6 +1,45 @@
+import re
+
 from prowler.lib.logger import logger
 
 
+class Audit_Resources(list):
+    """
+    List of the resources to audit with a precomputed index to check in O(1) if a resource is filtered.
+
+    The index is built once from the input resources and contains, for each of them:
+        - The resource itself, to match the exact ARN.
+        - The prefixes of the ARN ending before a ":" or "/" of its resource part, to match the ARNs without version or revision (e.g. ECS task definitions).
+        - The last segment of the ARN resource part, to match the resources identified by its name or id (e.g. S3 buckets or WAF Web ACLs).
+
+    The other segments, like the resource type or path (e.g. "role"), are not indexed so they do not match unrelated resources.
+    """
+
+    def __init__(self, audit_resources: list):
+        super().__init__(audit_resources)
+        self._index = set()
+        for audit_resource in self:
+            self._index.update(__get_audit_resource_keys__(audit_resource))
+
+    def is_filtered(self, resource: str) -> bool:
+        return resource in self._index
+
+
+def __get_audit_resource_keys__(audit_resource: str) -> set:
+    """Returns the keys of the Audit_Resources index for the given resource"""
+    keys = {audit_resource}
+    arn_parts = audit_resource.split(":", 5)
+    if len(arn_parts) == 6:
+        arn_prefix = ":".join(arn_parts[:5]) + ":"
+        resource_part = arn_parts[5]
+        for position, character in enumerate(resource_part):
+            if character in ":/":
+                keys.add(arn_prefix + resource_part[:position])
+        keys.add(re.split(r"[:/]", resource_part)[-1])
+    keys.discard("")
+    return keys
+
+
 def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     """
     Check if the resource passed as argument is present in the audit_resources.
@@ -8,6 +47,8 @@ def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     Returns True if it is filtered and False if it does not match the input filters
     """
     try:
+        if isinstance(audit_resources, Audit_Resources):
+            return audit_resources.is_filtered(resource)
         if resource in str(audit_resources):
             return True
         return False
@@ -9,18 +9,27 @@ except ImportError:
 
 import re
 import sys
-import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from hashlib import sha512
-from io import TextIOWrapper
+from importlib import import_module
+from io import StringIO, TextIOWrapper
 from ipaddress import ip_address
+from itertools import repeat
+from locale import getpreferredencoding
+from multiprocessing import get_context
 from os.path import exists
 from time import mktime
 from typing import Optional
 
 from colorama import Style
 from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
+from detect_secrets.core.plugins.util import get_mapping_from_secret_type_to_class
+from detect_secrets.settings import Settings
+from detect_secrets.transformers import get_transformed_file
+from detect_secrets.util.code_snippet import get_code_snippet
+from detect_secrets.util.inject import get_injectable_variables
 
 from prowler.lib.logger import logger
 
@@ -79,23 +88,161 @@ def hash_sha512(string: str) -> str:
     return sha512(string.encode("utf-8")).hexdigest()[0:9]
 
 
-def detect_secrets_scan(data):
-    temp_data_file = tempfile.NamedTemporaryFile(delete=False)
-    temp_data_file.write(bytes(data, encoding="raw_unicode_escape"))
-    temp_data_file.close()
+# Total size of the data to scan for secrets from which it is scanned in several processes
+DETECT_SECRETS_PROCESSES_THRESHOLD = 1024 * 1024
 
+
+@lru_cache(maxsize=None)
+def get_detect_secrets_plugins() -> tuple:
+    """get_detect_secrets_plugins returns all the detect-secrets plugins with their default configuration, like detect-secrets default_settings"""
+    return tuple(
+        plugin_type()
+        for plugin_type in get_mapping_from_secret_type_to_class().values()
+    )
+
+
+@lru_cache(maxsize=None)
+def get_detect_secrets_filters() -> tuple:
+    """get_detect_secrets_filters returns the detect-secrets default filters with their parameters, without changing the global detect-secrets settings"""
+    filters = []
+    for filter_path in Settings().filters:
+        # The data is scanned in memory, so there is no file to validate
+        if filter_path == "detect_secrets.filters.common.is_invalid_file":
+            continue
+        module_path, function_name = filter_path.rsplit(".", 1)
+        filter_function = getattr(import_module(module_path), function_name)
+        filters.append(
+            (filter_function, set(get_injectable_variables(filter_function)))
+        )
+    return tuple(filters)
+
+
+def detect_secrets_scan(data: str, filename: str = "data") -> Optional[list]:
+    """
+    detect_secrets_scan scans the data for secrets, as if it was the content of the given file, and returns the secrets found or None.
+
+    The filename is used to parse the data by its file type (e.g. YAML) and to filter the files that are not scanned, like detect-secrets does.
+    """
+    return detect_secrets_scan_bulk([data], filename)[0]
+
+
+def detect_secrets_scan_bulk(data_list: list, filename: str = "data") -> list:
+    """
+    detect_secrets_scan_bulk returns the output of detect_secrets_scan for every data in the list.
+
+    When there is more than DETECT_SECRETS_PROCESSES_THRESHOLD to scan it is scanned in a process per CPU.
+    """
+    processes = min(os.cpu_count() or 1, len(data_list))
+    if (
+        processes > 1
+        and sum(len(data) for data in data_list) > DETECT_SECRETS_PROCESSES_THRESHOLD
+    ):
+        try:
+            chunk_size = max(1, len(data_list) // (processes * 4))
+            # Spawn the processes since the checks can be executed in several threads
+            with ProcessPoolExecutor(
+                max_workers=processes, mp_context=get_context("spawn")
+            ) as executor:
+                return [
+                    detect_secrets_output
+                    for chunk_output in executor.map(
+                        __scan_secrets__,
+                        [
+                            data_list[index : index + chunk_size]
+                            for index in range(0, len(data_list), chunk_size)
+                        ],
+                        repeat(filename),
+                    )
+                    for detect_secrets_output in chunk_output
+                ]
+        except Exception as error:
+            logger.warning(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+    return __scan_secrets__(data_list, filename)
+
+
+def __scan_secrets__(data_list: list, filename: str) -> list:
+    """__scan_secrets__ returns the secrets found in each data or None"""
+    return [__scan_data_secrets__(data, filename) for data in data_list]
+
+
+def __scan_data_secrets__(data: str, filename: str) -> Optional[list]:
+    """__scan_data_secrets__ scans the data in memory like detect-secrets scans a file with the data encoded with raw_unicode_escape"""
+    if __is_filtered_out__({"filename"}, filename=filename):
+        return None
+    try:
+        data = data.encode("raw_unicode_escape").decode(getpreferredencoding(False))
+    except UnicodeDecodeError:
+        # detect-secrets ignores the binary files
+        return None
+    # Read the lines like a file opened in text mode
+    data_file = StringIO(data, newline=None)
+    data_file.name = filename
     secrets = SecretsCollection()
-    with default_settings():
-        secrets.scan_file(temp_data_file.name)
-    os.remove(temp_data_file.name)
+    # The data is parsed first by its file type and then with the eager transformers only if no secret was found
+    for use_eager_transformers in (False, True):
+        lines = get_transformed_file(data_file, use_eager_transformers)
+        if not lines:
+            if use_eager_transformers:
+                break
+            lines = data_file.readlines()
+        for secret in __scan_lines_secrets__(lines, filename):
+            secrets[filename].add(secret)
+        if secrets[filename]:
+            break
+        data_file.seek(0)
 
     detect_secrets_output = secrets.json()
     if detect_secrets_output:
-        return detect_secrets_output[temp_data_file.name]
+        return detect_secrets_output[filename]
     else:
         return None
 
 
+def __scan_lines_secrets__(lines: list, filename: str):
+    """__scan_lines_secrets__ yields the secrets found in the lines by the detect-secrets plugins that are not filtered out"""
+    for line_number, line in enumerate(lines, start=1):
+        context = get_code_snippet(lines=lines, line_number=line_number)
+        line = line.rstrip()
+        if __is_filtered_out__({"line"}, filename=filename, line=line, context=context):
+            continue
+        for plugin in get_detect_secrets_plugins():
+            for secret in plugin.analyze_line(
+                filename=filename,
+                line=line,
+                line_number=line_number,
+                context=context,
+            ):
+                if not __is_filtered_out__(
+                    {"secret"},
+                    filename=filename,
+                    secret=secret.secret_value,
+                    plugin=plugin,
+                    line=line,
+                ) and not __is_filtered_out__(
+                    {"context"},
+                    filename=filename,
+                    secret=secret.secret_value,
+                    plugin=plugin,
+                    line=line,
+                    context=context,
+                ):
+                    yield secret
+
+
+def __is_filtered_out__(required_parameters: set, **kwargs) -> bool:
+    """__is_filtered_out__ returns True if any detect-secrets filter with the required parameters filters out the given values"""
+    for filter_function, filter_parameters in get_detect_secrets_filters():
+        if required_parameters <= filter_parameters:
+            # Skip the filters that need other parameters
+            if filter_parameters <= kwargs.keys() and filter_function(
+                **{parameter: kwargs[parameter] for parameter in filter_parameters}
+            ):
+                return True
+    return False
+
+
 def validate_ip_address(ip_string):
     """validate_ip_address return True if the IP is valid, otherwise returns False."""
     try:
@@ -2,7 +2,10 @@ import os
 import pathlib
 import sys
 from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from threading import Lock, local
 
 from boto3 import client, session
 from boto3.session import Session
@@ -20,9 +23,11 @@ from prowler.config.config import (
 )
 from prowler.lib.check.check import list_modules, recover_checks_from_service
 from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import Audit_Resources
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.aws.config import (
     AWS_STS_GLOBAL_ENDPOINT_REGION,
+    BOTO3_MAX_POOL_CONNECTIONS,
     BOTO3_USER_AGENT_EXTRA,
     ROLE_SESSION_NAME,
 )
@@ -46,6 +51,13 @@ from prowler.providers.aws.models import (
 from prowler.providers.common.models import Audit_Metadata
 from prowler.providers.common.provider import Provider
 
+# Set in the threads of the AWS thread pool, so the calls made from them are not submitted to the same pool
+aws_thread_pool_worker = local()
+
+
+def __set_aws_thread_pool_worker__():
+    aws_thread_pool_worker.is_worker = True
+
 
 class AwsProvider(Provider):
     _type: str = "aws"
@@ -65,6 +77,7 @@ class AwsProvider(Provider):
         ######## Parse Arguments
         # Session
         aws_retries_max_attempts = getattr(arguments, "aws_retries_max_attempts", None)
+        aws_max_pool_connections = getattr(arguments, "aws_max_pool_connections", None)
 
         # Assume Role
         input_role = getattr(arguments, "role", None)
@@ -87,13 +100,23 @@ class AwsProvider(Provider):
 
         # Configure the initial AWS Session using the local credentials: profile or environment variables
         aws_session = self.setup_session(input_mfa, input_profile, input_role)
-        session_config = self.set_session_config(aws_retries_max_attempts)
+        session_config = self.set_session_config(
+            aws_retries_max_attempts, aws_max_pool_connections
+        )
         # Current session and the original session points to the same session object until we get a new one, if needed
         self._session = AWSSession(
             current_session=aws_session,
             session_config=session_config,
             original_session=aws_session,
         )
+
+        # Clients and thread pool shared by all the AWS services, the thread pool is sized as the clients' connection pool
+        self._clients = {}
+        self._clients_lock = Lock()
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=session_config.max_pool_connections,
+            initializer=__set_aws_thread_pool_worker__,
+        )
         ########
 
         ######## Validate AWS credentials
@@ -215,11 +238,13 @@ class AwsProvider(Provider):
 
         # Parse Scan Tags
         if getattr(arguments, "resource_tags", None):
-            self._audit_resources = self.get_tagged_resources(arguments.resource_tags)
+            self._audit_resources = Audit_Resources(
+                self.get_tagged_resources(arguments.resource_tags)
+            )
 
         # Parse Input Resource ARNs
         if getattr(arguments, "resource_arn", None):
-            self._audit_resources = arguments.resource_arn
+            self._audit_resources = Audit_Resources(arguments.resource_arn)
 
         # Get Enabled Regions
         self._enabled_regions = self.get_aws_enabled_regions(
@@ -262,6 +287,10 @@ class AwsProvider(Provider):
     def audit_resources(self):
         return self._audit_resources
 
+    @property
+    def thread_pool(self):
+        return self._thread_pool
+
     @property
     def scan_unused_services(self):
         return self._scan_unused_services
@@ -559,11 +588,7 @@ class AwsProvider(Provider):
                 enabled_regions = service_regions
 
             for region in enabled_regions:
-                regional_client = self._session.current_session.client(
-                    service, region_name=region, config=self._session.session_config
-                )
-                regional_client.region = region
-                regional_clients[region] = regional_client
+                regional_clients[region] = self.get_client(service, region)
 
             return regional_clients
         except Exception as error:
@@ -571,10 +596,30 @@ class AwsProvider(Provider):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def get_client(self, service: str, region: str):
+        """get_client returns the boto3 client for the given service and region of the current session.
+
+        The clients are created once and shared by all the AWS services, so the connections are reused across them.
+        """
+        client_key = (service, region, self._session.current_session)
+        regional_client = self._clients.get(client_key)
+        if regional_client is None:
+            # boto3 sessions are not thread safe, so the clients are created one at a time
+            with self._clients_lock:
+                regional_client = self._clients.get(client_key)
+                if regional_client is None:
+                    regional_client = self._session.current_session.client(
+                        service,
+                        region_name=region,
+                        config=self._session.session_config,
+                    )
+                    regional_client.region = region
+                    self._clients[client_key] = regional_client
+        return regional_client
+
     def get_available_aws_service_regions(self, service: str) -> set:
-        data = read_aws_regions_file()
         json_regions = set(
-            data["services"][service]["regions"][self._identity.partition]
+            get_aws_regions_by_service()[(service, self._identity.partition)]
         )
         if self._identity.audited_regions:
             # Get common regions between input and json
@@ -741,14 +786,17 @@ class AwsProvider(Provider):
         mfa_TOTP = input("Enter MFA code: ")
         return AWSMFAInfo(arn=mfa_ARN, totp=mfa_TOTP)
 
-    def set_session_config(self, aws_retries_max_attempts: int) -> Config:
+    def set_session_config(
+        self, aws_retries_max_attempts: int, aws_max_pool_connections: int = None
+    ) -> Config:
         """
-        set_session_config returns a botocore Config object with the Prowler user agent and the default retrier configuration if nothing is passed as argument
+        set_session_config returns a botocore Config object with the Prowler user agent and the default retrier and connection pool configuration if nothing is passed as argument
         """
         # Set the maximum retries for the standard retrier config
         default_session_config = Config(
             retries={"max_attempts": 3, "mode": "standard"},
             user_agent_extra=BOTO3_USER_AGENT_EXTRA,
+            max_pool_connections=aws_max_pool_connections or BOTO3_MAX_POOL_CONNECTIONS,
         )
         if aws_retries_max_attempts:
             # Create the new config
@@ -875,6 +923,23 @@ def read_aws_regions_file() -> dict:
     return data
 
 
+@lru_cache(maxsize=None)
+def get_aws_regions_by_service() -> dict:
+    """
+    Loads the AWS services JSON file once and indexes its regions by service and partition.
+
+    Returns:
+        dict: A dictionary with the frozenset of regions for each (service, partition) tuple.
+    """
+    data = read_aws_regions_file()
+
+    return {
+        (service, partition): frozenset(regions)
+        for service, service_data in data["services"].items()
+        for partition, regions in service_data["regions"].items()
+    }
+
+
 def get_aws_available_regions() -> set:
     """
     Get the available AWS regions from the AWS services JSON file.
@@ -883,13 +948,9 @@ def get_aws_available_regions() -> set:
         set: A set of available AWS regions.
     """
     try:
-        data = read_aws_regions_file()
-
         regions = set()
-        for service in data["services"].values():
-            for partition in service["regions"]:
-                for item in service["regions"][partition]:
-                    regions.add(item)
+        for service_regions in get_aws_regions_by_service().values():
+            regions.update(service_regions)
         return regions
     except Exception as error:
         logger.error(f"{error.__class__.__name__}: {error}")
@@ -1,3 +1,4 @@
 AWS_STS_GLOBAL_ENDPOINT_REGION = "us-east-1"
 BOTO3_USER_AGENT_EXTRA = "APN_1826889"
+BOTO3_MAX_POOL_CONNECTIONS = 10
 ROLE_SESSION_NAME = "ProwlerAssessmentSession"
@@ -4,6 +4,7 @@ from re import fullmatch, search
 from prowler.providers.aws.aws_provider import get_aws_available_regions
 from prowler.providers.aws.config import ROLE_SESSION_NAME
 from prowler.providers.aws.lib.arn.arn import arn_type
+from prowler.providers.aws.lib.security_hub.security_hub import SECURITY_HUB_CACHE_TTL
 
 
 def init_parser(self):
@@ -92,6 +93,12 @@ def init_parser(self):
         action="store_true",
         help="Send only Prowler failed findings to SecurityHub",
     )
+    aws_security_hub_subparser.add_argument(
+        "--security-hub-cache-ttl",
+        type=int,
+        default=SECURITY_HUB_CACHE_TTL,
+        help=f"Seconds the AWS Security Hub regions where the Prowler integration is enabled are cached, 0 to verify them in every execution (Default: {SECURITY_HUB_CACHE_TTL})",
+    )
     # AWS Quick Inventory
     aws_quick_inventory_subparser = aws_parser.add_argument_group("Quick Inventory")
     aws_quick_inventory_subparser.add_argument(
@@ -148,6 +155,13 @@ def init_parser(self):
         type=int,
         help="Set the maximum attemps for the Boto3 standard retrier config (Default: 3)",
     )
+    boto3_config_subparser.add_argument(
+        "--aws-max-pool-connections",
+        nargs="?",
+        default=None,
+        type=validate_max_pool_connections,
+        help="Set the maximum number of connections kept in the Boto3 clients' pool and the number of threads shared by the AWS services to make the API calls (Default: 10)",
+    )
 
     # Scan Unused Services
     scan_unused_services_subparser = aws_parser.add_argument_group(
@@ -177,6 +191,17 @@ def validate_session_duration(duration):
     return duration
 
 
+def validate_max_pool_connections(max_pool_connections):
+    """validate_max_pool_connections validates that the maximum number of connections of the Boto3 clients' pool is a positive integer"""
+    try:
+        max_pool_connections = int(max_pool_connections)
+    except ValueError:
+        raise ArgumentTypeError("--aws-max-pool-connections must be an integer")
+    if max_pool_connections < 1:
+        raise ArgumentTypeError("--aws-max-pool-connections must be greater than 0")
+    return max_pool_connections
+
+
 def validate_arguments(arguments: Namespace) -> tuple[bool, str]:
     """validate_arguments returns {True, "} if the provider arguments passed are valid and can be used together. It performs an extra validation, specific for the AWS provider, apart from the argparse lib."""
 
@@ -1,5 +1,6 @@
 import csv
 import json
+from concurrent.futures import as_completed
 from copy import deepcopy
 
 from alive_progress import alive_bar
@@ -23,7 +24,6 @@ def quick_inventory(provider: AwsProvider, args):
     resources = []
     global_resources = []
     total_resources_per_region = {}
-    iam_was_scanned = False
     # If not inputed regions, check all of them
     if not provider.identity.audited_regions:
         # EC2 client for describing all regions
@@ -34,75 +34,56 @@ def quick_inventory(provider: AwsProvider, args):
         provider.identity.audited_regions = [
             region["RegionName"] for region in ec2_client.describe_regions()["Regions"]
         ]
+    audited_regions = sorted(provider.identity.audited_regions)
 
     with alive_bar(
-        total=len(provider.identity.audited_regions),
+        total=len(audited_regions),
         ctrl_c=False,
         bar="blocks",
         spinner="classic",
         stats=False,
         enrich_print=False,
     ) as bar:
-        for region in sorted(provider.identity.audited_regions):
-            bar.title = f"Inventorying AWS Account {orange_color}{provider.identity.account}{Style.RESET_ALL}"
-            resources_in_region = []
-            # {
-            #   eu-west-1: 100,...
-            # }
-
+        bar.title = f"Inventorying AWS Account {orange_color}{provider.identity.account}{Style.RESET_ALL}"
+        # The IAM resources, the location of the S3 buckets and the tagged resources of every region are retrieved concurrently
+        iam_resources = provider.thread_pool.submit(
+            get_iam_resources,
+            provider.get_client("iam", provider.identity.profile_region),
+        )
+        regional_resources = {
+            provider.thread_pool.submit(
+                get_regional_resources, provider, region
+            ): region
+            for region in audited_regions
+        }
+        # S3 buckets are retrieved apart since none-tagged buckets are not supported by the resourcegroupstaggingapi
+        regional_buckets = get_buckets_per_region(provider, audited_regions)
+
+        resources_per_region = {}
+        global_resources_per_region = {}
+        for future in as_completed(regional_resources):
+            region = regional_resources[future]
             try:
-                # Scan IAM only once
-                if not iam_was_scanned:
-                    global_resources.extend(
-                        get_iam_resources(provider.session.current_session)
-                    )
-                    iam_was_scanned = True
-
-                # Get regional S3 buckets since none-tagged buckets are not supported by the resourcegroupstaggingapi
-                resources_in_region.extend(get_regional_buckets(provider, region))
-
-                client = provider.session.current_session.client(
-                    "resourcegroupstaggingapi", region_name=region
-                )
-                # Get all the resources
-                resources_count = 0
-                try:
-                    get_resources_paginator = client.get_paginator("get_resources")
-                    for page in get_resources_paginator.paginate():
-                        resources_count += len(page["ResourceTagMappingList"])
-                        for resource in page["ResourceTagMappingList"]:
-                            # Avoid adding S3 buckets again:
-                            if resource["ResourceARN"].split(":")[2] != "s3":
-                                # Check if region is not in ARN --> Global service
-                                if not resource["ResourceARN"].split(":")[3]:
-                                    global_resources.append(
-                                        {
-                                            "arn": resource["ResourceARN"],
-                                            "tags": resource["Tags"],
-                                        }
-                                    )
-                                else:
-                                    resources_in_region.append(
-                                        {
-                                            "arn": resource["ResourceARN"],
-                                            "tags": resource["Tags"],
-                                        }
-                                    )
-                except Exception as error:
-                    logger.error(
-                        f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                bar()
-                if len(resources_in_region) > 0:
-                    total_resources_per_region[region] = len(resources_in_region)
-                bar.text = f"-> Found {Fore.GREEN}{len(resources_in_region)}{Style.RESET_ALL} resources in {region}"
-
+                (
+                    resources_per_region[region],
+                    global_resources_per_region[region],
+                ) = future.result()
             except Exception as error:
                 logger.error(
                     f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
-                bar()
-
+                resources_per_region[region] = []
+                global_resources_per_region[region] = []
+            bar()
+            bar.text = f"-> Found {Fore.GREEN}{len(regional_buckets.get(region, [])) + len(resources_per_region[region])}{Style.RESET_ALL} resources in {region}"
+
+        global_resources.extend(iam_resources.result())
+        for region in audited_regions:
+            resources_in_region = regional_buckets.get(region, [])
+            resources_in_region.extend(resources_per_region[region])
+            global_resources.extend(global_resources_per_region[region])
+            if len(resources_in_region) > 0:
+                total_resources_per_region[region] = len(resources_in_region)
             resources.extend(resources_in_region)
         bar.title = f"-> {Fore.GREEN}Quick Inventory completed!{Style.RESET_ALL}"
 
@@ -304,44 +285,113 @@ def create_output(resources: list, provider: AwsProvider, args):
             )
 
 
-def get_regional_buckets(provider: AwsProvider, region: str) -> list:
-    regional_buckets = []
-    s3_client = provider.session.current_session.client("s3", region_name=region)
+def get_regional_resources(provider: AwsProvider, region: str) -> tuple:
+    """get_regional_resources returns the resources of the region and the global resources, without the S3 buckets, from the resourcegroupstaggingapi"""
+    resources_in_region = []
+    global_resources = []
+    client = provider.get_client("resourcegroupstaggingapi", region)
+    # Get all the resources
     try:
-        buckets = s3_client.list_buckets()
-        for bucket in buckets["Buckets"]:
-            bucket_region = s3_client.get_bucket_location(Bucket=bucket["Name"])[
-                "LocationConstraint"
-            ]
-            if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
-                bucket_region = "eu-west-1"
-            if not bucket_region:  # If None, bucket_region is us-east-1
-                bucket_region = "us-east-1"
-            if bucket_region == region:  # Only add bucket if is in current region
-                try:
-                    bucket_tags = s3_client.get_bucket_tagging(Bucket=bucket["Name"])[
-                        "TagSet"
-                    ]
-                except ClientError as error:
-                    bucket_tags = []
-                    if error.response["Error"]["Code"] != "NoSuchTagSet":
-                        logger.error(
-                            f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        get_resources_paginator = client.get_paginator("get_resources")
+        for page in get_resources_paginator.paginate():
+            for resource in page["ResourceTagMappingList"]:
+                # Avoid adding S3 buckets again:
+                if resource["ResourceARN"].split(":")[2] != "s3":
+                    # Check if region is not in ARN --> Global service
+                    if not resource["ResourceARN"].split(":")[3]:
+                        global_resources.append(
+                            {
+                                "arn": resource["ResourceARN"],
+                                "tags": resource["Tags"],
+                            }
+                        )
+                    else:
+                        resources_in_region.append(
+                            {
+                                "arn": resource["ResourceARN"],
+                                "tags": resource["Tags"],
+                            }
                         )
-                bucket_arn = (
-                    f"arn:{provider.identity.partition}:s3:{region}::{bucket['Name']}"
-                )
-                regional_buckets.append({"arn": bucket_arn, "tags": bucket_tags})
+    except Exception as error:
+        logger.error(
+            f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return resources_in_region, global_resources
+
+
+def get_buckets_per_region(provider: AwsProvider, regions: list) -> dict:
+    """get_buckets_per_region returns the S3 buckets of the given regions, listing the buckets and getting their location and tags once and concurrently"""
+    buckets_per_region = {}
+    s3_client = provider.get_client("s3", provider.identity.profile_region)
+    try:
+        buckets = s3_client.list_buckets()["Buckets"]
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
         )
-    return regional_buckets
+        return buckets_per_region
+
+    buckets_region = provider.thread_pool.map(
+        lambda bucket: get_bucket_region(s3_client, bucket["Name"]), buckets
+    )
+    regional_buckets = [
+        (bucket["Name"], bucket_region)
+        for bucket, bucket_region in zip(buckets, buckets_region)
+        # Only add the buckets of the given regions
+        if bucket_region in regions
+    ]
+    buckets_tags = provider.thread_pool.map(
+        lambda bucket: get_bucket_tags(provider, *bucket), regional_buckets
+    )
+    for (bucket_name, bucket_region), bucket_tags in zip(
+        regional_buckets, buckets_tags
+    ):
+        bucket_arn = (
+            f"arn:{provider.identity.partition}:s3:{bucket_region}::{bucket_name}"
+        )
+        buckets_per_region.setdefault(bucket_region, []).append(
+            {"arn": bucket_arn, "tags": bucket_tags}
+        )
+    return buckets_per_region
+
+
+def get_bucket_region(s3_client, bucket_name: str) -> str:
+    try:
+        bucket_region = s3_client.get_bucket_location(Bucket=bucket_name)[
+            "LocationConstraint"
+        ]
+        if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
+            bucket_region = "eu-west-1"
+        if not bucket_region:  # If None, bucket_region is us-east-1
+            bucket_region = "us-east-1"
+        return bucket_region
+    except Exception as error:
+        logger.error(
+            f"{bucket_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+
+
+def get_bucket_tags(provider: AwsProvider, bucket_name: str, region: str) -> list:
+    bucket_tags = []
+    try:
+        bucket_tags = provider.get_client("s3", region).get_bucket_tagging(
+            Bucket=bucket_name
+        )["TagSet"]
+    except ClientError as error:
+        if error.response["Error"]["Code"] != "NoSuchTagSet":
+            logger.error(
+                f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+    except Exception as error:
+        logger.error(
+            f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return bucket_tags
 
 
-def get_iam_resources(session) -> list:
+def get_iam_resources(iam_client) -> list:
     iam_resources = []
-    iam_client = session.client("iam")
     try:
         get_roles_paginator = iam_client.get_paginator("list_roles")
         for page in get_roles_paginator.paginate():
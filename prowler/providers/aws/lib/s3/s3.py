@@ -1,3 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
 from prowler.config.config import (
     csv_file_suffix,
     json_asff_file_suffix,
@@ -5,10 +10,68 @@ from prowler.config.config import (
 )
 from prowler.lib.logger import logger
 
+# Number of output files uploaded at the same time
+S3_MAX_UPLOADS = 10
+# Only the big output files are uploaded in parts, several at the same time
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=4,
+)
+
 
 def send_to_s3_bucket(
     output_filename, output_directory, output_mode, output_bucket_name, audit_session
 ):
+    return send_outputs_to_s3_bucket(
+        output_filename,
+        output_directory,
+        [output_mode],
+        output_bucket_name,
+        audit_session,
+    )
+
+
+def send_outputs_to_s3_bucket(
+    output_filename: str,
+    output_directory: str,
+    output_modes: list,
+    output_bucket_name: str,
+    audit_session,
+) -> int:
+    """send_outputs_to_s3_bucket uploads the output files of all the output modes concurrently with the same S3 client and returns the number of uploaded files"""
+    try:
+        s3_client = audit_session.client(
+            "s3",
+            config=Config(
+                max_pool_connections=S3_MAX_UPLOADS * S3_TRANSFER_CONFIG.max_concurrency
+            ),
+        )
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(S3_MAX_UPLOADS, len(output_modes)))
+        ) as executor:
+            return sum(
+                executor.map(
+                    lambda output_mode: __upload_output_file__(
+                        output_filename,
+                        output_directory,
+                        output_mode,
+                        output_bucket_name,
+                        s3_client,
+                    ),
+                    output_modes,
+                )
+            )
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
+        )
+        return 0
+
+
+def __upload_output_file__(
+    output_filename, output_directory, output_mode, output_bucket_name, s3_client
+) -> bool:
     try:
         # S3 Object name
         bucket_directory = get_s3_object_path(output_directory)
@@ -30,13 +93,16 @@ def send_to_s3_bucket(
 
         logger.info(f"Sending output file {filename} to S3 bucket {output_bucket_name}")
 
-        s3_client = audit_session.client("s3")
-        s3_client.upload_file(file_name, output_bucket_name, object_name)
+        s3_client.upload_file(
+            file_name, output_bucket_name, object_name, Config=S3_TRANSFER_CONFIG
+        )
+        return True
 
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
         )
+        return False
 
 
 def get_s3_object_path(output_directory: str) -> str:
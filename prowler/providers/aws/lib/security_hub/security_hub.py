@@ -1,12 +1,60 @@
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from threading import Lock
+from time import monotonic, sleep, time
+from typing import Optional
+
 from boto3 import session
 from botocore.client import ClientError
 
-from prowler.config.config import timestamp_utc
+from prowler.config.config import security_hub_cache_file, timestamp_utc
 from prowler.lib.logger import logger
 from prowler.lib.outputs.json_asff.json_asff import fill_json_asff
 
 SECURITY_HUB_INTEGRATION_NAME = "prowler/prowler"
 SECURITY_HUB_MAX_BATCH = 100
+# BatchImportFindings requests per second allowed by AWS Security Hub per account and region
+SECURITY_HUB_BATCH_IMPORT_RATE = 10
+# Maximum number of batches sent at the same time
+SECURITY_HUB_MAX_WORKERS = 20
+# Number of times the findings that failed to import are sent again
+SECURITY_HUB_MAX_RETRIES = 3
+SECURITY_HUB_RETRY_DELAY = 1
+# Seconds the regions where the Prowler integration is enabled are cached
+SECURITY_HUB_CACHE_TTL = 86400
+
+
+class Security_Hub_Rate_Limiter:
+    """Security_Hub_Rate_Limiter spaces the requests to an AWS Security Hub region to stay within its requests per second quota"""
+
+    def __init__(self, requests_per_second: int = SECURITY_HUB_BATCH_IMPORT_RATE):
+        self.interval = 1 / requests_per_second
+        self.next_request = 0.0
+        self.lock = Lock()
+
+    def wait(self):
+        """wait blocks until a new request can be sent"""
+        with self.lock:
+            now = monotonic()
+            wait_time = self.next_request - now
+            self.next_request = max(now, self.next_request) + self.interval
+        if wait_time > 0:
+            sleep(wait_time)
+
+
+# The quota is per region, so all the requests to a region share its rate limiter
+security_hub_rate_limiters = {}
+security_hub_rate_limiters_lock = Lock()
+
+
+def get_security_hub_rate_limiter(region: str) -> Security_Hub_Rate_Limiter:
+    with security_hub_rate_limiters_lock:
+        if region not in security_hub_rate_limiters:
+            security_hub_rate_limiters[region] = Security_Hub_Rate_Limiter()
+        return security_hub_rate_limiters[region]
 
 
 def prepare_security_hub_findings(
@@ -58,8 +106,8 @@ def verify_security_hub_integration_enabled_per_region(
     region: str,
     session: session.Session,
     aws_account_number: str,
-) -> bool:
-    f"""verify_security_hub_integration_enabled returns True if the {SECURITY_HUB_INTEGRATION_NAME} is enabled for the given region. Otherwise returns false."""
+) -> Optional[bool]:
+    f"""verify_security_hub_integration_enabled returns True if the {SECURITY_HUB_INTEGRATION_NAME} is enabled for the given region, False if it is not and None if it could not be verified."""
     prowler_integration_enabled = False
 
     try:
@@ -72,14 +120,17 @@ def verify_security_hub_integration_enabled_per_region(
 
         # Check if Prowler integration is enabled in Security Hub
         security_hub_prowler_integration_arn = f"arn:{partition}:securityhub:{region}:{aws_account_number}:product-subscription/{SECURITY_HUB_INTEGRATION_NAME}"
-        if security_hub_prowler_integration_arn not in str(
-            security_hub_client.list_enabled_products_for_import()
-        ):
+        list_enabled_products_for_import_paginator = security_hub_client.get_paginator(
+            "list_enabled_products_for_import"
+        )
+        for page in list_enabled_products_for_import_paginator.paginate():
+            if security_hub_prowler_integration_arn in page["ProductSubscriptions"]:
+                prowler_integration_enabled = True
+                break
+        if not prowler_integration_enabled:
             logger.warning(
                 f"Security Hub is enabled in {region} but Prowler integration does not accept findings. More info: https://docs.prowler.cloud/en/latest/tutorials/aws/securityhub/"
             )
-        else:
-            prowler_integration_enabled = True
 
     # Handle all the permissions / configuration errors
     except ClientError as client_error:
@@ -98,41 +149,212 @@ def verify_security_hub_integration_enabled_per_region(
             logger.error(
                 f"{client_error.__class__.__name__} -- [{client_error.__traceback__.tb_lineno}]: {client_error}"
             )
+            # The integration could not be verified, e.g. the request was throttled
+            prowler_integration_enabled = None
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]: {error}"
         )
+        prowler_integration_enabled = None
 
     finally:
         return prowler_integration_enabled
 
 
+def get_security_hub_enabled_regions(
+    provider, cache_ttl: int = SECURITY_HUB_CACHE_TTL
+) -> list:
+    """
+    get_security_hub_enabled_regions returns the audited regions where the Prowler integration of AWS Security Hub is enabled
+
+    The regions are verified concurrently and the result of each account and region is cached in the security_hub_cache_file for cache_ttl seconds, 0 to always verify them.
+    The regions that could not be verified are not cached, so they are verified again in the next execution.
+    """
+    security_hub_regions = (
+        provider.get_available_aws_service_regions("securityhub")
+        if not provider.identity.audited_regions
+        else provider.identity.audited_regions
+    )
+    security_hub_cache = load_security_hub_cache() if cache_ttl else {}
+    now = time()
+    cache_keys = {
+        region: f"{provider.identity.partition}:{provider.identity.account}:{region}"
+        for region in security_hub_regions
+    }
+    enabled_regions = {}
+    regions_to_verify = []
+    for region in security_hub_regions:
+        cached_region = security_hub_cache.get(cache_keys[region], {})
+        if now - cached_region.get("Timestamp", 0) < cache_ttl:
+            enabled_regions[region] = cached_region["Enabled"]
+            if not cached_region["Enabled"]:
+                logger.warning(
+                    f"The {SECURITY_HUB_INTEGRATION_NAME} was not enabled in {region} when it was verified at {datetime.fromtimestamp(cached_region['Timestamp']).isoformat()}, use --security-hub-cache-ttl 0 to verify it again."
+                )
+        else:
+            regions_to_verify.append(region)
+
+    if regions_to_verify:
+        with ThreadPoolExecutor(
+            max_workers=min(SECURITY_HUB_MAX_WORKERS, len(regions_to_verify))
+        ) as executor:
+            verified_regions = executor.map(
+                lambda region: verify_security_hub_integration_enabled_per_region(
+                    provider.identity.partition,
+                    region,
+                    provider.session.current_session,
+                    provider.identity.account,
+                ),
+                regions_to_verify,
+            )
+            for region, enabled in zip(regions_to_verify, verified_regions):
+                enabled_regions[region] = bool(enabled)
+                # Only the results confirmed by AWS Security Hub are cached
+                if enabled is not None:
+                    security_hub_cache[cache_keys[region]] = {
+                        "Enabled": enabled,
+                        "Timestamp": now,
+                    }
+        if cache_ttl:
+            save_security_hub_cache(security_hub_cache)
+
+    # Save the regions where AWS Security Hub is enabled
+    return [region for region in security_hub_regions if enabled_regions[region]]
+
+
+def load_security_hub_cache() -> dict:
+    """load_security_hub_cache returns the cached regions where the Prowler integration of AWS Security Hub is enabled, by partition, account and region"""
+    try:
+        with open(security_hub_cache_file) as cache_file:
+            return json.load(cache_file)
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.warning(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return {}
+
+
+def save_security_hub_cache(security_hub_cache: dict):
+    """save_security_hub_cache saves the regions where the Prowler integration of AWS Security Hub is enabled in the security_hub_cache_file"""
+    try:
+        os.makedirs(os.path.dirname(security_hub_cache_file), exist_ok=True)
+        # Write a temporary file first so concurrent executions never read a partial cache
+        temporary_file = f"{security_hub_cache_file}.{os.getpid()}"
+        with open(temporary_file, "w") as cache_file:
+            json.dump(security_hub_cache, cache_file)
+        os.replace(temporary_file, security_hub_cache_file)
+    except Exception as error:
+        logger.info(
+            f"The AWS Security Hub enabled regions could not be saved -- {error.__class__.__name__}: {error}"
+        )
+
+
+class Security_Hub_Findings_Batches:
+    """
+    Security_Hub_Findings_Batches sends the findings of every check to AWS Security Hub as soon as a batch of a region is full.
+
+    It is used to stream the findings, so only the pending findings and the Id of the sent ones are kept, to archive the previous findings.
+    The full batches are sent concurrently in the background, up to twice SECURITY_HUB_MAX_WORKERS at a time, so the checks are not blocked.
+    The batches are the same sent by batch_send_to_security_hub with all the findings.
+    """
+
+    def __init__(
+        self, provider, output_options, enabled_regions: list, session: session.Session
+    ):
+        self.provider = provider
+        self.output_options = output_options
+        self.enabled_regions = enabled_regions
+        self.session = session
+        self.success_count = 0
+        # Findings not sent yet
+        self.pending_findings_per_region = {region: [] for region in enabled_regions}
+        # Ids of the sent findings
+        self.findings_ids_per_region = {region: set() for region in enabled_regions}
+        self._clients = {}
+        self._executor = ThreadPoolExecutor(max_workers=SECURITY_HUB_MAX_WORKERS)
+        # Batches being sent, in the order they were submitted
+        self._sending_batches = deque()
+
+    def __send_batch__(self, region: str, findings: list[dict]):
+        if region not in self._clients:
+            self._clients[region] = self.session.client(
+                "securityhub", region_name=region
+            )
+        self.findings_ids_per_region[region].update(
+            finding["Id"] for finding in findings
+        )
+        # Wait for the oldest batch so the batches being sent do not grow
+        while len(self._sending_batches) >= 2 * SECURITY_HUB_MAX_WORKERS:
+            self.__wait_for_batch__()
+        self._sending_batches.append(
+            self._executor.submit(
+                __send_findings_batch_to_security_hub__,
+                findings,
+                region,
+                self._clients[region],
+            )
+        )
+
+    def __wait_for_batch__(self):
+        self.success_count += self._sending_batches.popleft().result()
+
+    def extend(self, findings: list):
+        """extend prepares the given findings and sends the full batches"""
+        for region, region_findings in prepare_security_hub_findings(
+            findings, self.provider, self.output_options, self.enabled_regions
+        ).items():
+            pending_findings = self.pending_findings_per_region[region]
+            pending_findings.extend(region_findings)
+            while len(pending_findings) >= SECURITY_HUB_MAX_BATCH:
+                self.__send_batch__(region, pending_findings[:SECURITY_HUB_MAX_BATCH])
+                del pending_findings[:SECURITY_HUB_MAX_BATCH]
+
+    def send(self) -> int:
+        """send sends the pending findings, waits for all the batches and returns the number of findings that were successfully sent"""
+        for region, pending_findings in self.pending_findings_per_region.items():
+            if pending_findings:
+                logger.info(f"Sending findings to Security Hub in the region {region}")
+                self.__send_batch__(region, pending_findings.copy())
+                pending_findings.clear()
+        while self._sending_batches:
+            self.__wait_for_batch__()
+        self._executor.shutdown()
+        return self.success_count
+
+
 def batch_send_to_security_hub(
     security_hub_findings_per_region: dict,
     session: session.Session,
 ) -> int:
     """
     send_to_security_hub sends findings to Security Hub and returns the number of findings that were successfully sent.
-    """
-
-    success_count = 0
-    try:
-        # Iterate findings by region
-        for region, findings in security_hub_findings_per_region.items():
-            # Send findings to Security Hub
-            logger.info(f"Sending findings to Security Hub in the region {region}")
 
-            security_hub_client = session.client("securityhub", region_name=region)
+    The regions and their batches are sent concurrently.
+    """
 
-            success_count = __send_findings_to_security_hub__(
-                findings, region, security_hub_client
+    security_hub_clients = {}
+    for region in security_hub_findings_per_region:
+        # Send findings to Security Hub
+        logger.info(f"Sending findings to Security Hub in the region {region}")
+        try:
+            security_hub_clients[region] = session.client(
+                "securityhub", region_name=region
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
             )
 
-    except Exception as error:
-        logger.error(
-            f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
-        )
-    return success_count
+    return __send_findings_per_region_to_security_hub__(
+        {
+            region: findings
+            for region, findings in security_hub_findings_per_region.items()
+            if region in security_hub_clients
+        },
+        security_hub_clients,
+    )
 
 
 # Move previous Security Hub check findings to ARCHIVED (as prowler didn't re-detect them)
@@ -141,20 +363,31 @@ def resolve_security_hub_previous_findings(
 ) -> list:
     """
     resolve_security_hub_previous_findings archives all the findings that does not appear in the current execution
+
+    The findings of each region can be the findings sent or only the set of their Ids, like the streamed findings.
     """
     logger.info("Checking previous findings in Security Hub to archive them.")
-    success_count = 0
+    security_hub_clients = {}
     for region in security_hub_findings_per_region.keys():
         try:
-            current_findings = security_hub_findings_per_region[region]
-            # Get current findings IDs
-            current_findings_ids = []
-            for finding in current_findings:
-                current_findings_ids.append(finding["Id"])
-            # Get findings of that region
-            security_hub_client = provider.session.current_session.client(
+            security_hub_clients[region] = provider.session.current_session.client(
                 "securityhub", region_name=region
             )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+            )
+
+    def get_findings_to_archive(region: str) -> list:
+        findings_to_archive = []
+        try:
+            # Get current findings IDs
+            current_findings_ids = security_hub_findings_per_region[region]
+            if not isinstance(current_findings_ids, set):
+                current_findings_ids = {
+                    finding["Id"] for finding in current_findings_ids
+                }
+            # Get findings of that region
             findings_filter = {
                 "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
                 "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
@@ -163,8 +396,9 @@ def resolve_security_hub_previous_findings(
                 ],
                 "Region": [{"Value": region, "Comparison": "EQUALS"}],
             }
-            get_findings_paginator = security_hub_client.get_paginator("get_findings")
-            findings_to_archive = []
+            get_findings_paginator = security_hub_clients[region].get_paginator(
+                "get_findings"
+            )
             for page in get_findings_paginator.paginate(Filters=findings_filter):
                 # Archive findings that have not appear in this execution
                 for finding in page["Findings"]:
@@ -176,41 +410,95 @@ def resolve_security_hub_previous_findings(
 
                         findings_to_archive.append(finding)
             logger.info(f"Archiving {len(findings_to_archive)} findings.")
-
-            # Send archive findings to SHub
-            success_count += __send_findings_to_security_hub__(
-                findings_to_archive, region, security_hub_client
-            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
             )
-    return success_count
+        return findings_to_archive
+
+    # Retrieve the previous findings of every region concurrently
+    regions = list(security_hub_clients)
+    findings_to_archive_per_region = {}
+    if regions:
+        with ThreadPoolExecutor(
+            max_workers=min(SECURITY_HUB_MAX_WORKERS, len(regions))
+        ) as executor:
+            findings_to_archive_per_region = dict(
+                zip(regions, executor.map(get_findings_to_archive, regions))
+            )
+
+    # Send archive findings to SHub
+    return __send_findings_per_region_to_security_hub__(
+        findings_to_archive_per_region, security_hub_clients
+    )
 
 
 def __send_findings_to_security_hub__(
     findings: list[dict], region: str, security_hub_client
 ):
     """Private function send_findings_to_security_hub chunks the findings in groups of 100 findings and send them to AWS Security Hub. It returns the number of sent findings."""
+    return __send_findings_per_region_to_security_hub__(
+        {region: findings}, {region: security_hub_client}
+    )
+
+
+def __send_findings_per_region_to_security_hub__(
+    security_hub_findings_per_region: dict, security_hub_clients: dict
+) -> int:
+    """Private function __send_findings_per_region_to_security_hub__ sends the batches of 100 findings of every region concurrently. It returns the number of sent findings."""
+    batches = [
+        (findings[i : i + SECURITY_HUB_MAX_BATCH], region)
+        for region, findings in security_hub_findings_per_region.items()
+        for i in range(0, len(findings), SECURITY_HUB_MAX_BATCH)
+    ]
+    if not batches:
+        return 0
+    with ThreadPoolExecutor(
+        max_workers=min(SECURITY_HUB_MAX_WORKERS, len(batches))
+    ) as executor:
+        return sum(
+            executor.map(
+                lambda batch: __send_findings_batch_to_security_hub__(
+                    batch[0], batch[1], security_hub_clients[batch[1]]
+                ),
+                batches,
+            )
+        )
+
+
+def __send_findings_batch_to_security_hub__(
+    findings: list[dict], region: str, security_hub_client
+) -> int:
+    """Private function __send_findings_batch_to_security_hub__ sends a batch of findings to AWS Security Hub within the region's quota, sending again the findings that failed to import. It returns the number of sent findings."""
     success_count = 0
+    rate_limiter = get_security_hub_rate_limiter(region)
+    retry_delay = SECURITY_HUB_RETRY_DELAY
     try:
-        list_chunked = [
-            findings[i : i + SECURITY_HUB_MAX_BATCH]
-            for i in range(0, len(findings), SECURITY_HUB_MAX_BATCH)
-        ]
-
-        for findings in list_chunked:
+        for attempt in range(SECURITY_HUB_MAX_RETRIES + 1):
+            rate_limiter.wait()
             batch_import = security_hub_client.batch_import_findings(Findings=findings)
-            if batch_import["FailedCount"] > 0:
+            success_count += batch_import["SuccessCount"]
+            if batch_import["FailedCount"] == 0:
+                break
+            if attempt == SECURITY_HUB_MAX_RETRIES:
                 failed_import = batch_import["FailedFindings"][0]
                 logger.error(
                     f"Failed to send findings to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
                 )
-            success_count += batch_import["SuccessCount"]
+                break
+            # Only the findings that failed are sent again
+            failed_findings_ids = {
+                failed_finding["Id"]
+                for failed_finding in batch_import["FailedFindings"]
+            }
+            findings = [
+                finding for finding in findings if finding["Id"] in failed_findings_ids
+            ]
+            sleep(retry_delay)
+            retry_delay *= 2
 
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
         )
-    finally:
-        return success_count
+    return success_count
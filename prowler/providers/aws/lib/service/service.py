@@ -1,7 +1,8 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
+from time import monotonic, sleep
 
 from prowler.lib.logger import logger
-from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.aws.aws_provider import AwsProvider, aws_thread_pool_worker
 
 # TODO: review the following code
 # from prowler.providers.aws.aws_provider import (
@@ -9,7 +10,11 @@ from prowler.providers.aws.aws_provider import AwsProvider
 #     get_default_region,
 # )
 
-MAX_WORKERS = 10
+# Seconds to wait between the calls to get the status of an AWS asynchronous job
+JOB_POLLING_INITIAL_DELAY = 0.25
+JOB_POLLING_MAX_DELAY = 10
+# Seconds to wait for an AWS asynchronous job to be completed
+JOB_POLLING_TIMEOUT = 300
 
 
 class AWSService:
@@ -17,8 +22,12 @@ class AWSService:
     - AWS Regional Clients
     - Shared information like the account ID and ARN, the AWS partition and the checks audited
     - AWS Session
-    - Thread pool for the __threading_call__
+    - Thread pool for the __threading_call__, shared by all the AWS Services
+    - Polling of AWS asynchronous jobs with __wait_for_job__
     - Also handles if the AWS Service is Global
+
+    A __threading_call__ made from a thread of the shared pool runs in that thread, since waiting for other tasks of the same pool could take all its threads and deadlock.
+    The tasks submitted directly to the thread_pool must not submit and wait for other tasks in it.
     """
 
     def __init__(self, service: str, provider: AwsProvider, global_service=False):
@@ -50,10 +59,10 @@ class AWSService:
         # We cannot include this within an else because some services needs both the regional_clients
         # and a single client like S3
         self.region = provider.get_default_region(self.service)
-        self.client = self.session.client(self.service, self.region)
+        self.client = provider.get_client(self.service, self.region)
 
         # Thread pool for __threading_call__
-        self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        self.thread_pool = provider.thread_pool
 
     def __get_session__(self):
         return self.session
@@ -79,6 +88,16 @@ class AWSService:
                 f"{self.service.upper()} - Starting threads for '{call_name}' function to process {item_count} items..."
             )
 
+        # Nested calls are executed in the current thread of the pool
+        if getattr(aws_thread_pool_worker, "is_worker", False):
+            for item in items:
+                try:
+                    call(item)
+                except Exception:
+                    # Currently handled within the called function
+                    pass
+            return
+
         # Submit tasks to the thread pool
         futures = [self.thread_pool.submit(call, item) for item in items]
 
@@ -89,3 +108,18 @@ class AWSService:
             except Exception:
                 # Handle exceptions if necessary
                 pass  # Replace 'pass' with any additional exception handling logic. Currently handled within the called function
+
+    def __wait_for_job__(self, get_job_status, is_job_completed):
+        """__wait_for_job__ calls get_job_status until is_job_completed returns True for its response, doubling the wait between the calls up to JOB_POLLING_MAX_DELAY, and returns the last response. It raises a TimeoutError if the job is not completed in JOB_POLLING_TIMEOUT seconds"""
+        delay = JOB_POLLING_INITIAL_DELAY
+        timeout = monotonic() + JOB_POLLING_TIMEOUT
+        job_status = get_job_status()
+        while not is_job_completed(job_status):
+            if monotonic() >= timeout:
+                raise TimeoutError(
+                    f"The job was not completed in {JOB_POLLING_TIMEOUT} seconds"
+                )
+            sleep(delay)
+            delay = min(delay * 2, JOB_POLLING_MAX_DELAY)
+            job_status = get_job_status()
+        return job_status
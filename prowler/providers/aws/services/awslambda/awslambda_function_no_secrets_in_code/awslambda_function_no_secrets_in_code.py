@@ -1,10 +1,5 @@
-import os
-import tempfile
-
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.utils.utils import detect_secrets_scan
 from prowler.providers.aws.services.awslambda.awslambda_client import awslambda_client
 
 
@@ -24,41 +19,32 @@ class awslambda_function_no_secrets_in_code(Check):
                     report.status_extended = (
                         f"No secrets found in Lambda function {function.name} code."
                     )
-                    with tempfile.TemporaryDirectory() as tmp_dir_name:
-                        function_code.code_zip.extractall(tmp_dir_name)
-                        # List all files
-                        files_in_zip = next(os.walk(tmp_dir_name))[2]
-                        secrets_findings = []
-                        for file in files_in_zip:
-                            secrets = SecretsCollection()
-                            with default_settings():
-                                secrets.scan_file(f"{tmp_dir_name}/{file}")
-                            detect_secrets_output = secrets.json()
-                            if detect_secrets_output:
-                                for (
-                                    file_name
-                                ) in (
-                                    detect_secrets_output.keys()
-                                ):  # Appears that only 1 file is being scanned at a time, so could rework this
-                                    output_file_name = file_name.replace(
-                                        f"{tmp_dir_name}/", ""
-                                    )
-                                    secrets_string = ", ".join(
-                                        [
-                                            f"{secret['type']} on line {secret['line_number']}"
-                                            for secret in detect_secrets_output[
-                                                file_name
-                                            ]
-                                        ]
-                                    )
-                                    secrets_findings.append(
-                                        f"{output_file_name}: {secrets_string}"
-                                    )
-
-                        if secrets_findings:
-                            final_output_string = "; ".join(secrets_findings)
-                            report.status = "FAIL"
-                            report.status_extended = f"Potential {'secrets' if len(secrets_findings) > 1 else 'secret'} found in Lambda function {function.name} code -> {final_output_string}."
+                    secrets_findings = []
+                    # Scan the files in the root of the code in memory
+                    for file in function_code.code_zip.namelist():
+                        if "/" in file:
+                            continue
+                        try:
+                            file_data = function_code.code_zip.read(file).decode(
+                                "utf-8"
+                            )
+                        except UnicodeDecodeError:
+                            # Binary files are not scanned
+                            continue
+                        detect_secrets_output = detect_secrets_scan(file_data, file)
+                        if detect_secrets_output:
+                            secrets_string = ", ".join(
+                                [
+                                    f"{secret['type']} on line {secret['line_number']}"
+                                    for secret in detect_secrets_output
+                                ]
+                            )
+                            secrets_findings.append(f"{file}: {secrets_string}")
+
+                    if secrets_findings:
+                        final_output_string = "; ".join(secrets_findings)
+                        report.status = "FAIL"
+                        report.status_extended = f"Potential {'secrets' if len(secrets_findings) > 1 else 'secret'} found in Lambda function {function.name} code -> {final_output_string}."
 
                     findings.append(report)
 
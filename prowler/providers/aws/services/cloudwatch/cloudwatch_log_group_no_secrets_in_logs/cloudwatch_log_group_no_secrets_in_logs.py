@@ -1,7 +1,7 @@
 from json import dumps, loads
 
 from prowler.lib.check.models import Check, Check_Report_AWS
-from prowler.lib.utils.utils import detect_secrets_scan
+from prowler.lib.utils.utils import detect_secrets_scan, detect_secrets_scan_bulk
 from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
     convert_to_cloudwatch_timestamp_format,
 )
@@ -12,6 +12,22 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
     def execute(self):
         findings = []
         if logs_client.log_groups:
+            # Scan the log streams of all the log groups at once
+            log_streams_data = []
+            for log_group in logs_client.log_groups:
+                if log_group.log_streams:
+                    for log_stream_name in log_group.log_streams:
+                        log_streams_data.append(
+                            "\n".join(
+                                [
+                                    dumps(event["message"])
+                                    for event in log_group.log_streams[log_stream_name]
+                                ]
+                            )
+                        )
+            log_streams_secrets_outputs = iter(
+                detect_secrets_scan_bulk(log_streams_data)
+            )
             for log_group in logs_client.log_groups:
                 report = Check_Report_AWS(self.metadata())
                 report.status = "PASS"
@@ -25,13 +41,9 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
                 if log_group.log_streams:
                     for log_stream_name in log_group.log_streams:
                         log_stream_secrets = {}
-                        log_stream_data = "\n".join(
-                            [
-                                dumps(event["message"])
-                                for event in log_group.log_streams[log_stream_name]
-                            ]
-                        )
-                        log_stream_secrets_output = detect_secrets_scan(log_stream_data)
+                        log_stream_secrets_output = next(log_streams_secrets_outputs)
+                        # Each flagged event is scanned again only once
+                        scanned_events = set()
 
                         if log_stream_secrets_output:
                             for secret in log_stream_secrets_output:
@@ -62,6 +74,9 @@ class cloudwatch_log_group_no_secrets_in_logs(Check):
                                 if len(log_event_data.split("\n")) > 1:
                                     # Can get more informative output if there is more than 1 line.
                                     # Will rescan just this event to get the type of secret and the line number
+                                    if secret["line_number"] in scanned_events:
+                                        continue
+                                    scanned_events.add(secret["line_number"])
                                     event_detect_secrets_output = detect_secrets_scan(
                                         log_event_data
                                     )
@@ -1,67 +1,60 @@
-import os
-import tempfile
 import zlib
 from base64 import b64decode
 
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.utils.utils import detect_secrets_scan_bulk
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
 
 
 class ec2_instance_secrets_user_data(Check):
     def execute(self):
         findings = []
-        for instance in ec2_client.instances:
-            if instance.state != "terminated":
-                report = Check_Report_AWS(self.metadata())
-                report.region = instance.region
-                report.resource_id = instance.id
-                report.resource_arn = instance.arn
-                report.resource_tags = instance.tags
-                if instance.user_data:
-                    temp_user_data_file = tempfile.NamedTemporaryFile(delete=False)
-                    user_data = b64decode(instance.user_data)
-                    if user_data[0:2] == b"\x1f\x8b":  # GZIP magic number
-                        user_data = zlib.decompress(
-                            user_data, zlib.MAX_WBITS | 32
-                        ).decode("utf-8")
-                    else:
-                        user_data = user_data.decode("utf-8")
-
-                    temp_user_data_file.write(
-                        bytes(user_data, encoding="raw_unicode_escape")
+        instances = [
+            instance
+            for instance in ec2_client.instances
+            if instance.state != "terminated"
+        ]
+        user_data_list = []
+        for instance in instances:
+            if instance.user_data:
+                user_data = b64decode(instance.user_data)
+                if user_data[0:2] == b"\x1f\x8b":  # GZIP magic number
+                    user_data = zlib.decompress(user_data, zlib.MAX_WBITS | 32).decode(
+                        "utf-8"
                     )
-                    temp_user_data_file.close()
-                    secrets = SecretsCollection()
-                    with default_settings():
-                        secrets.scan_file(temp_user_data_file.name)
-
-                    detect_secrets_output = secrets.json()
-                    if detect_secrets_output:
-                        secrets_string = ", ".join(
-                            [
-                                f"{secret['type']} on line {secret['line_number']}"
-                                for secret in detect_secrets_output[
-                                    temp_user_data_file.name
-                                ]
-                            ]
-                        )
-                        report.status = "FAIL"
-                        report.status_extended = f"Potential secret found in EC2 instance {instance.id} User Data -> {secrets_string}."
-
-                    else:
-                        report.status = "PASS"
-                        report.status_extended = (
-                            f"No secrets found in EC2 instance {instance.id} User Data."
-                        )
+                else:
+                    user_data = user_data.decode("utf-8")
+                user_data_list.append(user_data)
+        # Scan the User Data of all the instances at once
+        detect_secrets_outputs = iter(detect_secrets_scan_bulk(user_data_list))
+
+        for instance in instances:
+            report = Check_Report_AWS(self.metadata())
+            report.region = instance.region
+            report.resource_id = instance.id
+            report.resource_arn = instance.arn
+            report.resource_tags = instance.tags
+            if instance.user_data:
+                detect_secrets_output = next(detect_secrets_outputs)
+                if detect_secrets_output:
+                    secrets_string = ", ".join(
+                        [
+                            f"{secret['type']} on line {secret['line_number']}"
+                            for secret in detect_secrets_output
+                        ]
+                    )
+                    report.status = "FAIL"
+                    report.status_extended = f"Potential secret found in EC2 instance {instance.id} User Data -> {secrets_string}."
 
-                    os.remove(temp_user_data_file.name)
                 else:
                     report.status = "PASS"
-                    report.status_extended = f"No secrets found in EC2 instance {instance.id} since User Data is empty."
+                    report.status_extended = (
+                        f"No secrets found in EC2 instance {instance.id} User Data."
+                    )
+            else:
+                report.status = "PASS"
+                report.status_extended = f"No secrets found in EC2 instance {instance.id} since User Data is empty."
 
-                findings.append(report)
+            findings.append(report)
 
         return findings
@@ -62,11 +62,12 @@ class IAM(AWSService):
         self.virtual_mfa_devices = self.__list_virtual_mfa_devices__()
         self.credential_report = self.__get_credential_report__()
         self.groups = self.__get_groups__()
-        self.__get_group_users__()
-        self.__list_attached_group_policies__()
-        self.__list_attached_user_policies__()
-        self.__list_attached_role_policies__()
-        self.__list_mfa_devices__()
+        self.__threading_call__(self.__get_group_users__, self.groups)
+        self.__threading_call__(self.__list_attached_group_policies__, self.groups)
+        self.__threading_call__(self.__list_attached_user_policies__, self.users)
+        if self.roles:
+            self.__threading_call__(self.__list_attached_role_policies__, self.roles)
+        self.__threading_call__(self.__list_mfa_devices__, self.users)
         self.password_policy = self.__get_password_policy__()
         support_policy_arn = (
             "arn:aws:iam::aws:policy/aws-service-role/AWSSupportServiceRolePolicy"
@@ -82,15 +83,21 @@ class IAM(AWSService):
         self.policies = []
         self.policies.extend(self.__list_policies__("AWS"))
         self.policies.extend(self.__list_policies__("Local"))
-        self.__list_policies_version__(self.policies)
+        self.__threading_call__(self.__list_policies_version__, self.policies)
         self.__list_inline_user_policies__()
         self.__list_inline_group_policies__()
         self.__list_inline_role_policies__()
         self.saml_providers = self.__list_saml_providers__()
         self.server_certificates = self.__list_server_certificates__()
-        self.__list_tags_for_resource__()
+        if self.roles:
+            self.__threading_call__(self.__list_role_tags__, self.roles)
+        self.__threading_call__(self.__list_user_tags__, self.users)
+        self.__threading_call__(
+            self.__list_policy_tags__,
+            [policy for policy in self.policies if policy.type != "Inline"],
+        )
         self.access_keys_metadata = {}
-        self.__get_access_keys_metadata__()
+        self.__threading_call__(self.__get_access_keys_metadata__, self.users)
         self.last_accessed_services = {}
         self.__get_last_accessed_services__()
         self.user_temporary_credentials_usage = {}
@@ -136,13 +143,12 @@ class IAM(AWSService):
 
     def __get_credential_report__(self):
         logger.info("IAM - Get Credential Report...")
-        report_is_completed = False
         credential_list = []
         try:
-            while not report_is_completed:
-                report_status = self.client.generate_credential_report()
-                if report_status["State"] == "COMPLETE":
-                    report_is_completed = True
+            self.__wait_for_job__(
+                self.client.generate_credential_report,
+                lambda report_status: report_status["State"] == "COMPLETE",
+            )
             # Convert credential report to list of dictionaries
             credential = self.client.get_credential_report()["Content"].decode("utf-8")
             credential_lines = credential.split("\n")
@@ -309,133 +315,154 @@ class IAM(AWSService):
         finally:
             return mfa_devices
 
-    def __list_attached_group_policies__(self):
-        logger.info("IAM - List Attached Group Policies...")
+    def __list_attached_group_policies__(self, group):
         try:
-            for group in self.groups:
-                try:
-                    list_attached_group_policies_paginator = self.client.get_paginator(
-                        "list_attached_group_policies"
-                    )
-                    attached_group_policies = []
-                    for page in list_attached_group_policies_paginator.paginate(
-                        GroupName=group.name
-                    ):
-                        for attached_group_policy in page["AttachedPolicies"]:
-                            attached_group_policies.append(attached_group_policy)
-
-                    group.attached_policies = attached_group_policies
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+            list_attached_group_policies_paginator = self.client.get_paginator(
+                "list_attached_group_policies"
+            )
+            attached_group_policies = []
+            for page in list_attached_group_policies_paginator.paginate(
+                GroupName=group.name
+            ):
+                for attached_group_policy in page["AttachedPolicies"]:
+                    attached_group_policies.append(attached_group_policy)
+
+            group.attached_policies = attached_group_policies
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_group_users__(self):
-        logger.info("IAM - Get Group Users...")
+    def __get_group_users__(self, group):
         try:
-            for group in self.groups:
-                get_group_paginator = self.client.get_paginator("get_group")
-                group_users = []
-                for page in get_group_paginator.paginate(GroupName=group.name):
-                    for user in page["Users"]:
-                        if "PasswordLastUsed" not in user:
-                            group_users.append(
-                                User(name=user["UserName"], arn=user["Arn"])
-                            )
-                        else:
-                            group_users.append(
-                                User(
-                                    name=user["UserName"],
-                                    arn=user["Arn"],
-                                    password_last_used=user["PasswordLastUsed"],
-                                )
+            get_group_paginator = self.client.get_paginator("get_group")
+            group_users = []
+            for page in get_group_paginator.paginate(GroupName=group.name):
+                for user in page["Users"]:
+                    if "PasswordLastUsed" not in user:
+                        group_users.append(User(name=user["UserName"], arn=user["Arn"]))
+                    else:
+                        group_users.append(
+                            User(
+                                name=user["UserName"],
+                                arn=user["Arn"],
+                                password_last_used=user["PasswordLastUsed"],
                             )
-                group.users = group_users
+                        )
+            group.users = group_users
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __list_mfa_devices__(self):
-        logger.info("IAM - List MFA Devices...")
+    def __list_mfa_devices__(self, user):
         try:
-            for user in self.users:
-                list_mfa_devices_paginator = self.client.get_paginator(
-                    "list_mfa_devices"
-                )
-                mfa_devices = []
-                for page in list_mfa_devices_paginator.paginate(UserName=user.name):
-                    for mfa_device in page["MFADevices"]:
-                        mfa_serial_number = mfa_device["SerialNumber"]
-                        mfa_type = (
-                            mfa_device["SerialNumber"].split(":")[5].split("/")[0]
-                        )
-                        mfa_devices.append(
-                            MFADevice(serial_number=mfa_serial_number, type=mfa_type)
-                        )
-                user.mfa_devices = mfa_devices
+            list_mfa_devices_paginator = self.client.get_paginator("list_mfa_devices")
+            mfa_devices = []
+            for page in list_mfa_devices_paginator.paginate(UserName=user.name):
+                for mfa_device in page["MFADevices"]:
+                    mfa_serial_number = mfa_device["SerialNumber"]
+                    mfa_type = mfa_device["SerialNumber"].split(":")[5].split("/")[0]
+                    mfa_devices.append(
+                        MFADevice(serial_number=mfa_serial_number, type=mfa_type)
+                    )
+            user.mfa_devices = mfa_devices
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __list_attached_user_policies__(self):
-        logger.info("IAM - List Attached User Policies...")
+    def __list_attached_user_policies__(self, user):
         try:
-            for user in self.users:
-                try:
-                    attached_user_policies = []
-                    get_user_attached_policies_paginator = self.client.get_paginator(
-                        "list_attached_user_policies"
-                    )
-                    for page in get_user_attached_policies_paginator.paginate(
-                        UserName=user.name
-                    ):
-                        for policy in page["AttachedPolicies"]:
-                            attached_user_policies.append(policy)
+            attached_user_policies = []
+            get_user_attached_policies_paginator = self.client.get_paginator(
+                "list_attached_user_policies"
+            )
+            for page in get_user_attached_policies_paginator.paginate(
+                UserName=user.name
+            ):
+                for policy in page["AttachedPolicies"]:
+                    attached_user_policies.append(policy)
 
-                    user.attached_policies = attached_user_policies
+            user.attached_policies = attached_user_policies
 
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+    def __list_attached_role_policies__(self, role):
+        try:
+            attached_role_policies = []
+            list_attached_role_policies_paginator = self.client.get_paginator(
+                "list_attached_role_policies"
+            )
+            for page in list_attached_role_policies_paginator.paginate(
+                RoleName=role.name
+            ):
+                for policy in page["AttachedPolicies"]:
+                    attached_role_policies.append(policy)
+
+            role.attached_policies = attached_role_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __list_attached_role_policies__(self):
-        logger.info("IAM - List Attached User Policies...")
+    def __list_inline_user_policies__(self):
+        logger.info("IAM - List Inline User Policies...")
+        # Each user gets its own list of inline policies, so they are added to the policies in the same order
+        users_inline_policies = [(user, []) for user in self.users]
+        self.__threading_call__(
+            self.__list_user_inline_policies__, users_inline_policies
+        )
+        for _, inline_policies in users_inline_policies:
+            self.policies.extend(inline_policies)
+
+    def __list_user_inline_policies__(self, user_inline_policies):
+        user, inline_policies = user_inline_policies
         try:
-            if self.roles:
-                for role in self.roles:
+            inline_user_policies = []
+            get_user_inline_policies_paginator = self.client.get_paginator(
+                "list_user_policies"
+            )
+            for page in get_user_inline_policies_paginator.paginate(UserName=user.name):
+                for policy in page["PolicyNames"]:
                     try:
-                        attached_role_policies = []
-                        list_attached_role_policies_paginator = (
-                            self.client.get_paginator("list_attached_role_policies")
+                        inline_user_policies.append(policy)
+                        # Get inline policies & their policy documents here
+                        inline_policy = self.client.get_user_policy(
+                            UserName=user.name, PolicyName=policy
+                        )
+                        inline_policies.append(
+                            Policy(
+                                name=policy,
+                                arn=user.arn,
+                                entity=user.name,
+                                type="Inline",
+                                attached=True,
+                                version_id="v1",
+                                document=inline_policy["PolicyDocument"],
+                            )
                         )
-                        for page in list_attached_role_policies_paginator.paginate(
-                            RoleName=role.name
-                        ):
-                            for policy in page["AttachedPolicies"]:
-                                attached_role_policies.append(policy)
-
-                        role.attached_policies = attached_role_policies
                     except ClientError as error:
                         if error.response["Error"]["Code"] == "NoSuchEntity":
                             logger.warning(
@@ -445,197 +472,155 @@ class IAM(AWSService):
                             logger.error(
                                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-
                     except Exception as error:
                         logger.error(
                             f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
-
+            user.inline_policies = inline_user_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __list_inline_user_policies__(self):
-        logger.info("IAM - List Inline User Policies...")
-        for user in self.users:
-            try:
-                inline_user_policies = []
-                get_user_inline_policies_paginator = self.client.get_paginator(
-                    "list_user_policies"
-                )
-                for page in get_user_inline_policies_paginator.paginate(
-                    UserName=user.name
-                ):
-                    for policy in page["PolicyNames"]:
-                        try:
-                            inline_user_policies.append(policy)
-                            # Get inline policies & their policy documents here
-                            inline_policy = self.client.get_user_policy(
-                                UserName=user.name, PolicyName=policy
-                            )
-                            inline_user_policy_doc = inline_policy["PolicyDocument"]
-                            self.policies.append(
-                                Policy(
-                                    name=policy,
-                                    arn=user.arn,
-                                    entity=user.name,
-                                    type="Inline",
-                                    attached=True,
-                                    version_id="v1",
-                                    document=inline_user_policy_doc,
-                                )
-                            )
-                        except ClientError as error:
-                            if error.response["Error"]["Code"] == "NoSuchEntity":
-                                logger.warning(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-                            else:
-                                logger.error(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-                        except Exception as error:
-                            logger.error(
-                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                            )
-                user.inline_policies = inline_user_policies
-            except ClientError as error:
-                if error.response["Error"]["Code"] == "NoSuchEntity":
-                    logger.warning(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                else:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-
     def __list_inline_group_policies__(self):
         logger.info("IAM - List Inline Group Policies...")
-        for group in self.groups:
-            try:
-                inline_group_policies = []
-                get_group_inline_policies_paginator = self.client.get_paginator(
-                    "list_group_policies"
-                )
-                for page in get_group_inline_policies_paginator.paginate(
-                    GroupName=group.name
-                ):
-                    for policy in page["PolicyNames"]:
-                        try:
-                            inline_group_policies.append(policy)
-                            # Get inline policies & their policy documents here:
-                            inline_policy = self.client.get_group_policy(
-                                GroupName=group.name, PolicyName=policy
+        # Each group gets its own list of inline policies, so they are added to the policies in the same order
+        groups_inline_policies = [(group, []) for group in self.groups]
+        self.__threading_call__(
+            self.__list_group_inline_policies__, groups_inline_policies
+        )
+        for _, inline_policies in groups_inline_policies:
+            self.policies.extend(inline_policies)
+
+    def __list_group_inline_policies__(self, group_inline_policies):
+        group, inline_policies = group_inline_policies
+        try:
+            inline_group_policies = []
+            get_group_inline_policies_paginator = self.client.get_paginator(
+                "list_group_policies"
+            )
+            for page in get_group_inline_policies_paginator.paginate(
+                GroupName=group.name
+            ):
+                for policy in page["PolicyNames"]:
+                    try:
+                        inline_group_policies.append(policy)
+                        # Get inline policies & their policy documents here
+                        inline_policy = self.client.get_group_policy(
+                            GroupName=group.name, PolicyName=policy
+                        )
+                        inline_policies.append(
+                            Policy(
+                                name=policy,
+                                arn=group.arn,
+                                entity=group.name,
+                                type="Inline",
+                                attached=True,
+                                version_id="v1",
+                                document=inline_policy["PolicyDocument"],
                             )
-                            inline_group_policy_doc = inline_policy["PolicyDocument"]
-                            self.policies.append(
-                                Policy(
-                                    name=policy,
-                                    arn=group.arn,
-                                    entity=group.name,
-                                    type="Inline",
-                                    attached=True,
-                                    version_id="v1",
-                                    document=inline_group_policy_doc,
-                                )
+                        )
+                    except ClientError as error:
+                        if error.response["Error"]["Code"] == "NoSuchEntity":
+                            logger.warning(
+                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-                        except ClientError as error:
-                            if error.response["Error"]["Code"] == "NoSuchEntity":
-                                logger.warning(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-                            else:
-                                logger.error(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-
-                        except Exception as error:
+                        else:
                             logger.error(
                                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                             )
-                group.inline_policies = inline_group_policies
-            except ClientError as error:
-                if error.response["Error"]["Code"] == "NoSuchEntity":
-                    logger.warning(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                else:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-
-            except Exception as error:
+                    except Exception as error:
+                        logger.error(
+                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+            group.inline_policies = inline_group_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
                 logger.error(
                     f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
     def __list_inline_role_policies__(self):
         logger.info("IAM - List Inline Role Policies...")
         if self.roles:
-            for role in self.roles:
-                try:
-                    inline_role_policies = []
-                    get_role_inline_policies_paginator = self.client.get_paginator(
-                        "list_role_policies"
-                    )
-                    for page in get_role_inline_policies_paginator.paginate(
-                        RoleName=role.name
-                    ):
-                        for policy in page["PolicyNames"]:
-                            try:
-                                inline_role_policies.append(policy)
-                                # Get inline policies & their policy documents here:
-                                inline_policy = self.client.get_role_policy(
-                                    RoleName=role.name, PolicyName=policy
-                                )
-                                inline_role_policy_doc = inline_policy["PolicyDocument"]
-                                self.policies.append(
-                                    Policy(
-                                        name=policy,
-                                        arn=role.arn,
-                                        entity=role.name,
-                                        type="Inline",
-                                        attached=True,
-                                        version_id="v1",
-                                        document=inline_role_policy_doc,
-                                    )
-                                )
-                            except ClientError as error:
-                                if error.response["Error"]["Code"] == "NoSuchEntity":
-                                    logger.warning(
-                                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                    )
-                                else:
-                                    logger.error(
-                                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                    )
-
-                            except Exception as error:
-                                logger.error(
-                                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                )
-
-                    role.inline_policies = inline_role_policies
+            # Each role gets its own list of inline policies, so they are added to the policies in the same order
+            roles_inline_policies = [(role, []) for role in self.roles]
+            self.__threading_call__(
+                self.__list_role_inline_policies__, roles_inline_policies
+            )
+            for _, inline_policies in roles_inline_policies:
+                self.policies.extend(inline_policies)
 
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+    def __list_role_inline_policies__(self, role_inline_policies):
+        role, inline_policies = role_inline_policies
+        try:
+            inline_role_policies = []
+            get_role_inline_policies_paginator = self.client.get_paginator(
+                "list_role_policies"
+            )
+            for page in get_role_inline_policies_paginator.paginate(RoleName=role.name):
+                for policy in page["PolicyNames"]:
+                    try:
+                        inline_role_policies.append(policy)
+                        # Get inline policies & their policy documents here
+                        inline_policy = self.client.get_role_policy(
+                            RoleName=role.name, PolicyName=policy
                         )
-                    else:
+                        inline_policies.append(
+                            Policy(
+                                name=policy,
+                                arn=role.arn,
+                                entity=role.name,
+                                type="Inline",
+                                attached=True,
+                                version_id="v1",
+                                document=inline_policy["PolicyDocument"],
+                            )
+                        )
+                    except ClientError as error:
+                        if error.response["Error"]["Code"] == "NoSuchEntity":
+                            logger.warning(
+                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                            )
+                        else:
+                            logger.error(
+                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                            )
+                    except Exception as error:
                         logger.error(
                             f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
-
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+            role.inline_policies = inline_role_policies
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
     def __list_entities_role_for_policy__(self, policy_arn):
         logger.info("IAM - List Entities Role For Policy...")
@@ -693,25 +678,21 @@ class IAM(AWSService):
         finally:
             return policies
 
-    def __list_policies_version__(self, policies):
-        logger.info("IAM - List Policies Version...")
+    def __list_policies_version__(self, policy):
         try:
-            for policy in policies:
-                try:
-                    policy_version = self.client.get_policy_version(
-                        PolicyArn=policy.arn, VersionId=policy.version_id
-                    )
-                    policy.document = policy_version["PolicyVersion"]["Document"]
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    continue
+            policy_version = self.client.get_policy_version(
+                PolicyArn=policy.arn, VersionId=policy.version_id
+            )
+            policy.document = policy_version["PolicyVersion"]["Document"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -754,71 +735,46 @@ class IAM(AWSService):
         finally:
             return server_certificates
 
-    def __list_tags_for_resource__(self):
-        logger.info("IAM - List Tags...")
+    def __list_role_tags__(self, role):
         try:
-            if self.roles:
-                for role in self.roles:
-                    try:
-                        response = self.client.list_role_tags(RoleName=role.name)[
-                            "Tags"
-                        ]
-                        role.tags = response
-                    except ClientError as error:
-                        if error.response["Error"]["Code"] == "NoSuchEntity":
-                            role.tags = []
-                        else:
-                            logger.error(
-                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                            )
-                    except Exception as error:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-
+            role.tags = self.client.list_role_tags(RoleName=role.name)["Tags"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                role.tags = []
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def __list_user_tags__(self, user):
         try:
-            for user in self.users:
-                try:
-                    response = self.client.list_user_tags(UserName=user.name)["Tags"]
-                    user.tags = response
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        user.tags = []
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-
+            user.tags = self.client.list_user_tags(UserName=user.name)["Tags"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                user.tags = []
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def __list_policy_tags__(self, policy):
         try:
-            for policy in self.policies:
-                try:
-                    if policy.type != "Inline":
-                        response = self.client.list_policy_tags(PolicyArn=policy.arn)[
-                            "Tags"
-                        ]
-                        policy.tags = response
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        policy.tags = []
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-
+            policy.tags = self.client.list_policy_tags(PolicyArn=policy.arn)["Tags"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                policy.tags = []
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -827,21 +783,14 @@ class IAM(AWSService):
     def __get_last_accessed_services__(self):
         logger.info("IAM - Getting Last Accessed Services ...")
         try:
+            # Start all the jobs before polling them, so AWS generates them at the same time
+            last_accessed_services_jobs = []
             for user in self.users:
                 try:
                     details = self.client.generate_service_last_accessed_details(
                         Arn=user.arn
                     )
-                    response = self.client.get_service_last_accessed_details(
-                        JobId=details["JobId"]
-                    )
-                    while response["JobStatus"] == "IN_PROGRESS":
-                        response = self.client.get_service_last_accessed_details(
-                            JobId=details["JobId"]
-                        )
-                    self.last_accessed_services[(user.name, user.arn)] = response.get(
-                        "ServicesLastAccessed", {}
-                    )
+                    last_accessed_services_jobs.append((user, details["JobId"]))
 
                 except ClientError as error:
                     if error.response["Error"]["Code"] == "NoSuchEntity":
@@ -857,35 +806,57 @@ class IAM(AWSService):
                         f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                     )
 
+            self.__threading_call__(
+                self.__get_service_last_accessed_details__, last_accessed_services_jobs
+            )
+
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_access_keys_metadata__(self):
-        logger.info("IAM - Getting Access Keys Metadata ...")
+    def __get_service_last_accessed_details__(self, last_accessed_services_job):
+        user, job_id = last_accessed_services_job
         try:
-            for user in self.users:
-                try:
-                    paginator = self.client.get_paginator("list_access_keys")
-                    self.access_keys_metadata[(user.name, user.arn)] = []
-                    for response in paginator.paginate(UserName=user.name):
-                        self.access_keys_metadata[(user.name, user.arn)] = response[
-                            "AccessKeyMetadata"
-                        ]
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+            response = self.__wait_for_job__(
+                lambda: self.client.get_service_last_accessed_details(JobId=job_id),
+                lambda response: response["JobStatus"] != "IN_PROGRESS",
+            )
+            self.last_accessed_services[(user.name, user.arn)] = response.get(
+                "ServicesLastAccessed", {}
+            )
+
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def __get_access_keys_metadata__(self, user):
+        try:
+            paginator = self.client.get_paginator("list_access_keys")
+            self.access_keys_metadata[(user.name, user.arn)] = []
+            for response in paginator.paginate(UserName=user.name):
+                self.access_keys_metadata[(user.name, user.arn)] = response[
+                    "AccessKeyMetadata"
+                ]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
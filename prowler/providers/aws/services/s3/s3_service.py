@@ -1,5 +1,4 @@
 import json
-import threading
 from typing import Optional
 
 from botocore.client import ClientError
@@ -18,75 +17,62 @@ class S3(AWSService):
         self.account_arn_template = f"arn:{self.audited_partition}:s3:{self.region}:{self.audited_account}:account"
         self.regions_with_buckets = []
         self.buckets = self.__list_buckets__(provider)
-        self.__threading_call__(self.__get_bucket_versioning__)
-        self.__threading_call__(self.__get_bucket_logging__)
-        self.__threading_call__(self.__get_bucket_policy__)
-        self.__threading_call__(self.__get_bucket_acl__)
-        self.__threading_call__(self.__get_public_access_block__)
-        self.__threading_call__(self.__get_bucket_encryption__)
-        self.__threading_call__(self.__get_bucket_ownership_controls__)
-        self.__threading_call__(self.__get_object_lock_configuration__)
-        self.__threading_call__(self.__get_bucket_tagging__)
+        # All the configuration of each bucket is retrieved in the same task
+        self.__threading_call__(self.__get_bucket_configuration__, self.buckets)
 
-    # In the S3 service we override the "__threading_call__" method because we spawn a process per bucket instead of per region
-    # TODO: Replace the above function with the service __threading_call__ using the buckets as the iterator
-    def __threading_call__(self, call):
-        threads = []
-        for bucket in self.buckets:
-            if bucket.region in self.regional_clients:
-                regional_client = self.regional_clients[bucket.region]
-                threads.append(
-                    threading.Thread(target=call, args=(bucket, regional_client))
-                )
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+    def __get_bucket_configuration__(self, bucket):
+        if bucket.region in self.regional_clients:
+            regional_client = self.regional_clients[bucket.region]
+            self.__get_bucket_versioning__(bucket, regional_client)
+            self.__get_bucket_logging__(bucket, regional_client)
+            self.__get_bucket_policy__(bucket, regional_client)
+            self.__get_bucket_acl__(bucket, regional_client)
+            self.__get_public_access_block__(bucket, regional_client)
+            self.__get_bucket_encryption__(bucket, regional_client)
+            self.__get_bucket_ownership_controls__(bucket, regional_client)
+            self.__get_object_lock_configuration__(bucket, regional_client)
+            self.__get_bucket_tagging__(bucket, regional_client)
 
     def __list_buckets__(self, provider):
         logger.info("S3 - Listing buckets...")
         buckets = []
         try:
             list_buckets = self.client.list_buckets()
+            audited_buckets = []
             for bucket in list_buckets["Buckets"]:
-                try:
-                    bucket_region = self.client.get_bucket_location(
-                        Bucket=bucket["Name"]
-                    )["LocationConstraint"]
-                    if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
-                        bucket_region = "eu-west-1"
-                    if not bucket_region:  # If None, bucket_region is us-east-1
-                        bucket_region = "us-east-1"
-                    # Arn
-                    arn = f"arn:{self.audited_partition}:s3:::{bucket['Name']}"
-                    if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
-                    ):
-                        self.regions_with_buckets.append(bucket_region)
-                        # Check if there are filter regions
-                        if provider.identity.audited_regions:
-                            if bucket_region in provider.identity.audited_regions:
-                                buckets.append(
-                                    Bucket(
-                                        name=bucket["Name"],
-                                        arn=arn,
-                                        region=bucket_region,
-                                    )
-                                )
-                        else:
-                            buckets.append(
-                                Bucket(
-                                    name=bucket["Name"], arn=arn, region=bucket_region
-                                )
+                # Arn
+                arn = f"arn:{self.audited_partition}:s3:::{bucket['Name']}"
+                if not self.audit_resources or (
+                    is_resource_filtered(arn, self.audit_resources)
+                ):
+                    audited_buckets.append((bucket["Name"], arn))
+            # Get the location of the buckets concurrently
+            buckets_region = {}
+
+            def get_bucket_region(bucket_name):
+                buckets_region[bucket_name] = self.__get_bucket_region__(bucket_name)
+
+            self.__threading_call__(
+                get_bucket_region, [bucket_name for bucket_name, _ in audited_buckets]
+            )
+            for bucket_name, arn in audited_buckets:
+                bucket_region = buckets_region.get(bucket_name)
+                if not bucket_region:
+                    continue
+                self.regions_with_buckets.append(bucket_region)
+                # Check if there are filter regions
+                if provider.identity.audited_regions:
+                    if bucket_region in provider.identity.audited_regions:
+                        buckets.append(
+                            Bucket(
+                                name=bucket_name,
+                                arn=arn,
+                                region=bucket_region,
                             )
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchBucket":
-                        logger.warning(
-                            f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
-                except Exception as error:
-                    logger.error(
-                        f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                else:
+                    buckets.append(
+                        Bucket(name=bucket_name, arn=arn, region=bucket_region)
                     )
         except Exception as error:
             logger.error(
@@ -94,6 +80,27 @@ class S3(AWSService):
             )
         return buckets
 
+    def __get_bucket_region__(self, bucket_name):
+        try:
+            bucket_region = self.client.get_bucket_location(Bucket=bucket_name)[
+                "LocationConstraint"
+            ]
+            if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
+                bucket_region = "eu-west-1"
+            if not bucket_region:  # If None, bucket_region is us-east-1
+                bucket_region = "us-east-1"
+            return bucket_region
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchBucket":
+                logger.warning(
+                    f"{bucket_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        except Exception as error:
+            logger.error(
+                f"{bucket_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return None
+
     def __get_bucket_versioning__(self, bucket, regional_client):
         logger.info("S3 - Get buckets versioning...")
         try:
@@ -1,6 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import local
+
 from prowler.lib.logger import logger
 from prowler.providers.azure.azure_provider import AzureProvider
 
+# Number of threads shared by all the Azure services to make the API calls
+AZURE_MAX_WORKERS = 20
+
+# Set in the threads of the Azure thread pool, so the calls made from them are not submitted to the same pool
+azure_thread_pool_worker = local()
+
+
+def __set_azure_thread_pool_worker__():
+    azure_thread_pool_worker.is_worker = True
+
+
+azure_thread_pool = ThreadPoolExecutor(
+    max_workers=AZURE_MAX_WORKERS, initializer=__set_azure_thread_pool_worker__
+)
+
 
 class AzureService:
     def __init__(
@@ -20,6 +39,40 @@ class AzureService:
         self.audit_config = provider.audit_config
         self.fixer_config = provider.fixer_config
 
+    def __threading_call__(self, call, iterator) -> list:
+        """__threading_call__ calls call with each item of the iterator concurrently and returns the results in the same order as the items.
+
+        When it is called from a thread of the pool, e.g. nested in another __threading_call__, the calls are run inline, since waiting for the pool from one of its threads can exhaust it.
+        """
+        if getattr(azure_thread_pool_worker, "is_worker", False):
+            get_results = [partial(call, item) for item in iterator]
+        else:
+            get_results = [
+                azure_thread_pool.submit(call, item).result for item in iterator
+            ]
+        results = []
+        for get_result in get_results:
+            try:
+                results.append(get_result())
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                results.append(None)
+        return results
+
+    def __subscriptions_threading_call__(self, call) -> dict:
+        """__subscriptions_threading_call__ calls call(subscription, client) for each subscription concurrently and returns the results by subscription, in the same order as the subscriptions."""
+        return dict(
+            zip(
+                self.clients,
+                self.__threading_call__(
+                    lambda subscription_client: call(*subscription_client),
+                    self.clients.items(),
+                ),
+            )
+        )
+
     def __set_clients__(self, identity, session, service, region_config):
         clients = {}
         try:
@@ -16,42 +16,42 @@ class AKS(AzureService):
 
     def __get_clusters__(self):
         logger.info("AKS - Getting clusters...")
-        clusters = {}
+        return self.__subscriptions_threading_call__(self.__get_subscription_clusters__)
 
-        for subscription_name, client in self.clients.items():
-            try:
-                clusters_list = client.managed_clusters.list()
-                clusters.update({subscription_name: {}})
+    def __get_subscription_clusters__(self, subscription_name, client):
+        clusters = {}
+        try:
+            clusters_list = client.managed_clusters.list()
 
-                for cluster in clusters_list:
-                    if getattr(cluster, "kubernetes_version", None):
-                        clusters[subscription_name].update(
-                            {
-                                cluster.id: Cluster(
-                                    name=cluster.name,
-                                    public_fqdn=cluster.fqdn,
-                                    private_fqdn=cluster.private_fqdn,
-                                    location=cluster.location,
-                                    network_policy=(
-                                        getattr(
-                                            cluster.network_profile,
-                                            "network_policy",
-                                            None,
-                                        )
-                                        if getattr(cluster, "network_profile", None)
-                                        else None
-                                    ),
-                                    agent_pool_profiles=getattr(
-                                        cluster, "agent_pool_profiles", []
-                                    ),
-                                    rbac_enabled=getattr(cluster, "enable_rbac", False),
-                                )
-                            }
-                        )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+            for cluster in clusters_list:
+                if getattr(cluster, "kubernetes_version", None):
+                    clusters.update(
+                        {
+                            cluster.id: Cluster(
+                                name=cluster.name,
+                                public_fqdn=cluster.fqdn,
+                                private_fqdn=cluster.private_fqdn,
+                                location=cluster.location,
+                                network_policy=(
+                                    getattr(
+                                        cluster.network_profile,
+                                        "network_policy",
+                                        None,
+                                    )
+                                    if getattr(cluster, "network_profile", None)
+                                    else None
+                                ),
+                                agent_pool_profiles=getattr(
+                                    cluster, "agent_pool_profiles", []
+                                ),
+                                rbac_enabled=getattr(cluster, "enable_rbac", False),
+                            )
+                        }
+                    )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
         return clusters
 
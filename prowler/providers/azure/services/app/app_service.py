@@ -18,53 +18,53 @@ class App(AzureService):
 
     def __get_apps__(self):
         logger.info("App - Getting apps...")
-        apps = {}
+        return self.__subscriptions_threading_call__(self.__get_subscription_apps__)
 
-        for subscription_name, client in self.clients.items():
-            try:
-                apps_list = client.web_apps.list()
-                apps.update({subscription_name: {}})
+    def __get_subscription_apps__(self, subscription_name, client):
+        apps = {}
+        try:
+            apps_list = client.web_apps.list()
 
-                for app in apps_list:
-                    platform_auth = getattr(
-                        client.web_apps.get_auth_settings_v2(
-                            resource_group_name=app.resource_group, name=app.name
-                        ),
-                        "platform",
-                        None,
-                    )
+            for app in apps_list:
+                platform_auth = getattr(
+                    client.web_apps.get_auth_settings_v2(
+                        resource_group_name=app.resource_group, name=app.name
+                    ),
+                    "platform",
+                    None,
+                )
 
-                    apps[subscription_name].update(
-                        {
-                            app.name: WebApp(
-                                resource_id=app.id,
-                                auth_enabled=(
-                                    getattr(platform_auth, "enabled", False)
-                                    if platform_auth
-                                    else False
-                                ),
-                                configurations=client.web_apps.get_configuration(
-                                    resource_group_name=app.resource_group,
-                                    name=app.name,
-                                ),
-                                client_cert_mode=self.__get_client_cert_mode__(
-                                    getattr(app, "client_cert_enabled", False),
-                                    getattr(app, "client_cert_mode", "Ignore"),
-                                ),
-                                monitor_diagnostic_settings=self.__get_app_monitor_settings__(
-                                    app.name, app.resource_group, subscription_name
-                                ),
-                                https_only=getattr(app, "https_only", False),
-                                identity=getattr(app, "identity", None),
-                                location=app.location,
-                                kind=getattr(app, "kind", "app"),
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                apps.update(
+                    {
+                        app.name: WebApp(
+                            resource_id=app.id,
+                            auth_enabled=(
+                                getattr(platform_auth, "enabled", False)
+                                if platform_auth
+                                else False
+                            ),
+                            configurations=client.web_apps.get_configuration(
+                                resource_group_name=app.resource_group,
+                                name=app.name,
+                            ),
+                            client_cert_mode=self.__get_client_cert_mode__(
+                                getattr(app, "client_cert_enabled", False),
+                                getattr(app, "client_cert_mode", "Ignore"),
+                            ),
+                            monitor_diagnostic_settings=self.__get_app_monitor_settings__(
+                                app.name, app.resource_group, subscription_name
+                            ),
+                            https_only=getattr(app, "https_only", False),
+                            identity=getattr(app, "identity", None),
+                            location=app.location,
+                            kind=getattr(app, "kind", "app"),
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
         return apps
 
@@ -15,27 +15,29 @@ class AppInsights(AzureService):
 
     def __get_components__(self):
         logger.info("AppInsights - Getting components...")
-        components = {}
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_components__
+        )
 
-        for subscription_name, client in self.clients.items():
-            try:
-                components_list = client.components.list()
-                components.update({subscription_name: {}})
-
-                for component in components_list:
-                    components[subscription_name].update(
-                        {
-                            component.app_id: Component(
-                                resource_id=component.id,
-                                resource_name=component.name,
-                                location=component.location,
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+    def __get_subscription_components__(self, subscription_name, client):
+        components = {}
+        try:
+            components_list = client.components.list()
+
+            for component in components_list:
+                components.update(
+                    {
+                        component.app_id: Component(
+                            resource_id=component.id,
+                            resource_name=component.name,
+                            location=component.location,
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
         return components
 
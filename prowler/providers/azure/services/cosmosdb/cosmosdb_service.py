@@ -15,29 +15,30 @@ class CosmosDB(AzureService):
 
     def __get_accounts__(self):
         logger.info("CosmosDB - Getting accounts...")
-        accounts = {}
-        for subscription, client in self.clients.items():
-            try:
-                accounts_list = client.database_accounts.list()
-                accounts.update({subscription: []})
-                for account in accounts_list:
-                    accounts[subscription].append(
-                        Account(
-                            id=account.id,
-                            name=account.name,
-                            kind=account.kind,
-                            location=account.location,
-                            type=account.type,
-                            tags=account.tags,
-                            is_virtual_network_filter_enabled=account.is_virtual_network_filter_enabled,
-                            private_endpoint_connections=account.private_endpoint_connections,
-                            disable_local_auth=account.disable_local_auth,
-                        )
+        return self.__subscriptions_threading_call__(self.__get_subscription_accounts__)
+
+    def __get_subscription_accounts__(self, subscription, client):
+        accounts = []
+        try:
+            accounts_list = client.database_accounts.list()
+            for account in accounts_list:
+                accounts.append(
+                    Account(
+                        id=account.id,
+                        name=account.name,
+                        kind=account.kind,
+                        location=account.location,
+                        type=account.type,
+                        tags=account.tags,
+                        is_virtual_network_filter_enabled=account.is_virtual_network_filter_enabled,
+                        private_endpoint_connections=account.private_endpoint_connections,
+                        disable_local_auth=account.disable_local_auth,
                     )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return accounts
 
 
@@ -17,69 +17,79 @@ class IAM(AzureService):
 
     def __get_roles__(self):
         logger.info("IAM - Getting roles...")
-        builtin_roles = {}
-        custom_roles = {}
-        for subscription, client in self.clients.items():
-            try:
-                builtin_roles.update({subscription: []})
-                custom_roles.update({subscription: []})
-                all_roles = client.role_definitions.list(
-                    scope=f"/subscriptions/{self.subscriptions[subscription]}",
-                )
-                for role in all_roles:
-                    if role.role_type == "CustomRole":
-                        custom_roles[subscription].append(
-                            Role(
-                                id=role.id,
-                                name=role.role_name,
-                                type=role.role_type,
-                                assignable_scopes=role.assignable_scopes,
-                                permissions=role.permissions,
-                            )
+        roles = self.__subscriptions_threading_call__(self.__get_subscription_roles__)
+        builtin_roles = {
+            subscription: subscription_roles[0]
+            for subscription, subscription_roles in roles.items()
+        }
+        custom_roles = {
+            subscription: subscription_roles[1]
+            for subscription, subscription_roles in roles.items()
+        }
+        return builtin_roles, custom_roles
+
+    def __get_subscription_roles__(self, subscription, client):
+        builtin_roles = []
+        custom_roles = []
+        try:
+            all_roles = client.role_definitions.list(
+                scope=f"/subscriptions/{self.subscriptions[subscription]}",
+            )
+            for role in all_roles:
+                if role.role_type == "CustomRole":
+                    custom_roles.append(
+                        Role(
+                            id=role.id,
+                            name=role.role_name,
+                            type=role.role_type,
+                            assignable_scopes=role.assignable_scopes,
+                            permissions=role.permissions,
                         )
-                    else:
-                        builtin_roles[subscription].append(
-                            Role(
-                                id=role.id,
-                                name=role.role_name,
-                                type=role.role_type,
-                                assignable_scopes=role.assignable_scopes,
-                                permissions=role.permissions,
-                            )
+                    )
+                else:
+                    builtin_roles.append(
+                        Role(
+                            id=role.id,
+                            name=role.role_name,
+                            type=role.role_type,
+                            assignable_scopes=role.assignable_scopes,
+                            permissions=role.permissions,
                         )
-            except Exception as error:
-                logger.error(f"Subscription name: {subscription}")
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+                    )
+        except Exception as error:
+            logger.error(f"Subscription name: {subscription}")
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return builtin_roles, custom_roles
 
     def __get_role_assignments__(self):
         logger.info("IAM - Getting role assignments...")
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_role_assignments__
+        )
+
+    def __get_subscription_role_assignments__(self, subscription, client):
         role_assignments = {}
-        for subscription, client in self.clients.items():
-            try:
-                role_assignments.update({subscription: {}})
-                all_role_assignments = client.role_assignments.list_for_subscription(
-                    filter="atScope()"
-                )
-                for role_assignment in all_role_assignments:
-                    role_assignments[subscription].update(
-                        {
-                            role_assignment.id: RoleAssignment(
-                                agent_id=role_assignment.principal_id,
-                                agent_type=role_assignment.principal_type,
-                                role_id=role_assignment.role_definition_id.split("/")[
-                                    -1
-                                ],
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(f"Subscription name: {subscription}")
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        try:
+            all_role_assignments = client.role_assignments.list_for_subscription(
+                filter="atScope()"
+            )
+            for role_assignment in all_role_assignments:
+                role_assignments.update(
+                    {
+                        role_assignment.id: RoleAssignment(
+                            agent_id=role_assignment.principal_id,
+                            agent_type=role_assignment.principal_type,
+                            role_id=role_assignment.role_definition_id.split("/")[-1],
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(f"Subscription name: {subscription}")
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return role_assignments
 
 
@@ -25,43 +25,69 @@ class KeyVault(AzureService):
 
     def __get_key_vaults__(self, provider):
         logger.info("KeyVault - Getting key_vaults...")
-        key_vaults = {}
-        for subscription, client in self.clients.items():
-            try:
-                key_vaults.update({subscription: []})
-                key_vaults_list = client.vaults.list()
-                for keyvault in key_vaults_list:
-                    resource_group = keyvault.id.split("/")[4]
-                    keyvault_name = keyvault.name
-                    keyvault_properties = client.vaults.get(
-                        resource_group, keyvault_name
-                    ).properties
-                    keys = self.__get_keys__(
-                        subscription, resource_group, keyvault_name, provider
-                    )
-                    secrets = self.__get_secrets__(
-                        subscription, resource_group, keyvault_name
-                    )
-                    key_vaults[subscription].append(
-                        KeyVaultInfo(
-                            id=getattr(keyvault, "id", ""),
-                            name=getattr(keyvault, "name", ""),
-                            location=getattr(keyvault, "location", ""),
-                            resource_group=resource_group,
-                            properties=keyvault_properties,
-                            keys=keys,
-                            secrets=secrets,
-                            monitor_diagnostic_settings=self.__get_vault_monitor_settings__(
-                                keyvault_name, resource_group, subscription
-                            ),
-                        )
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+        key_vaults_list = self.__subscriptions_threading_call__(
+            self.__list_key_vaults__
+        )
+        # The key vaults of all the subscriptions are described concurrently
+        subscription_key_vaults = [
+            (subscription, keyvault)
+            for subscription, keyvaults in key_vaults_list.items()
+            for keyvault in keyvaults
+        ]
+        key_vaults = {subscription: [] for subscription in key_vaults_list}
+        for (subscription, _), key_vault in zip(
+            subscription_key_vaults,
+            self.__threading_call__(
+                lambda subscription_key_vault: self.__get_key_vault__(
+                    *subscription_key_vault, provider
+                ),
+                subscription_key_vaults,
+            ),
+        ):
+            if key_vault:
+                key_vaults[subscription].append(key_vault)
         return key_vaults
 
+    def __list_key_vaults__(self, subscription, client):
+        key_vaults = []
+        try:
+            for keyvault in client.vaults.list():
+                key_vaults.append(keyvault)
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return key_vaults
+
+    def __get_key_vault__(self, subscription, keyvault, provider):
+        try:
+            client = self.clients[subscription]
+            resource_group = keyvault.id.split("/")[4]
+            keyvault_name = keyvault.name
+            keyvault_properties = client.vaults.get(
+                resource_group, keyvault_name
+            ).properties
+            keys = self.__get_keys__(
+                subscription, resource_group, keyvault_name, provider
+            )
+            secrets = self.__get_secrets__(subscription, resource_group, keyvault_name)
+            return KeyVaultInfo(
+                id=getattr(keyvault, "id", ""),
+                name=getattr(keyvault, "name", ""),
+                location=getattr(keyvault, "location", ""),
+                resource_group=resource_group,
+                properties=keyvault_properties,
+                keys=keys,
+                secrets=secrets,
+                monitor_diagnostic_settings=self.__get_vault_monitor_settings__(
+                    keyvault_name, resource_group, subscription
+                ),
+            )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
     def __get_keys__(self, subscription, resource_group, keyvault_name, provider):
         logger.info(f"KeyVault - Getting keys for {keyvault_name}...")
         keys = []
@@ -18,21 +18,13 @@ class Monitor(AzureService):
 
     def __get_diagnostics_settings__(self):
         logger.info("Monitor - Getting diagnostics settings...")
-        diagnostics_settings_list = []
-        diagnostics_settings = {}
-        for subscription, client in self.clients.items():
-            try:
-                diagnostics_settings_list = self.diagnostic_settings_with_uri(
-                    subscription,
-                    f"subscriptions/{self.subscriptions[subscription]}/",
-                    client,
-                )
-                diagnostics_settings.update({subscription: diagnostics_settings_list})
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-        return diagnostics_settings
+        return self.__subscriptions_threading_call__(
+            lambda subscription, client: self.diagnostic_settings_with_uri(
+                subscription,
+                f"subscriptions/{self.subscriptions[subscription]}/",
+                client,
+            )
+        )
 
     def diagnostic_settings_with_uri(self, subscription, uri, client):
         diagnostics_settings = []
@@ -60,25 +52,28 @@ class Monitor(AzureService):
 
     def get_alert_rules(self):
         logger.info("Monitor - Getting alert rules...")
-        alert_rules = {}
-        for subscription, client in self.clients.items():
-            try:
-                alert_rules.update({subscription: []})
-                rules = client.activity_log_alerts.list_by_subscription_id()
-                for rule in rules:
-                    alert_rules[subscription].append(
-                        AlertRule(
-                            id=rule.id,
-                            name=rule.name,
-                            condition=rule.condition,
-                            enabled=rule.enabled,
-                            description=rule.description,
-                        )
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_alert_rules__
+        )
+
+    def __get_subscription_alert_rules__(self, subscription, client):
+        alert_rules = []
+        try:
+            rules = client.activity_log_alerts.list_by_subscription_id()
+            for rule in rules:
+                alert_rules.append(
+                    AlertRule(
+                        id=rule.id,
+                        name=rule.name,
+                        condition=rule.condition,
+                        enabled=rule.enabled,
+                        description=rule.description,
                     )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return alert_rules
 
 
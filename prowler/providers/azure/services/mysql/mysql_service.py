@@ -16,28 +16,31 @@ class MySQL(AzureService):
 
     def __get_flexible_servers__(self):
         logger.info("MySQL - Getting servers...")
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_flexible_servers__
+        )
+
+    def __get_subscription_flexible_servers__(self, subscription_name, client):
         servers = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                servers_list = client.servers.list()
-                servers.update({subscription_name: {}})
-                for server in servers_list:
-                    servers[subscription_name].update(
-                        {
-                            server.name: FlexibleServer(
-                                resource_id=server.id,
-                                location=server.location,
-                                version=server.version,
-                                configurations=self.__get_configurations__(
-                                    client, server.id.split("/")[4], server.name
-                                ),
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        try:
+            servers_list = client.servers.list()
+            for server in servers_list:
+                servers.update(
+                    {
+                        server.name: FlexibleServer(
+                            resource_id=server.id,
+                            location=server.location,
+                            version=server.version,
+                            configurations=self.__get_configurations__(
+                                client, server.id.split("/")[4], server.name
+                            ),
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return servers
 
     def __get_configurations__(self, client, resource_group, server_name):
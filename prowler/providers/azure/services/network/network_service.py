@@ -18,51 +18,55 @@ class Network(AzureService):
 
     def __get_security_groups__(self):
         logger.info("Network - Getting Network Security Groups...")
-        security_groups = {}
-        for subscription, client in self.clients.items():
-            try:
-                security_groups.update({subscription: []})
-                security_groups_list = client.network_security_groups.list_all()
-                for security_group in security_groups_list:
-                    security_groups[subscription].append(
-                        SecurityGroup(
-                            id=security_group.id,
-                            name=security_group.name,
-                            location=security_group.location,
-                            security_rules=security_group.security_rules,
-                        )
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_security_groups__
+        )
+
+    def __get_subscription_security_groups__(self, subscription, client):
+        security_groups = []
+        try:
+            security_groups_list = client.network_security_groups.list_all()
+            for security_group in security_groups_list:
+                security_groups.append(
+                    SecurityGroup(
+                        id=security_group.id,
+                        name=security_group.name,
+                        location=security_group.location,
+                        security_rules=security_group.security_rules,
                     )
-
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return security_groups
 
     def __get_network_watchers__(self):
         logger.info("Network - Getting Network Watchers...")
-        network_watchers = {}
-        for subscription, client in self.clients.items():
-            try:
-                network_watchers.update({subscription: []})
-                network_watchers_list = client.network_watchers.list_all()
-                for network_watcher in network_watchers_list:
-                    flow_logs = self.__get_flow_logs__(
-                        subscription, network_watcher.name
-                    )
-                    network_watchers[subscription].append(
-                        NetworkWatcher(
-                            id=network_watcher.id,
-                            name=network_watcher.name,
-                            location=network_watcher.location,
-                            flow_logs=flow_logs,
-                        )
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_network_watchers__
+        )
+
+    def __get_subscription_network_watchers__(self, subscription, client):
+        network_watchers = []
+        try:
+            network_watchers_list = client.network_watchers.list_all()
+            for network_watcher in network_watchers_list:
+                flow_logs = self.__get_flow_logs__(subscription, network_watcher.name)
+                network_watchers.append(
+                    NetworkWatcher(
+                        id=network_watcher.id,
+                        name=network_watcher.name,
+                        location=network_watcher.location,
+                        flow_logs=flow_logs,
                     )
-
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return network_watchers
 
     def __get_flow_logs__(self, subscription, network_watcher_name):
@@ -74,47 +78,53 @@ class Network(AzureService):
 
     def __get_bastion_hosts__(self):
         logger.info("Network - Getting Bastion Hosts...")
-        bastion_hosts = {}
-        for subscription, client in self.clients.items():
-            try:
-                bastion_hosts.update({subscription: []})
-                bastion_hosts_list = client.bastion_hosts.list()
-                for bastion_host in bastion_hosts_list:
-                    bastion_hosts[subscription].append(
-                        BastionHost(
-                            id=bastion_host.id,
-                            name=bastion_host.name,
-                            location=bastion_host.location,
-                        )
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_bastion_hosts__
+        )
+
+    def __get_subscription_bastion_hosts__(self, subscription, client):
+        bastion_hosts = []
+        try:
+            bastion_hosts_list = client.bastion_hosts.list()
+            for bastion_host in bastion_hosts_list:
+                bastion_hosts.append(
+                    BastionHost(
+                        id=bastion_host.id,
+                        name=bastion_host.name,
+                        location=bastion_host.location,
                     )
-
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return bastion_hosts
 
     def __get_public_ip_addresses__(self):
         logger.info("Network - Getting Public IP Addresses...")
-        public_ip_addresses = {}
-        for subscription, client in self.clients.items():
-            try:
-                public_ip_addresses.update({subscription: []})
-                public_ip_addresses_list = client.public_ip_addresses.list_all()
-                for public_ip_address in public_ip_addresses_list:
-                    public_ip_addresses[subscription].append(
-                        PublicIp(
-                            id=public_ip_address.id,
-                            name=public_ip_address.name,
-                            location=public_ip_address.location,
-                            ip_address=public_ip_address.ip_address,
-                        )
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_public_ip_addresses__
+        )
+
+    def __get_subscription_public_ip_addresses__(self, subscription, client):
+        public_ip_addresses = []
+        try:
+            public_ip_addresses_list = client.public_ip_addresses.list_all()
+            for public_ip_address in public_ip_addresses_list:
+                public_ip_addresses.append(
+                    PublicIp(
+                        id=public_ip_address.id,
+                        name=public_ip_address.name,
+                        location=public_ip_address.location,
+                        ip_address=public_ip_address.ip_address,
                     )
-
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return public_ip_addresses
 
 
@@ -15,26 +15,28 @@ class Policy(AzureService):
 
     def __get_policy_assigments__(self):
         logger.info("Policy - Getting policy assigments...")
-        policy_assigments = {}
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_policy_assigments__
+        )
 
-        for subscription_name, client in self.clients.items():
-            try:
-                policy_assigments_list = client.policy_assignments.list()
-                policy_assigments.update({subscription_name: {}})
-
-                for policy_assigment in policy_assigments_list:
-                    policy_assigments[subscription_name].update(
-                        {
-                            policy_assigment.name: PolicyAssigment(
-                                id=policy_assigment.id,
-                                enforcement_mode=policy_assigment.enforcement_mode,
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+    def __get_subscription_policy_assigments__(self, subscription_name, client):
+        policy_assigments = {}
+        try:
+            policy_assigments_list = client.policy_assignments.list()
+
+            for policy_assigment in policy_assigments_list:
+                policy_assigments.update(
+                    {
+                        policy_assigment.name: PolicyAssigment(
+                            id=policy_assigment.id,
+                            enforcement_mode=policy_assigment.enforcement_mode,
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
         return policy_assigments
 
@@ -14,56 +14,59 @@ class PostgreSQL(AzureService):
 
     def __get_flexible_servers__(self):
         logger.info("PostgreSQL - Getting PostgreSQL servers...")
-        flexible_servers = {}
-        for subscription, client in self.clients.items():
-            try:
-                flexible_servers.update({subscription: []})
-                flexible_servers_list = client.servers.list()
-                for postgresql_server in flexible_servers_list:
-                    resource_group = self.__get_resource_group__(postgresql_server.id)
-                    require_secure_transport = self.__get_require_secure_transport__(
-                        subscription, resource_group, postgresql_server.name
-                    )
-                    log_checkpoints = self.__get_log_checkpoints__(
-                        subscription, resource_group, postgresql_server.name
-                    )
-                    log_disconnections = self.__get_log_disconnections__(
-                        subscription, resource_group, postgresql_server.name
-                    )
-                    log_connections = self.__get_log_connections__(
-                        subscription, resource_group, postgresql_server.name
-                    )
-                    connection_throttling = self.__get_connection_throttling__(
-                        subscription, resource_group, postgresql_server.name
-                    )
-                    log_retention_days = self.__get_log_retention_days__(
-                        subscription, resource_group, postgresql_server.name
-                    )
-                    firewall = self.__get_firewall__(
-                        subscription, resource_group, postgresql_server.name
-                    )
-                    location = self.__get_location__(
-                        subscription, resource_group, postgresql_server.name
-                    )
-                    flexible_servers[subscription].append(
-                        Server(
-                            id=postgresql_server.id,
-                            name=postgresql_server.name,
-                            resource_group=resource_group,
-                            require_secure_transport=require_secure_transport,
-                            log_checkpoints=log_checkpoints,
-                            log_connections=log_connections,
-                            log_disconnections=log_disconnections,
-                            connection_throttling=connection_throttling,
-                            log_retention_days=log_retention_days,
-                            firewall=firewall,
-                            location=location,
-                        )
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_flexible_servers__
+        )
+
+    def __get_subscription_flexible_servers__(self, subscription, client):
+        flexible_servers = []
+        try:
+            flexible_servers_list = client.servers.list()
+            for postgresql_server in flexible_servers_list:
+                resource_group = self.__get_resource_group__(postgresql_server.id)
+                require_secure_transport = self.__get_require_secure_transport__(
+                    subscription, resource_group, postgresql_server.name
+                )
+                log_checkpoints = self.__get_log_checkpoints__(
+                    subscription, resource_group, postgresql_server.name
+                )
+                log_disconnections = self.__get_log_disconnections__(
+                    subscription, resource_group, postgresql_server.name
+                )
+                log_connections = self.__get_log_connections__(
+                    subscription, resource_group, postgresql_server.name
+                )
+                connection_throttling = self.__get_connection_throttling__(
+                    subscription, resource_group, postgresql_server.name
+                )
+                log_retention_days = self.__get_log_retention_days__(
+                    subscription, resource_group, postgresql_server.name
+                )
+                firewall = self.__get_firewall__(
+                    subscription, resource_group, postgresql_server.name
+                )
+                location = self.__get_location__(
+                    subscription, resource_group, postgresql_server.name
+                )
+                flexible_servers.append(
+                    Server(
+                        id=postgresql_server.id,
+                        name=postgresql_server.name,
+                        resource_group=resource_group,
+                        require_secure_transport=require_secure_transport,
+                        log_checkpoints=log_checkpoints,
+                        log_connections=log_connections,
+                        log_disconnections=log_disconnections,
+                        connection_throttling=connection_throttling,
+                        log_retention_days=log_retention_days,
+                        firewall=firewall,
+                        location=location,
                     )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return flexible_servers
 
     def __get_resource_group__(self, id):
@@ -21,61 +21,73 @@ class Storage(AzureService):
 
     def __get_storage_accounts__(self):
         logger.info("Storage - Getting storage accounts...")
-        storage_accounts = {}
-        for subscription, client in self.clients.items():
-            try:
-                storage_accounts.update({subscription: []})
-                storage_accounts_list = client.storage_accounts.list()
-                for storage_account in storage_accounts_list:
-                    parts = storage_account.id.split("/")
-                    if "resourceGroups" in parts:
-                        resouce_name_index = parts.index("resourceGroups") + 1
-                        resouce_group_name = parts[resouce_name_index]
-                    else:
-                        resouce_group_name = None
-                    key_expiration_period_in_days = None
-                    if storage_account.key_policy:
-                        key_expiration_period_in_days = (
-                            storage_account.key_policy.key_expiration_period_in_days
-                        )
-                    storage_accounts[subscription].append(
-                        Account(
-                            id=storage_account.id,
-                            name=storage_account.name,
-                            resouce_group_name=resouce_group_name,
-                            enable_https_traffic_only=storage_account.enable_https_traffic_only,
-                            infrastructure_encryption=storage_account.encryption.require_infrastructure_encryption,
-                            allow_blob_public_access=storage_account.allow_blob_public_access,
-                            network_rule_set=storage_account.network_rule_set,
-                            encryption_type=storage_account.encryption.key_source,
-                            minimum_tls_version=storage_account.minimum_tls_version,
-                            private_endpoint_connections=storage_account.private_endpoint_connections,
-                            key_expiration_period_in_days=key_expiration_period_in_days,
-                            location=storage_account.location,
-                        )
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_storage_accounts__
+        )
+
+    def __get_subscription_storage_accounts__(self, subscription, client):
+        storage_accounts = []
+        try:
+            storage_accounts_list = client.storage_accounts.list()
+            for storage_account in storage_accounts_list:
+                parts = storage_account.id.split("/")
+                if "resourceGroups" in parts:
+                    resouce_name_index = parts.index("resourceGroups") + 1
+                    resouce_group_name = parts[resouce_name_index]
+                else:
+                    resouce_group_name = None
+                key_expiration_period_in_days = None
+                if storage_account.key_policy:
+                    key_expiration_period_in_days = (
+                        storage_account.key_policy.key_expiration_period_in_days
+                    )
+                storage_accounts.append(
+                    Account(
+                        id=storage_account.id,
+                        name=storage_account.name,
+                        resouce_group_name=resouce_group_name,
+                        enable_https_traffic_only=storage_account.enable_https_traffic_only,
+                        infrastructure_encryption=storage_account.encryption.require_infrastructure_encryption,
+                        allow_blob_public_access=storage_account.allow_blob_public_access,
+                        network_rule_set=storage_account.network_rule_set,
+                        encryption_type=storage_account.encryption.key_source,
+                        minimum_tls_version=storage_account.minimum_tls_version,
+                        private_endpoint_connections=storage_account.private_endpoint_connections,
+                        key_expiration_period_in_days=key_expiration_period_in_days,
+                        location=storage_account.location,
                     )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return storage_accounts
 
     def __get_blob_properties__(self):
         logger.info("Storage - Getting blob properties...")
+        self.__threading_call__(
+            self.__get_account_blob_properties__,
+            [
+                (subscription, account)
+                for subscription, accounts in self.storage_accounts.items()
+                for account in accounts
+            ],
+        )
+
+    def __get_account_blob_properties__(self, subscription_account):
+        subscription, account = subscription_account
         try:
-            for subscription, accounts in self.storage_accounts.items():
-                client = self.clients[subscription]
-                for account in accounts:
-                    properties = client.blob_services.get_service_properties(
-                        account.resouce_group_name, account.name
-                    )
-                    account.blob_properties = BlobProperties(
-                        id=properties.id,
-                        name=properties.name,
-                        type=properties.type,
-                        default_service_version=properties.default_service_version,
-                        container_delete_retention_policy=properties.container_delete_retention_policy,
-                    )
+            client = self.clients[subscription]
+            properties = client.blob_services.get_service_properties(
+                account.resouce_group_name, account.name
+            )
+            account.blob_properties = BlobProperties(
+                id=properties.id,
+                name=properties.name,
+                type=properties.type,
+                default_service_version=properties.default_service_version,
+                container_delete_retention_policy=properties.container_delete_retention_policy,
+            )
         except Exception as error:
             logger.error(
                 f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
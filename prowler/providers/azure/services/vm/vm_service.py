@@ -17,64 +17,66 @@ class VirtualMachines(AzureService):
 
     def __get_virtual_machines__(self):
         logger.info("VirtualMachines - Getting virtual machines...")
-        virtual_machines = {}
+        return self.__subscriptions_threading_call__(
+            self.__get_subscription_virtual_machines__
+        )
 
-        for subscription_name, client in self.clients.items():
-            try:
-                virtual_machines_list = client.virtual_machines.list_all()
-                virtual_machines.update({subscription_name: {}})
-
-                for vm in virtual_machines_list:
-                    virtual_machines[subscription_name].update(
-                        {
-                            vm.vm_id: VirtualMachine(
-                                resource_id=vm.id,
-                                resource_name=vm.name,
-                                storage_profile=getattr(vm, "storage_profile", None),
-                                location=vm.location,
-                                security_profile=vm.security_profile,
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+    def __get_subscription_virtual_machines__(self, subscription_name, client):
+        virtual_machines = {}
+        try:
+            virtual_machines_list = client.virtual_machines.list_all()
+
+            for vm in virtual_machines_list:
+                virtual_machines.update(
+                    {
+                        vm.vm_id: VirtualMachine(
+                            resource_id=vm.id,
+                            resource_name=vm.name,
+                            storage_profile=getattr(vm, "storage_profile", None),
+                            location=vm.location,
+                            security_profile=vm.security_profile,
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
         return virtual_machines
 
     def __get_disks__(self):
         logger.info("VirtualMachines - Getting disks...")
-        disks = {}
+        return self.__subscriptions_threading_call__(self.__get_subscription_disks__)
 
-        for subscription_name, client in self.clients.items():
-            try:
-                disks_list = client.disks.list()
-                disks.update({subscription_name: {}})
-
-                for disk in disks_list:
-                    vms_attached = []
-                    if disk.managed_by:
-                        vms_attached.append(disk.managed_by)
-                    if disk.managed_by_extended:
-                        vms_attached.extend(disk.managed_by_extended)
-                    disks[subscription_name].update(
-                        {
-                            disk.unique_id: Disk(
-                                resource_id=disk.id,
-                                resource_name=disk.name,
-                                location=disk.location,
-                                vms_attached=vms_attached,
-                                encryption_type=getattr(
-                                    getattr(disk, "encryption", None), "type", None
-                                ),
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+    def __get_subscription_disks__(self, subscription_name, client):
+        disks = {}
+        try:
+            disks_list = client.disks.list()
+
+            for disk in disks_list:
+                vms_attached = []
+                if disk.managed_by:
+                    vms_attached.append(disk.managed_by)
+                if disk.managed_by_extended:
+                    vms_attached.extend(disk.managed_by_extended)
+                disks.update(
+                    {
+                        disk.unique_id: Disk(
+                            resource_id=disk.id,
+                            resource_name=disk.name,
+                            location=disk.location,
+                            vms_attached=vms_attached,
+                            encryption_type=getattr(
+                                getattr(disk, "encryption", None), "type", None
+                            ),
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
         return disks
 
@@ -25,6 +25,7 @@ class ProviderOutputOptions:
     output_filename: str
     only_logs: bool
     unix_timestamp: bool
+    file_descriptors: dict
 
     def __init__(self, arguments, bulk_checks_metadata):
         self.status = arguments.status
@@ -36,6 +37,8 @@ class ProviderOutputOptions:
         self.unix_timestamp = arguments.unix_timestamp
         self.shodan_api_key = arguments.shodan
         self.fixer = getattr(arguments, "fixer", None)
+        # Output files opened once per scan by the report, closed by execute_checks with close_file_descriptors
+        self.file_descriptors = {}
 
         # Shodan API Key
         if arguments.shodan:
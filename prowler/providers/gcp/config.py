@@ -0,0 +1,2 @@
+# Maximum number of calls grouped in each batch HTTP request
+GCP_BATCH_SIZE = 100
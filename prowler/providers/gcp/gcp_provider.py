@@ -13,6 +13,7 @@ from prowler.lib.logger import logger
 from prowler.lib.utils.utils import print_boxes
 from prowler.providers.common.models import Audit_Metadata
 from prowler.providers.common.provider import Provider
+from prowler.providers.gcp.config import GCP_BATCH_SIZE
 from prowler.providers.gcp.models import (
     GCPIdentityInfo,
     GCPOrganization,
@@ -278,18 +279,31 @@ class GcpProvider(Provider):
             )
             # TODO: this call requires more permissions to get that data
             # resourcemanager.organizations.get --> add to the docs
+            organizations = {}
             for project in self._projects.values():
                 if project.organization:
-                    request = service.organizations().get(
-                        name=f"organizations/{project.organization.id}"
+                    organizations.setdefault(project.organization.id, []).append(
+                        project.organization
                     )
 
-                    while request is not None:
-                        response = request.execute()
-                        project.organization.display_name = response.get("displayName")
-                        request = service.projects().list_next(
-                            previous_request=request, previous_response=response
-                        )
+            def update_organizations(organization_id, response, exception):
+                if exception:
+                    raise exception
+                for organization in organizations[organization_id]:
+                    organization.display_name = response.get("displayName")
+
+            # Each organization is retrieved once for all its projects, grouped in batch requests
+            organization_ids = list(organizations)
+            for index in range(0, len(organization_ids), GCP_BATCH_SIZE):
+                batch = service.new_batch_http_request(callback=update_organizations)
+                for organization_id in organization_ids[index : index + GCP_BATCH_SIZE]:
+                    batch.add(
+                        service.organizations().get(
+                            name=f"organizations/{organization_id}"
+                        ),
+                        request_id=organization_id,
+                    )
+                batch.execute()
 
         except HttpError as http_error:
             if http_error.status_code == 403 and "organizations" in http_error.uri:
@@ -1,4 +1,6 @@
-import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from threading import Lock, local
 
 import google_auth_httplib2
 import httplib2
@@ -6,10 +8,53 @@ from colorama import Fore, Style
 from google.oauth2.credentials import Credentials
 from googleapiclient import discovery
 from googleapiclient.discovery import Resource
+from googleapiclient.discovery_cache import get_static_doc
 
 from prowler.lib.logger import logger
+from prowler.providers.gcp.config import GCP_BATCH_SIZE
 from prowler.providers.gcp.gcp_provider import GcpProvider
 
+# Number of threads shared by all the GCP services to make the API calls
+GCP_MAX_WORKERS = 20
+
+# Set in the threads of the GCP thread pool, so the calls made from them are not submitted to the same pool
+gcp_thread_pool_worker = local()
+
+
+def __set_gcp_thread_pool_worker__():
+    gcp_thread_pool_worker.is_worker = True
+
+
+gcp_thread_pool = ThreadPoolExecutor(
+    max_workers=GCP_MAX_WORKERS, initializer=__set_gcp_thread_pool_worker__
+)
+
+# Services enabled in each project, retrieved once and shared by all the GCP services
+enabled_services_per_project = {}
+# Listings of the enabled services in progress, by project
+enabled_services_futures = {}
+enabled_services_lock = Lock()
+
+
+@lru_cache(maxsize=None)
+def get_discovery_document(service: str, api_version: str) -> str:
+    """get_discovery_document returns the discovery document of the API bundled with the Google API client, read only once, or None if it is not bundled"""
+    return get_static_doc(service, api_version)
+
+
+@lru_cache(maxsize=None)
+def get_client(service: str, api_version: str, credentials: Credentials) -> Resource:
+    """get_client returns the client of the API, built only once for each service, API version and credentials
+
+    The client is shared, so the requests executed at the same time in several threads should be executed with their own HTTP client, since it is not thread safe.
+    """
+    discovery_document = get_discovery_document(service, api_version)
+    if discovery_document:
+        return discovery.build_from_document(
+            discovery_document, credentials=credentials
+        )
+    return discovery.build(service, api_version, credentials=credentials)
+
 
 class GCPService:
     def __init__(
@@ -37,13 +82,69 @@ class GCPService:
         return self.client
 
     def __threading_call__(self, call, iterator):
-        threads = []
-        for value in iterator:
-            threads.append(threading.Thread(target=call, args=(value,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        # A call made from a thread of the pool is run inline, since waiting for the pool from one of its threads can exhaust it
+        if getattr(gcp_thread_pool_worker, "is_worker", False):
+            for value in iterator:
+                try:
+                    call(value)
+                except Exception:
+                    pass  # Currently handled within the called function
+            return
+
+        # Submit tasks to the thread pool shared by all the GCP services
+        futures = [gcp_thread_pool.submit(call, value) for value in iterator]
+
+        # Wait for all tasks to complete
+        for future in as_completed(futures):
+            try:
+                future.result()  # Raises exceptions from the thread, if any
+            except Exception:
+                # Handle exceptions if necessary
+                pass  # Currently handled within the called function
+
+    def __batch_execute__(self, requests: dict, callback, list_next=None):
+        """__batch_execute__ executes the requests grouped in batch HTTP requests and calls callback(key, response) with the response of each one.
+
+        requests is a dict with the key that identifies each request, e.g. the project id, and the request.
+        If list_next is given the next pages of all the requests are retrieved together in the following batches.
+        """
+        while requests:
+            next_requests = {}
+            keys = list(requests)
+            for index in range(0, len(keys), GCP_BATCH_SIZE):
+                responses = {}
+
+                def add_response(request_id, response, exception):
+                    responses[keys[int(request_id)]] = (response, exception)
+
+                batch = self.client.new_batch_http_request(callback=add_response)
+                for position in range(index, min(index + GCP_BATCH_SIZE, len(keys))):
+                    batch.add(requests[keys[position]], request_id=str(position))
+                try:
+                    batch.execute(http=self.__get_AuthorizedHttp_client__())
+                except Exception as error:
+                    logger.error(
+                        f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+                    continue
+
+                for key, (response, exception) in responses.items():
+                    try:
+                        if exception:
+                            raise exception
+                        callback(key, response)
+                        if list_next:
+                            next_request = list_next(
+                                previous_request=requests[key],
+                                previous_response=response,
+                            )
+                            if next_request is not None:
+                                next_requests[key] = next_request
+                    except Exception as error:
+                        logger.error(
+                            f"{key} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+            requests = next_requests
 
     def __get_AuthorizedHttp_client__(self):
         return google_auth_httplib2.AuthorizedHttp(
@@ -52,24 +153,89 @@ class GCPService:
 
     def __is_api_active__(self, audited_project_ids):
         project_ids = []
+        enabled_services = self.__get_enabled_services__(audited_project_ids)
         for project_id in audited_project_ids:
-            try:
-                client = discovery.build("serviceusage", "v1")
-                request = client.services().get(
-                    name=f"projects/{project_id}/services/{self.service}.googleapis.com"
+            # The error has been logged if the enabled services could not be retrieved
+            if enabled_services[project_id] is None:
+                continue
+            if any(
+                service["name"] == f"{self.service}.googleapis.com"
+                for service in enabled_services[project_id]
+            ):
+                project_ids.append(project_id)
+            else:
+                print(
+                    f"\n{Fore.YELLOW}{self.service} API {Style.RESET_ALL}has not been used in project {project_id} before or it is disabled.\nEnable it by visiting https://console.developers.google.com/apis/api/{self.service}.googleapis.com/overview?project={project_id} then retry."
                 )
-                response = request.execute()
-                if response.get("state") != "DISABLED":
-                    project_ids.append(project_id)
-                else:
-                    print(
-                        f"\n{Fore.YELLOW}{self.service} API {Style.RESET_ALL}has not been used in project {project_id} before or it is disabled.\nEnable it by visiting https://console.developers.google.com/apis/api/{self.service}.googleapis.com/overview?project={project_id} then retry."
+        return project_ids
+
+    def __get_enabled_services__(self, project_ids) -> dict:
+        """__get_enabled_services__ returns the name and title of the services enabled in each project, or None if they could not be retrieved.
+
+        The services of each project are listed only once and concurrently, and shared by all the GCP services.
+        The lock is only held to find and publish the listings, so the services created at the same time wait only for the projects they audit.
+        """
+        in_worker = getattr(gcp_thread_pool_worker, "is_worker", False)
+        futures = {}
+        with enabled_services_lock:
+            for project_id in project_ids:
+                if project_id in enabled_services_per_project:
+                    continue
+                if project_id not in enabled_services_futures:
+                    if in_worker:
+                        # Listed inline to not wait for the pool from one of its threads
+                        continue
+                    enabled_services_futures[project_id] = gcp_thread_pool.submit(
+                        self.__list_enabled_services__, project_id
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                futures[project_id] = enabled_services_futures[project_id]
+
+        listed_enabled_services = {}
+        for project_id in project_ids:
+            if project_id in futures and (futures[project_id].done() or not in_worker):
+                listed_enabled_services[project_id] = futures[project_id].result()
+            elif project_id not in enabled_services_per_project:
+                listed_enabled_services[project_id] = self.__list_enabled_services__(
+                    project_id
                 )
-        return project_ids
+
+        with enabled_services_lock:
+            for project_id, enabled_services in listed_enabled_services.items():
+                enabled_services_per_project.setdefault(project_id, enabled_services)
+                enabled_services_futures.pop(project_id, None)
+            return {
+                project_id: enabled_services_per_project[project_id]
+                for project_id in project_ids
+            }
+
+    def __list_enabled_services__(self, project_id):
+        try:
+            enabled_services = []
+            client = self.__generate_client__("serviceusage", "v1", self.credentials)
+            # Each thread uses its own HTTP client since they are not thread safe
+            http = self.__get_AuthorizedHttp_client__()
+            request = client.services().list(
+                parent=f"projects/{project_id}", filter="state:ENABLED"
+            )
+            while request is not None:
+                response = request.execute(http=http)
+                for service in response.get("services", []):
+                    enabled_services.append(
+                        {
+                            "name": service["name"].split("/")[-1],
+                            "title": service["config"]["title"],
+                        }
+                    )
+
+                request = client.services().list_next(
+                    previous_request=request, previous_response=response
+                )
+            return enabled_services
+        except Exception as error:
+            logger.error(
+                f"{project_id} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
 
     def __generate_client__(
         self,
@@ -78,7 +244,7 @@ class GCPService:
         credentials: Credentials,
     ) -> Resource:
         try:
-            return discovery.build(service, api_version, credentials=credentials)
+            return get_client(service, api_version, credentials)
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -30,56 +30,63 @@ class Compute(GCPService):
         self.__threading_call__(self.__get_addresses__, self.regions)
 
     def __get_regions__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.regions().list(project=project_id)
-                while request is not None:
-                    response = request.execute()
-
-                    for region in response.get("items", []):
-                        self.regions.add(region["name"])
-
-                    request = self.client.regions().list_next(
-                        previous_request=request, previous_response=response
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+        def add_regions(project_id, response):
+            for region in response.get("items", []):
+                self.regions.add(region["name"])
+
+        try:
+            self.__batch_execute__(
+                {
+                    project_id: self.client.regions().list(project=project_id)
+                    for project_id in self.project_ids
+                },
+                add_regions,
+                list_next=self.client.regions().list_next,
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
     def __get_zones__(self):
-        for project_id in self.project_ids:
-            try:
-                request = self.client.zones().list(project=project_id)
-                while request is not None:
-                    response = request.execute()
-
-                    for zone in response.get("items", []):
-                        self.zones.add(zone["name"])
-
-                    request = self.client.zones().list_next(
-                        previous_request=request, previous_response=response
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+        def add_zones(project_id, response):
+            for zone in response.get("items", []):
+                self.zones.add(zone["name"])
+
+        try:
+            self.__batch_execute__(
+                {
+                    project_id: self.client.zones().list(project=project_id)
+                    for project_id in self.project_ids
+                },
+                add_zones,
+                list_next=self.client.zones().list_next,
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
     def __get_projects__(self):
-        for project_id in self.project_ids:
-            try:
-                enable_oslogin = False
-                response = self.client.projects().get(project=project_id).execute()
-                for item in response["commonInstanceMetadata"].get("items", []):
-                    if item["key"] == "enable-oslogin" and item["value"] == "TRUE":
-                        enable_oslogin = True
-                self.projects.append(
-                    Project(id=project_id, enable_oslogin=enable_oslogin)
-                )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+        def add_project(project_id, response):
+            enable_oslogin = False
+            for item in response["commonInstanceMetadata"].get("items", []):
+                if item["key"] == "enable-oslogin" and item["value"] == "TRUE":
+                    enable_oslogin = True
+            self.projects.append(Project(id=project_id, enable_oslogin=enable_oslogin))
+
+        try:
+            self.__batch_execute__(
+                {
+                    project_id: self.client.projects().get(project=project_id)
+                    for project_id in self.project_ids
+                },
+                add_project,
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
     def __get_instances__(self, zone):
         for project_id in self.project_ids:
@@ -19,54 +19,40 @@ class IAM(GCPService):
         self.__get_service_accounts_keys__()
 
     def __get_service_accounts__(self):
-        for project_id in self.project_ids:
-            try:
-                request = (
-                    self.client.projects()
-                    .serviceAccounts()
-                    .list(name="projects/" + project_id)
-                )
-                while request is not None:
-                    response = request.execute()
-
-                    for account in response["accounts"]:
-                        self.service_accounts.append(
-                            ServiceAccount(
-                                name=account["name"],
-                                email=account["email"],
-                                display_name=account.get("displayName", ""),
-                                project_id=project_id,
-                            )
-                        )
-
-                    request = (
-                        self.client.projects()
-                        .serviceAccounts()
-                        .list_next(previous_request=request, previous_response=response)
+        def add_service_accounts(project_id, response):
+            for account in response["accounts"]:
+                self.service_accounts.append(
+                    ServiceAccount(
+                        name=account["name"],
+                        email=account["email"],
+                        display_name=account.get("displayName", ""),
+                        project_id=project_id,
                     )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def __get_service_accounts_keys__(self):
         try:
-            for sa in self.service_accounts:
-                request = (
-                    self.client.projects()
+            self.__batch_execute__(
+                {
+                    project_id: self.client.projects()
                     .serviceAccounts()
-                    .keys()
-                    .list(
-                        name="projects/"
-                        + sa.project_id
-                        + "/serviceAccounts/"
-                        + sa.email
-                    )
-                )
-                response = request.execute()
+                    .list(name="projects/" + project_id)
+                    for project_id in self.project_ids
+                },
+                add_service_accounts,
+                list_next=self.client.projects().serviceAccounts().list_next,
+            )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def __get_service_accounts_keys__(self):
+        try:
+            service_accounts = {sa.name: sa for sa in self.service_accounts}
 
+            def add_keys(name, response):
                 for key in response["keys"]:
-                    sa.keys.append(
+                    service_accounts[name].keys.append(
                         Key(
                             name=key["name"].split("/")[-1],
                             origin=key["keyOrigin"],
@@ -80,6 +66,21 @@ class IAM(GCPService):
                         )
                     )
 
+            self.__batch_execute__(
+                {
+                    sa.name: self.client.projects()
+                    .serviceAccounts()
+                    .keys()
+                    .list(
+                        name="projects/"
+                        + sa.project_id
+                        + "/serviceAccounts/"
+                        + sa.email
+                    )
+                    for sa in self.service_accounts
+                },
+                add_keys,
+            )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
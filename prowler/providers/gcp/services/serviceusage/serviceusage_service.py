@@ -1,6 +1,5 @@
 from pydantic import BaseModel
 
-from prowler.lib.logger import logger
 from prowler.providers.gcp.gcp_provider import GcpProvider
 from prowler.providers.gcp.lib.service.service import GCPService
 
@@ -13,30 +12,17 @@ class ServiceUsage(GCPService):
         self.__get_active_services__()
 
     def __get_active_services__(self):
+        # The enabled services of the projects are already retrieved to check if their API is enabled
+        enabled_services = self.__get_enabled_services__(self.project_ids)
         for project_id in self.project_ids:
-            self.active_services[project_id] = []
-            try:
-                request = self.client.services().list(
-                    parent="projects/" + project_id, filter="state:ENABLED"
-                )
-                while request is not None:
-                    response = request.execute()
-                    for service in response["services"]:
-                        self.active_services[project_id].append(
-                            Service(
-                                name=service["name"].split("/")[-1],
-                                title=service["config"]["title"],
-                                project_id=project_id,
-                            )
-                        )
-
-                    request = self.client.services().list_next(
-                        previous_request=request, previous_response=response
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            self.active_services[project_id] = [
+                Service(
+                    name=service["name"],
+                    title=service["title"],
+                    project_id=project_id,
                 )
+                for service in enabled_services[project_id] or []
+            ]
 
 
 class Service(BaseModel):
@@ -1,29 +1,50 @@
+import gc
+import json
 import os
 import pathlib
+import time
+import weakref
 from argparse import Namespace
 from importlib.machinery import FileFinder
 from pkgutil import ModuleInfo
 
+import pytest
 from boto3 import client
 from fixtures.bulk_checks_metadata import test_bulk_checks_metadata
-from mock import patch
+from mock import MagicMock, patch
 from moto import mock_aws
 
 from prowler.lib.check.check import (
+    build_checks_catalog,
+    bulk_load_checks_metadata,
+    checks_catalogs,
+    discover_checks,
     exclude_checks_to_run,
     exclude_services_to_run,
+    execute_checks,
+    get_checks_catalog_fingerprint,
     list_categories,
     list_checks_json,
+    list_fixers,
     list_modules,
     list_services,
+    load_checks_catalog,
     parse_checks_from_file,
     parse_checks_from_folder,
+    prefetch_service_clients,
     recover_checks_from_provider,
     recover_checks_from_service,
+    recover_service_clients_from_checks,
     remove_custom_checks_module,
     update_audit_metadata,
 )
-from prowler.lib.check.models import load_check_metadata
+from prowler.lib.check.models import (
+    Check_Report_AWS,
+    Code,
+    Findings_Counter,
+    Findings_Store,
+    load_check_metadata,
+)
 from prowler.providers.aws.aws_provider import AwsProvider
 from tests.providers.aws.utils import AWS_REGION_US_EAST_1
 
@@ -388,6 +409,16 @@ def mock_recover_checks_from_aws_provider(*_):
     ]
 
 
+def mock_execute_checks_global_provider():
+    global_provider = MagicMock()
+    global_provider.type = "aws"
+    global_provider.mutelist = None
+    global_provider.output_options.only_logs = True
+    global_provider.output_options.verbose = False
+    global_provider.output_options.fixer = False
+    return global_provider
+
+
 class TestCheck:
     def test_load_check_metadata(self):
         test_cases = [
@@ -623,6 +654,125 @@ class TestCheck:
         returned_checks = recover_checks_from_provider(provider, service)
         assert returned_checks == expected_checks
 
+    def test_recover_checks_from_provider_checks_catalog(self, tmp_path):
+        checks_catalogs.clear()
+        with patch("prowler.lib.check.check.checks_catalog_directory", str(tmp_path)):
+            assert recover_checks_from_provider("aws") == discover_checks("aws")
+            assert recover_checks_from_provider(
+                "aws", include_fixers=True
+            ) == discover_checks("aws", include_fixers=True)
+            assert "ec2_ebs_default_encryption" in list_fixers("aws")
+        checks_catalogs.clear()
+
+    def test_load_checks_catalog(self, tmp_path):
+        provider = "azure"
+        checks_catalogs.clear()
+        with patch("prowler.lib.check.check.checks_catalog_directory", str(tmp_path)):
+            checks_catalog = load_checks_catalog(provider)
+
+            assert os.path.isfile(f"{tmp_path}/{provider}_checks_catalog.json")
+            check = checks_catalog["storage_ensure_minimum_tls_version_12"]
+            assert check["Service"] == "storage"
+            assert check["CheckPath"].endswith(
+                "/prowler/providers/azure/services/storage/storage_ensure_minimum_tls_version_12"
+            )
+            assert not check["Fixer"]
+            assert (
+                check["Metadata"]["CheckID"] == "storage_ensure_minimum_tls_version_12"
+            )
+
+            # The saved catalog is loaded without discovering the checks again
+            checks_catalogs.clear()
+            with patch(
+                "prowler.lib.check.check.build_checks_catalog",
+                wraps=build_checks_catalog,
+            ) as build_catalog:
+                assert load_checks_catalog(provider) == checks_catalog
+                assert load_checks_catalog(provider) == checks_catalog
+                build_catalog.assert_not_called()
+        checks_catalogs.clear()
+
+    def test_bulk_load_checks_metadata_checks_catalog(self, tmp_path):
+        provider = "azure"
+        checks_catalogs.clear()
+        with patch("prowler.lib.check.check.checks_catalog_directory", str(tmp_path)):
+            checks_catalog = load_checks_catalog(provider)
+            bulk_checks_metadata = bulk_load_checks_metadata(provider)
+
+        assert len(bulk_checks_metadata) == len(checks_catalog)
+        for check_name, check in checks_catalog.items():
+            check_metadata = load_check_metadata(
+                f"{check['CheckPath']}/{check_name}.metadata.json"
+            )
+            assert bulk_checks_metadata[check_metadata.CheckID] == check_metadata
+            assert (
+                bulk_checks_metadata[check_metadata.CheckID].json()
+                == check_metadata.json()
+            )
+            assert isinstance(
+                bulk_checks_metadata[check_metadata.CheckID].Remediation.Code, Code
+            )
+        checks_catalogs.clear()
+
+    def test_load_checks_catalog_outdated(self, tmp_path):
+        provider = "azure"
+        checks_catalogs.clear()
+        with patch("prowler.lib.check.check.checks_catalog_directory", str(tmp_path)):
+            fingerprint = get_checks_catalog_fingerprint(provider)
+            fingerprint["Version"] = "0.0.0"
+            with open(f"{tmp_path}/{provider}_checks_catalog.json", "w") as f:
+                f.write(json.dumps({"Fingerprint": fingerprint, "Digest": ""}))
+                f.write("\n{}")
+
+            with patch(
+                "prowler.lib.check.check.build_checks_catalog",
+                wraps=build_checks_catalog,
+            ) as build_catalog:
+                checks_catalog = load_checks_catalog(provider)
+                build_catalog.assert_called_once_with(provider)
+
+            assert "storage_ensure_minimum_tls_version_12" in checks_catalog
+        checks_catalogs.clear()
+
+    def test_load_checks_catalog_modified(self, tmp_path):
+        provider = "azure"
+        checks_catalogs.clear()
+        with patch("prowler.lib.check.check.checks_catalog_directory", str(tmp_path)):
+            load_checks_catalog(provider)
+            checks_catalog_file = f"{tmp_path}/{provider}_checks_catalog.json"
+            with open(checks_catalog_file) as f:
+                checks_catalog_content = f.read()
+            with open(checks_catalog_file, "w") as f:
+                f.write(checks_catalog_content.replace('"high"', '"not-valid"'))
+
+            # The modified catalog is not loaded without validating it
+            checks_catalogs.clear()
+            with patch(
+                "prowler.lib.check.check.build_checks_catalog",
+                wraps=build_checks_catalog,
+            ) as build_catalog:
+                checks_catalog = load_checks_catalog(provider)
+                build_catalog.assert_called_once_with(provider)
+
+            assert "not-valid" not in json.dumps(checks_catalog)
+        checks_catalogs.clear()
+
+    def test_get_checks_catalog_fingerprint_check_files(self, tmp_path):
+        check_path = tmp_path / "providers" / "test" / "services" / "svc" / "svc_check"
+        check_path.mkdir(parents=True)
+        (check_path / "svc_check.py").write_text("")
+        metadata_file = check_path / "svc_check.metadata.json"
+        metadata_file.write_text("{}")
+        prowler_module = MagicMock(__file__=str(tmp_path / "__init__.py"))
+
+        with patch("prowler.lib.check.check.prowler", prowler_module):
+            fingerprint = get_checks_catalog_fingerprint("test")
+            assert fingerprint["Files"] == 2
+            # Editing the files of a check changes the fingerprint
+            modification = metadata_file.stat().st_mtime_ns + 1000000000
+            os.utime(metadata_file, ns=(modification, modification))
+            assert get_checks_catalog_fingerprint("test") != fingerprint
+
     @patch("prowler.lib.check.check.walk_packages", new=mock_walk_packages)
     def test_list_modules(self):
         provider = "azure"
@@ -770,6 +920,274 @@ class TestCheck:
         assert audit_metadata.expected_checks == expected_checks
         assert audit_metadata.completed_checks == 1
 
+    def test_execute_checks_parallel_same_output_as_serial(self):
+        check_metadata = load_check_metadata(
+            f"{os.path.dirname(os.path.realpath(__file__))}/fixtures/metadata.json"
+        ).json()
+        checks_to_execute = [
+            "ec2_ebs_default_encryption",
+            "iam_root_mfa_enabled",
+            "s3_bucket_default_encryption",
+            "s3_bucket_public_access",
+        ]
+
+        # The first checks are the slowest ones to finish in parallel
+        def mock_run_check_module(
+            service, check_name, global_provider, custom_checks_metadata
+        ):
+            time.sleep(
+                0.05 * (len(checks_to_execute) - checks_to_execute.index(check_name))
+            )
+            findings = []
+            for finding_number in range(2):
+                finding = Check_Report_AWS(check_metadata)
+                finding.resource_id = f"{check_name}-finding-{finding_number}"
+                findings.append(finding)
+            return findings
+
+        def run(parallel_checks):
+            global_provider = mock_execute_checks_global_provider()
+            with patch(
+                "prowler.lib.check.check.run_check_module",
+                new=mock_run_check_module,
+            ), patch("prowler.lib.check.check.report") as mock_report:
+                findings = execute_checks(
+                    checks_to_execute,
+                    global_provider,
+                    None,
+                    None,
+                    None,
+                    parallel_checks,
+                )
+            reported_findings = [
+                finding
+                for call in mock_report.call_args_list
+                for finding in call.args[0]
+            ]
+            return findings, reported_findings, global_provider.audit_metadata
+
+        serial_findings, serial_reported, serial_metadata = run(1)
+        parallel_findings, parallel_reported, parallel_metadata = run(4)
+
+        assert isinstance(serial_findings, Findings_Store)
+        assert len(serial_findings) == 8
+        assert list(parallel_findings) == list(serial_findings)
+        assert parallel_reported == serial_reported
+        assert parallel_metadata == serial_metadata
+        assert parallel_metadata.completed_checks == 4
+        assert parallel_metadata.services_scanned == 3
+        assert parallel_metadata.audit_progress == 100
+
+    def test_execute_checks_parallel_releases_findings(self):
+        check_metadata = load_check_metadata(
+            f"{os.path.dirname(os.path.realpath(__file__))}/fixtures/metadata.json"
+        ).json()
+        checks_to_execute = [
+            "ec2_ebs_default_encryption",
+            "iam_root_mfa_enabled",
+            "s3_bucket_default_encryption",
+            "s3_bucket_public_access",
+        ]
+
+        def mock_run_check_module(
+            service, check_name, global_provider, custom_checks_metadata
+        ):
+            finding = Check_Report_AWS(check_metadata)
+            finding.resource_id = check_name
+            return [finding]
+
+        # The findings of the checks already reported must not be kept by their futures
+        reported_findings = []
+        kept_findings = []
+
+        def findings_handler(check_findings):
+            gc.collect()
+            kept_findings.append(
+                [finding() for finding in reported_findings if finding() is not None]
+            )
+            reported_findings.extend(weakref.ref(finding) for finding in check_findings)
+
+        global_provider = mock_execute_checks_global_provider()
+        with patch(
+            "prowler.lib.check.check.run_check_module",
+            new=mock_run_check_module,
+        ), patch("prowler.lib.check.check.report", new=lambda *_: None):
+            findings = execute_checks(
+                checks_to_execute,
+                global_provider,
+                None,
+                None,
+                None,
+                parallel_checks=4,
+                findings_handlers=[findings_handler],
+            )
+
+        assert len(findings) == 4
+        assert kept_findings == [[], [], [], []]
+
+    def test_execute_checks_close_file_descriptors(self, tmp_path):
+        check_metadata = load_check_metadata(
+            f"{os.path.dirname(os.path.realpath(__file__))}/fixtures/metadata.json"
+        ).json()
+        checks_to_execute = ["ec2_ebs_default_encryption", "iam_root_mfa_enabled"]
+
+        def mock_run_check_module(
+            service, check_name, global_provider, custom_checks_metadata
+        ):
+            return [Check_Report_AWS(check_metadata)]
+
+        def mock_report(check_findings, global_provider):
+            file_descriptors = global_provider.output_options.file_descriptors
+            if not file_descriptors:
+                file_descriptors["csv"] = open(f"{tmp_path}/output.csv", "a")
+
+        def interrupt_scan(check_findings):
+            raise KeyboardInterrupt
+
+        global_provider = mock_execute_checks_global_provider()
+        global_provider.output_options.file_descriptors = {}
+        opened_file_descriptors = []
+        with patch(
+            "prowler.lib.check.check.run_check_module",
+            new=mock_run_check_module,
+        ), patch("prowler.lib.check.check.report", new=mock_report):
+            with pytest.raises(KeyboardInterrupt):
+                execute_checks(
+                    checks_to_execute,
+                    global_provider,
+                    None,
+                    None,
+                    None,
+                    findings_handlers=[
+                        lambda _: opened_file_descriptors.extend(
+                            global_provider.output_options.file_descriptors.values()
+                        ),
+                        interrupt_scan,
+                    ],
+                )
+
+        # The output files are closed even if the execution fails
+        assert len(opened_file_descriptors) == 1
+        assert opened_file_descriptors[0].closed
+        assert global_provider.output_options.file_descriptors == {}
+
+    def test_execute_checks_parallel_bounded_submitted_checks(self):
+        check_metadata = load_check_metadata(
+            f"{os.path.dirname(os.path.realpath(__file__))}/fixtures/metadata.json"
+        ).json()
+        checks_to_execute = [f"ec2_check_{index}" for index in range(10)]
+        consumed_checks = []
+        checks_submitted_ahead = []
+
+        def mock_run_check_module(
+            service, check_name, global_provider, custom_checks_metadata
+        ):
+            # Number of checks started and not yet consumed, including this one
+            checks_submitted_ahead.append(
+                checks_to_execute.index(check_name) + 1 - len(consumed_checks)
+            )
+            finding = Check_Report_AWS(check_metadata)
+            finding.resource_id = check_name
+            return [finding]
+
+        global_provider = mock_execute_checks_global_provider()
+        with patch(
+            "prowler.lib.check.check.run_check_module",
+            new=mock_run_check_module,
+        ), patch("prowler.lib.check.check.report"):
+            findings = execute_checks(
+                checks_to_execute,
+                global_provider,
+                None,
+                None,
+                None,
+                parallel_checks=3,
+                stream_findings=True,
+                findings_handlers=[
+                    lambda check_findings: consumed_checks.extend(check_findings)
+                ],
+            )
+
+        assert len(findings) == 10
+        assert [finding.resource_id for finding in consumed_checks] == checks_to_execute
+        assert max(checks_submitted_ahead) <= 3
+
+    def test_execute_checks_stream_findings(self):
+        check_metadata = load_check_metadata(
+            f"{os.path.dirname(os.path.realpath(__file__))}/fixtures/metadata.json"
+        ).json()
+
+        def mock_run_check_module(
+            service, check_name, global_provider, custom_checks_metadata
+        ):
+            finding = Check_Report_AWS(check_metadata)
+            finding.status = "FAIL"
+            finding.resource_id = check_name
+            return [finding]
+
+        global_provider = mock_execute_checks_global_provider()
+        streamed_findings = []
+        with patch(
+            "prowler.lib.check.check.run_check_module",
+            new=mock_run_check_module,
+        ), patch("prowler.lib.check.check.report"):
+            findings = execute_checks(
+                ["ec2_ebs_default_encryption", "iam_root_mfa_enabled"],
+                global_provider,
+                None,
+                None,
+                None,
+                stream_findings=True,
+                findings_handlers=[streamed_findings.extend],
+            )
+
+        assert isinstance(findings, Findings_Counter)
+        assert len(findings) == 2
+        assert findings.count_by("status") == [(("FAIL",), 2)]
+        assert [finding.resource_id for finding in streamed_findings] == [
+            "ec2_ebs_default_encryption",
+            "iam_root_mfa_enabled",
+        ]
+
+    def test_recover_service_clients_from_checks(self):
+        checks_to_execute = [
+            "awslambda_function_no_secrets_in_variables",
+            "cloudtrail_multi_region_enabled_logging_management_events",
+            "ec2_ebs_default_encryption",
+            "ec2_ebs_volume_encryption",
+            "non_existing_check",
+        ]
+        assert recover_service_clients_from_checks(checks_to_execute, "aws") == [
+            "prowler.providers.aws.services.awslambda.awslambda_client",
+            "prowler.providers.aws.services.cloudtrail.cloudtrail_client",
+            "prowler.providers.aws.services.ec2.ec2_client",
+        ]
+
+    def test_prefetch_service_clients(self):
+        checks_to_execute = [
+            "ec2_ebs_default_encryption",
+            "s3_bucket_default_encryption",
+        ]
+        global_provider = MagicMock()
+        global_provider.type = "aws"
+        global_provider.output_options.only_logs = True
+
+        def mock_import_module(module):
+            if "s3" in module:
+                raise Exception("Unable to build the service")
+
+        with patch(
+            "prowler.lib.check.check.importlib.import_module",
+            side_effect=mock_import_module,
+        ) as mock_import:
+            prefetched_clients = prefetch_service_clients(
+                checks_to_execute, global_provider
+            )
+
+        assert mock_import.call_count == 2
+        assert prefetched_clients == ["prowler.providers.aws.services.ec2.ec2_client"]
+        assert global_provider.audit_metadata.expected_checks == checks_to_execute
+
     def test_list_checks_json_aws_lambda_and_s3(self):
         provider = "aws"
         check_list = {
@@ -0,0 +1,149 @@
+from mock import patch
+
+from prowler.lib.check.check import bulk_load_compliance_frameworks
+from prowler.lib.check.compliance import (
+    get_checks_compliance_index,
+    update_checks_metadata_with_compliance,
+)
+from prowler.lib.check.compliance_models import (
+    Compliance_Base_Model,
+    Compliance_Frameworks,
+    Compliance_Requirement,
+    Generic_Compliance_Requirement_Attribute,
+)
+from prowler.lib.check.models import load_check_metadata
+from tests.lib.check.models_test import METADATA_FIXTURE_PATH
+
+
+def get_requirement(requirement_id: str, checks: list) -> Compliance_Requirement:
+    return Compliance_Requirement(
+        Id=requirement_id,
+        Description=f"Requirement {requirement_id}",
+        Attributes=[Generic_Compliance_Requirement_Attribute(Section="Section")],
+        Checks=checks,
+    )
+
+
+FRAMEWORK_1 = Compliance_Base_Model(
+    Framework="Framework",
+    Provider="AWS",
+    Version="1",
+    Description="Framework 1",
+    Requirements=[
+        get_requirement("1.1", ["check_a", "check_b"]),
+        get_requirement("1.2", ["check_b", "check_b"]),
+        get_requirement("1.3", []),
+    ],
+)
+FRAMEWORK_2 = Compliance_Base_Model(
+    Framework="Framework",
+    Provider="AWS",
+    Version="2",
+    Description="Framework 2",
+    Requirements=[
+        get_requirement("2.1", ["check_a"]),
+    ],
+)
+BULK_COMPLIANCE_FRAMEWORKS = {
+    "framework_1_aws": FRAMEWORK_1,
+    "framework_2_aws": FRAMEWORK_2,
+}
+
+
+class TestCompliance:
+    def test_get_checks_compliance_index(self):
+        checks_compliance_index = get_checks_compliance_index(
+            BULK_COMPLIANCE_FRAMEWORKS
+        )
+
+        assert [
+            (compliance.Version, compliance.Requirements[0].Id)
+            for compliance in checks_compliance_index["check_a"]
+        ] == [("1", "1.1"), ("2", "2.1")]
+        assert [
+            (compliance.Version, compliance.Requirements[0].Id)
+            for compliance in checks_compliance_index["check_b"]
+        ] == [("1", "1.1"), ("1", "1.2")]
+        assert [
+            (compliance.Version, compliance.Requirements[0].Id)
+            for compliance in checks_compliance_index["manual_check"]
+        ] == [("1", "1.3")]
+        # The checks of a requirement share its compliance and the requirement is not copied
+        assert (
+            checks_compliance_index["check_a"][0]
+            is checks_compliance_index["check_b"][0]
+        )
+        assert (
+            checks_compliance_index["check_a"][0].Requirements[0]
+            is FRAMEWORK_1.Requirements[0]
+        )
+
+    def test_update_checks_metadata_with_compliance(self):
+        check_metadata = load_check_metadata(METADATA_FIXTURE_PATH)
+        bulk_checks_metadata = {
+            "check_a": check_metadata.copy(),
+            "check_c": check_metadata.copy(),
+        }
+
+        bulk_checks_metadata = update_checks_metadata_with_compliance(
+            BULK_COMPLIANCE_FRAMEWORKS, bulk_checks_metadata
+        )
+
+        assert [
+            compliance.Requirements[0].Id
+            for compliance in bulk_checks_metadata["check_a"].Compliance
+        ] == ["1.1", "2.1"]
+        assert bulk_checks_metadata["check_c"].Compliance == []
+        assert bulk_checks_metadata["manual_check"].CheckID == "manual_check"
+        assert bulk_checks_metadata["manual_check"].Provider == "aws"
+        assert [
+            compliance.Requirements[0].Id
+            for compliance in bulk_checks_metadata["manual_check"].Compliance
+        ] == ["1.3"]
+
+    def test_compliance_frameworks_parsed_on_demand(self, tmp_path):
+        compliance_specification_files = {}
+        for name, framework in BULK_COMPLIANCE_FRAMEWORKS.items():
+            compliance_specification_files[name] = f"{tmp_path}/{name}.json"
+            with open(compliance_specification_files[name], "w") as file:
+                file.write(framework.json())
+        compliance_frameworks = Compliance_Frameworks(compliance_specification_files)
+
+        with patch.object(
+            Compliance_Base_Model,
+            "parse_file",
+            wraps=Compliance_Base_Model.parse_file,
+        ) as parse_file:
+            checks_compliance_index = get_checks_compliance_index(compliance_frameworks)
+            assert parse_file.call_count == 0
+            assert list(compliance_frameworks) == [
+                "framework_1_aws",
+                "framework_2_aws",
+            ]
+
+            compliance_frameworks.load(["framework_2_aws", "csv"])
+            assert parse_file.call_count == 1
+            assert compliance_frameworks["framework_2_aws"] == FRAMEWORK_2
+            assert parse_file.call_count == 1
+
+        # The manifest only holds the requirements ids and checks
+        manifest = checks_compliance_index["check_b"][1]
+        assert manifest.Version == "1"
+        assert manifest.Requirements[0].Id == "1.2"
+        assert manifest.Requirements[0].Checks == ["check_b", "check_b"]
+        assert manifest.Requirements[0].Attributes == []
+
+        # The parsed frameworks replace their manifest
+        checks_compliance_index = get_checks_compliance_index(compliance_frameworks)
+        assert (
+            checks_compliance_index["check_a"][1].Requirements[0]
+            is compliance_frameworks["framework_2_aws"].Requirements[0]
+        )
+
+    def test_bulk_load_compliance_frameworks(self):
+        bulk_compliance_frameworks = bulk_load_compliance_frameworks("aws")
+
+        assert isinstance(bulk_compliance_frameworks, Compliance_Frameworks)
+        assert "cis_2.0_aws" in bulk_compliance_frameworks
+        assert bulk_compliance_frameworks["cis_2.0_aws"].Framework == "CIS"
+        assert bulk_compliance_frameworks["cis_2.0_aws"].Version == "2.0"
@@ -0,0 +1,186 @@
+import os
+
+import pytest
+from mock import patch
+
+from prowler.lib.check.models import (
+    FINDINGS_STORE_ENCODING_SAMPLE,
+    Check_Metadata_Model,
+    Check_Report_AWS,
+    Check_Report_Azure,
+    Findings_Counter,
+    Findings_Store,
+    count_findings_by,
+    load_check_metadata,
+    parse_check_metadata,
+)
+
+METADATA_FIXTURE_PATH = (
+    f"{os.path.dirname(os.path.realpath(__file__))}/fixtures/metadata.json"
+)
+
+
+class TestCheckMetadata:
+    def test_parse_check_metadata(self):
+        metadata = load_check_metadata(METADATA_FIXTURE_PATH).json()
+
+        check_metadata = parse_check_metadata(metadata)
+
+        assert isinstance(check_metadata, Check_Metadata_Model)
+        assert check_metadata.CheckID == "iam_user_accesskey_unused"
+        assert parse_check_metadata(metadata) is check_metadata
+
+    def test_parse_check_metadata_validated_once(self):
+        metadata = load_check_metadata(METADATA_FIXTURE_PATH)
+        metadata.CheckTitle = "Validated once"
+        metadata = metadata.json()
+
+        with patch.object(
+            Check_Metadata_Model,
+            "parse_raw",
+            wraps=Check_Metadata_Model.parse_raw,
+        ) as parse_raw:
+            findings = [Check_Report_AWS(metadata) for _ in range(10)]
+
+        assert parse_raw.call_count == 1
+        assert all(
+            finding.check_metadata is findings[0].check_metadata for finding in findings
+        )
+        assert findings[0].check_metadata.CheckTitle == "Validated once"
+
+    def test_parse_check_metadata_custom_metadata(self):
+        metadata = load_check_metadata(METADATA_FIXTURE_PATH)
+        custom_metadata = metadata.copy()
+        custom_metadata.Severity = "critical"
+
+        finding = Check_Report_Azure(metadata.json())
+        custom_finding = Check_Report_Azure(custom_metadata.json())
+
+        assert finding.check_metadata is not custom_finding.check_metadata
+        assert finding.check_metadata.Severity == "low"
+        assert custom_finding.check_metadata.Severity == "critical"
+
+
+def get_finding(metadata: str, status: str, resource_id: str) -> Check_Report_AWS:
+    finding = Check_Report_AWS(metadata)
+    finding.status = status
+    finding.resource_id = resource_id
+    finding.region = "eu-west-1"
+    finding.resource_tags = [{"Key": "Name", "Value": resource_id}]
+    return finding
+
+
+class TestFindingsStore:
+    def test_findings_store(self):
+        metadata = load_check_metadata(METADATA_FIXTURE_PATH).json()
+        findings = [
+            get_finding(metadata, "PASS", "resource-1"),
+            get_finding(metadata, "FAIL", "resource-2"),
+        ]
+        azure_finding = Check_Report_Azure(metadata)
+        azure_finding.subscription = "subscription"
+        findings.append(azure_finding)
+
+        findings_store = Findings_Store(findings)
+
+        assert len(findings_store) == 3
+        assert list(findings_store) == findings
+        assert findings_store[-1] == azure_finding
+        assert isinstance(findings_store[-1], Check_Report_Azure)
+        assert not hasattr(findings_store[0], "subscription")
+        assert findings_store[1:] == findings[1:]
+        assert findings_store[0].check_metadata is findings_store[2].check_metadata
+
+    def test_findings_store_distinct_values(self):
+        metadata = load_check_metadata(METADATA_FIXTURE_PATH).json()
+        findings = [
+            get_finding(metadata, "PASS", f"resource-{index}")
+            for index in range(FINDINGS_STORE_ENCODING_SAMPLE + 1)
+        ]
+
+        findings_store = Findings_Store(findings)
+
+        assert list(findings_store) == findings
+        assert "resource_id" not in findings_store._indexes
+        assert len(findings_store._values["region"]) == 2
+
+    def test_findings_store_count_by(self):
+        metadata = load_check_metadata(METADATA_FIXTURE_PATH).json()
+        findings = [
+            get_finding(metadata, "FAIL", "resource-1"),
+            get_finding(metadata, "PASS", "resource-1"),
+            get_finding(metadata, "FAIL", "resource-2"),
+        ]
+        findings[2].muted = True
+        findings_store = Findings_Store(findings)
+
+        assert findings_store.count_by("status") == [(("FAIL",), 2), (("PASS",), 1)]
+        assert findings_store.count_by("resource_id", "muted") == [
+            (("resource-1", False), 2),
+            (("resource-2", True), 1),
+        ]
+        assert findings_store.count_by("subscription") == [((None,), 3)]
+        assert count_findings_by(findings, "status") == findings_store.count_by(
+            "status"
+        )
+
+
+class TestFindingsCounter:
+    def test_findings_counter(self):
+        metadata = load_check_metadata(METADATA_FIXTURE_PATH).json()
+        findings = [
+            get_finding(metadata, "FAIL", "resource-1"),
+            get_finding(metadata, "PASS", "resource-1"),
+            get_finding(metadata, "FAIL", "resource-2"),
+        ]
+        findings[2].muted = True
+
+        findings_counter = Findings_Counter()
+        findings_counter.extend(findings)
+        findings_store = Findings_Store(findings)
+
+        assert len(findings_counter) == 3
+        for attributes in [
+            ("status",),
+            ("status", "muted"),
+            ("check_metadata", "status", "muted"),
+        ]:
+            assert findings_counter.count_by(*attributes) == findings_store.count_by(
+                *attributes
+            )
+        with pytest.raises(ValueError):
+            findings_counter.count_by("region")
+        with pytest.raises(ValueError):
+            findings_counter.count_by("resource_id")
+        assert findings_counter.count_resources() == 2
+
+        counted_findings = list(findings_counter)
+        assert [(finding.status, finding.muted) for finding in counted_findings] == [
+            ("FAIL", False),
+            ("PASS", False),
+            ("FAIL", True),
+        ]
+        assert isinstance(counted_findings[0], Check_Report_AWS)
+        assert counted_findings[0].check_metadata is findings[0].check_metadata
+        assert not hasattr(counted_findings[0], "resource_id")
+
+    def test_findings_counter_resources(self):
+        metadata = load_check_metadata(METADATA_FIXTURE_PATH).json()
+        finding = get_finding(metadata, "PASS", "resource")
+
+        findings_counter = Findings_Counter()
+        findings_store = Findings_Store()
+        for index in range(50000):
+            finding.resource_id = f"resource-{index % 20000}"
+            findings_counter.append(finding)
+            findings_store.append(finding)
+        finding.resource_id = None
+        findings_counter.append(finding)
+        findings_store.append(finding)
+
+        # The resources are counted exactly, like in the stored findings
+        assert len(findings_counter) == 50001
+        assert findings_counter.count_resources() == 20001
+        assert findings_counter.count_resources() == len(
+            findings_store.count_by("resource_id")
+        )
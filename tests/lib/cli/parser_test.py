@@ -519,6 +519,34 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.checks_folder == filename
 
+    def test_checks_parser_parallel_checks(self):
+        argument = "--parallel-checks"
+        parallel_checks = "8"
+        command = [prowler_command, argument, parallel_checks]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == 8
+
+    def test_checks_parser_parallel_checks_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == 1
+
+    def test_checks_parser_wrong_parallel_checks(self, capsys):
+        argument = "--parallel-checks"
+        parallel_checks = "0"
+        command = [prowler_command, argument, parallel_checks]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+        assert "--parallel-checks must be greater than 0" in capsys.readouterr().err
+
+    def test_checks_parser_prefetch_services(self):
+        argument = "--prefetch-services"
+        command = [prowler_command, argument]
+        parsed = self.parser.parse(command)
+        assert parsed.prefetch_services
+
     def test_checks_parser_services_short(self):
         argument = "-s"
         service_1 = "iam"
@@ -949,6 +977,13 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.send_sh_only_fails
 
+    def test_aws_parser_security_hub_cache_ttl(self):
+        argument = "--security-hub-cache-ttl"
+        cache_ttl = "0"
+        command = [prowler_command, argument, cache_ttl]
+        parsed = self.parser.parse(command)
+        assert parsed.security_hub_cache_ttl == 0
+
     def test_aws_parser_quick_inventory_short(self):
         argument = "-i"
         command = [prowler_command, argument]
@@ -1054,6 +1089,26 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.aws_retries_max_attempts == int(max_retries)
 
+    def test_aws_parser_aws_max_pool_connections(self):
+        argument = "--aws-max-pool-connections"
+        max_pool_connections = "50"
+        command = [prowler_command, argument, max_pool_connections]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_max_pool_connections == int(max_pool_connections)
+
+    def test_aws_parser_wrong_aws_max_pool_connections(self, capsys):
+        argument = "--aws-max-pool-connections"
+        max_pool_connections = "0"
+        command = [prowler_command, argument, max_pool_connections]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+        assert (
+            "--aws-max-pool-connections must be greater than 0"
+            in capsys.readouterr().err
+        )
+
     def test_aws_parser_scan_unused_services(self):
         argument = "--scan-unused-services"
         command = [prowler_command, argument]
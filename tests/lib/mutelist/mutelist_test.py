@@ -4,6 +4,7 @@ from mock import MagicMock
 from moto import mock_aws
 
 from prowler.lib.mutelist.mutelist import (
+    Mutelist,
     is_excepted,
     is_muted,
     is_muted_in_check,
@@ -1044,6 +1045,127 @@ class TestMutelist:
             "environment=dev",
         )
 
+    def test_parse_mutelist_file_compiled(self):
+        mutelist = parse_mutelist_file("tests/lib/mutelist/fixtures/aws_mutelist.yaml")
+
+        assert isinstance(mutelist, Mutelist)
+        with open("tests/lib/mutelist/fixtures/aws_mutelist.yaml") as f:
+            assert yaml.safe_load(f)["Mutelist"] == mutelist
+
+    def test_compiled_mutelist_same_as_mutelist(self):
+        mutelist = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "lambda_function_url_public": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        },
+                        "s3_bucket_object_versioning": {
+                            "Regions": [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1],
+                            "Resources": ["ci-logs", "logs", ".+-logs"],
+                        },
+                        "ecs_task_definitions_no_environment_secrets": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Exceptions": {
+                                "Accounts": [AWS_ACCOUNT_NUMBER],
+                                "Regions": [
+                                    AWS_REGION_EU_WEST_1,
+                                    AWS_REGION_EU_SOUTH_3,
+                                ],
+                            },
+                        },
+                        "ec2_*": {
+                            "Regions": [AWS_REGION_EU_CENTRAL_1],
+                            "Resources": ["^sg-"],
+                        },
+                        "*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Tags": ["environment=dev"],
+                        },
+                    }
+                },
+                AWS_ACCOUNT_NUMBER: {
+                    "Checks": {
+                        "*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Exceptions": {
+                                "Resources": ["test"],
+                                "Tags": ["environment=prod"],
+                            },
+                        }
+                    }
+                },
+            }
+        }
+        compiled_mutelist = Mutelist(mutelist)
+
+        assert compiled_mutelist == mutelist
+        for account in [AWS_ACCOUNT_NUMBER, "111122223333"]:
+            for check in [
+                "awslambda_function_url_public",
+                "s3_bucket_object_versioning",
+                "ecs_task_definitions_no_environment_secrets",
+                "ec2_securitygroup_default_restrict_traffic",
+                "iam_root_mfa_enabled",
+            ]:
+                for region in [
+                    AWS_REGION_EU_WEST_1,
+                    AWS_REGION_EU_CENTRAL_1,
+                    AWS_REGION_EU_SOUTH_3,
+                ]:
+                    for resource_id in ["prowler-logs", "sg-123", "test", "prowler"]:
+                        for tags in ["", "environment=dev", "environment=prod"]:
+                            assert is_muted(
+                                compiled_mutelist,
+                                account,
+                                check,
+                                region,
+                                resource_id,
+                                tags,
+                            ) == is_muted(
+                                mutelist, account, check, region, resource_id, tags
+                            )
+
+    def test_mutelist_findings_compiled_mutelist(self):
+        mutelist = Mutelist(
+            {
+                "Accounts": {
+                    "*": {
+                        "Checks": {
+                            "check_test": {
+                                "Regions": [AWS_REGION_US_EAST_1],
+                                "Resources": ["^prowler"],
+                            }
+                        }
+                    }
+                }
+            }
+        )
+
+        finding_1 = MagicMock()
+        finding_1.check_metadata.CheckID = "check_test"
+        finding_1.status = "FAIL"
+        finding_1.region = AWS_REGION_US_EAST_1
+        finding_1.resource_id = "prowler-bucket"
+        finding_1.resource_tags = []
+        finding_2 = MagicMock()
+        finding_2.check_metadata.CheckID = "check_test"
+        finding_2.status = "FAIL"
+        finding_2.region = AWS_REGION_EU_WEST_1
+        finding_2.resource_id = "prowler-bucket"
+        finding_2.resource_tags = []
+        aws_provider = set_mocked_aws_provider()
+        aws_provider._mutelist = mutelist
+
+        muted_findings = mutelist_findings(aws_provider, [finding_1, finding_2])
+
+        assert muted_findings[0].muted
+        assert not muted_findings[1].muted
+
     def test_is_muted_in_tags(self):
         mutelist_tags = ["environment=dev", "project=prowler"]
 
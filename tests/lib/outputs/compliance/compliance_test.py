@@ -1,3 +1,4 @@
+from colorama import Fore, Style
 from mock import MagicMock
 
 from prowler.lib.check.compliance_models import (
@@ -6,6 +7,7 @@ from prowler.lib.check.compliance_models import (
     Compliance_Requirement,
 )
 from prowler.lib.outputs.compliance.compliance import (
+    Compliance_Counters,
     get_check_compliance_frameworks_in_input,
 )
 
@@ -109,3 +111,43 @@ class TestCompliance:
         assert get_check_compliance_frameworks_in_input(
             check_id, bulk_checks_metadata, input_compliance_frameworks
         ) == [CIS_1_4_AWS, CIS_1_5_AWS]
+
+    def test_compliance_counters(self):
+        check_metadata = MagicMock()
+        check_metadata.CheckID = "test-check"
+        check_metadata.Compliance = [CIS_1_4_AWS, CIS_1_5_AWS]
+        findings = []
+        for status, muted in [
+            ("FAIL", False),
+            ("FAIL", False),
+            ("PASS", False),
+            ("FAIL", True),
+        ]:
+            finding = MagicMock()
+            finding.check_metadata = check_metadata
+            finding.status = status
+            finding.muted = muted
+            findings.append(finding)
+        other_finding = MagicMock()
+        other_finding.check_metadata.CheckID = "other-check"
+        other_finding.status = "PASS"
+        other_finding.muted = False
+
+        compliance_counters = Compliance_Counters(
+            {"test-check": check_metadata}, [CIS_1_4_AWS_NAME]
+        )
+        compliance_counters.extend(findings)
+        compliance_counters.extend([other_finding])
+
+        assert compliance_counters.findings_count == 5
+        compliance_table = compliance_counters.compliance_tables[CIS_1_4_AWS_NAME]
+        assert compliance_table["provider"] == "AWS"
+        assert compliance_table["fail_count"] == 2
+        assert compliance_table["pass_count"] == 1
+        assert compliance_table["muted_count"] == 1
+        assert compliance_table["sections"]["2.1. Simple Storage Service (S3)"] == {
+            "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
+            "Level 1": {"FAIL": 2, "PASS": 1},
+            "Level 2": {"FAIL": 0, "PASS": 0},
+            "Muted": 1,
+        }
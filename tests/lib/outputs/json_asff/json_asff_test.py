@@ -78,6 +78,8 @@ class TestOutputJSONASFF:
         aws_provider = set_mocked_aws_provider()
         finding = Check_Report(load_check_metadata(METADATA_FIXTURE_PATH).json())
 
+        # The check's metadata is shared by its findings, so copy it before modifying it
+        finding.check_metadata = finding.check_metadata.copy(deep=True)
         # Empty the Remediation.Recomendation.URL
         finding.check_metadata.Remediation.Recommendation.Url = ""
 
@@ -134,6 +136,8 @@ class TestOutputJSONASFF:
         aws_provider = set_mocked_aws_provider()
         finding = Check_Report(load_check_metadata(METADATA_FIXTURE_PATH).json())
 
+        # The check's metadata is shared by its findings, so copy it before modifying it
+        finding.check_metadata = finding.check_metadata.copy(deep=True)
         # Empty the Remediation.Recomendation.URL
         finding.check_metadata.Remediation.Recommendation.Url = ""
         finding.check_metadata.Remediation.Recommendation.Text = "x" * 513
@@ -360,6 +364,8 @@ class TestOutputJSONASFF:
         ):
             finding = Check_Report(load_check_metadata(METADATA_FIXTURE_PATH).json())
 
+            # The check's metadata is shared by its findings, so copy it before modifying it
+            finding.check_metadata = finding.check_metadata.copy(deep=True)
             # Empty the Remediation.Recomendation.URL
             finding.check_metadata.Remediation.Recommendation.Url = ""
 
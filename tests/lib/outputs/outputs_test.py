@@ -1,4 +1,6 @@
+import json
 import os
+from argparse import Namespace
 from os import path, remove
 from unittest import mock
 
@@ -16,12 +18,28 @@ from prowler.lib.check.compliance_models import (
     Compliance_Base_Model,
     Compliance_Requirement,
 )
-from prowler.lib.check.models import Check_Report, load_check_metadata
+from prowler.lib.check.models import (
+    Check_Report,
+    Check_Report_AWS,
+    load_check_metadata,
+)
 from prowler.lib.outputs.common_models import FindingOutput
 from prowler.lib.outputs.compliance.compliance import get_check_compliance
-from prowler.lib.outputs.csv.csv import generate_csv_fields
-from prowler.lib.outputs.file_descriptors import fill_file_descriptors
-from prowler.lib.outputs.outputs import extract_findings_statistics, set_report_color
+from prowler.lib.outputs.csv.csv import (
+    csv_writers,
+    generate_csv_fields,
+    get_csv_writer,
+)
+from prowler.lib.outputs.file_descriptors import (
+    close_file_descriptors,
+    fill_file_descriptors,
+)
+from prowler.lib.outputs.json.json import close_json
+from prowler.lib.outputs.outputs import (
+    extract_findings_statistics,
+    report,
+    set_report_color,
+)
 from prowler.lib.outputs.utils import (
     parse_json_tags,
     unroll_dict,
@@ -30,6 +48,7 @@ from prowler.lib.outputs.utils import (
     unroll_tags,
 )
 from prowler.lib.utils.utils import open_file
+from prowler.providers.aws.models import AWSOrganizationsInfo
 from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, set_mocked_aws_provider
 
 
@@ -94,6 +113,66 @@ class TestOutputs:
                 )
                 remove(expected[index][output_mode].name)
 
+    def test_report_keeps_output_files_open_during_the_scan(self, tmp_path):
+        output_filename = "prowler-output-test-report"
+        arguments = Namespace()
+        arguments.output_filename = output_filename
+        aws_provider = set_mocked_aws_provider(arguments=arguments)
+        arguments.output_formats = ["csv", "json-ocsf"]
+        arguments.output_directory = str(tmp_path)
+        aws_provider.output_options = arguments, {}
+        aws_provider._organizations_metadata = AWSOrganizationsInfo(
+            account_email="",
+            account_name="",
+            organization_account_arn="",
+            organization_arn="",
+            organization_id="",
+            account_tags=[],
+        )
+
+        metadata = load_check_metadata(
+            f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
+        ).json()
+        findings = []
+        for index in range(3):
+            finding = Check_Report_AWS(metadata)
+            finding.status = "PASS"
+            finding.status_extended = f"Resource {index} is compliant"
+            finding.resource_id = f"resource-{index}"
+            finding.resource_arn = f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/{index}"
+            finding.region = "eu-west-1"
+            findings.append(finding)
+
+        with mock.patch(
+            "prowler.lib.outputs.outputs.fill_file_descriptors",
+            wraps=fill_file_descriptors,
+        ) as mock_fill_file_descriptors:
+            report(findings[:2], aws_provider)
+            report(findings[2:], aws_provider)
+
+        # The output files are only opened once
+        assert mock_fill_file_descriptors.call_count == 1
+        file_descriptors = aws_provider.output_options.file_descriptors
+        assert not file_descriptors["csv"].closed
+        # The CSV writer of each file is created once and released when it is closed
+        csv_file_descriptor = file_descriptors["csv"]
+        assert (
+            get_csv_writer(csv_file_descriptor, generate_csv_fields(FindingOutput))
+            is csv_writers[csv_file_descriptor]
+        )
+
+        close_file_descriptors(file_descriptors)
+        assert not file_descriptors
+        assert csv_file_descriptor not in csv_writers
+        close_json(output_filename, str(tmp_path), "json-ocsf")
+
+        with open(f"{tmp_path}/{output_filename}{csv_file_suffix}") as csv_file:
+            csv_lines = csv_file.read().splitlines()
+        assert len(csv_lines) == 4
+        assert csv_lines[0].startswith("AUTH_METHOD;")
+        with open(f"{tmp_path}/{output_filename}{json_ocsf_file_suffix}") as json_file:
+            assert len(json.load(json_file)) == 3
+
     def test_set_report_color(self):
         test_status = ["PASS", "FAIL", "MANUAL"]
         test_colors = [Fore.GREEN, Fore.RED, Fore.YELLOW]
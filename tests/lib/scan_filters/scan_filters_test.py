@@ -1,4 +1,4 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import Audit_Resources, is_resource_filtered
 
 
 class Test_Scan_Filters:
@@ -15,3 +15,77 @@ class Test_Scan_Filters:
         )
         assert is_resource_filtered("test_bucket", audit_resources)
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_is_resource_filtered_audit_resources(self):
+        audit_resources = Audit_Resources(
+            [
+                "arn:aws:iam::123456789012:user/test_user",
+                "arn:aws:s3:::test_bucket",
+                "arn:aws:ecs:us-east-1:123456789012:task-definition/test_task:3",
+                "arn:aws:waf::123456789012:webacl/test-web-acl-id",
+            ]
+        )
+        assert audit_resources == [
+            "arn:aws:iam::123456789012:user/test_user",
+            "arn:aws:s3:::test_bucket",
+            "arn:aws:ecs:us-east-1:123456789012:task-definition/test_task:3",
+            "arn:aws:waf::123456789012:webacl/test-web-acl-id",
+        ]
+        # Exact ARN
+        assert is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test_user", audit_resources
+        )
+        assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+        assert not is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test1", audit_resources
+        )
+        assert not is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test", audit_resources
+        )
+        # ARN without revision
+        assert is_resource_filtered(
+            "arn:aws:ecs:us-east-1:123456789012:task-definition/test_task",
+            audit_resources,
+        )
+        assert not is_resource_filtered(
+            "arn:aws:ecs:us-east-1:123456789012:task-definition/test_task:2",
+            audit_resources,
+        )
+        # Name or id
+        assert is_resource_filtered("test_bucket", audit_resources)
+        assert is_resource_filtered("test-web-acl-id", audit_resources)
+        assert not is_resource_filtered("test_bucket_2", audit_resources)
+
+    def test_is_resource_filtered_audit_resources_same_as_list(self):
+        resources = [
+            "arn:aws:iam::123456789012:role/test_role",
+            "arn:aws:lambda:eu-west-1:123456789012:function:test_function",
+            "arn:aws:cloudwatch:eu-west-1:123456789012:alarm:test_alarm",
+        ]
+        audit_resources = Audit_Resources(resources)
+        for resource in resources + [
+            "test_role",
+            "test_function",
+            "test_alarm",
+            "arn:aws:iam::123456789012:role/other_role",
+            "other_function",
+        ]:
+            assert is_resource_filtered(
+                resource, audit_resources
+            ) == is_resource_filtered(resource, resources)
+
+    def test_is_resource_filtered_audit_resources_resource_type(self):
+        audit_resources = Audit_Resources(
+            [
+                "arn:aws:iam::123:role/a",
+                "arn:aws:iam::123:role/service-role/b",
+            ]
+        )
+        assert is_resource_filtered("arn:aws:iam::123:role/a", audit_resources)
+        assert is_resource_filtered("a", audit_resources)
+        assert is_resource_filtered("b", audit_resources)
+        # The resource type and path are not the name of the resource
+        assert not is_resource_filtered("role", audit_resources)
+        assert not is_resource_filtered("arn:aws:iam::123:role/c", audit_resources)
+        assert not is_resource_filtered("service-role", audit_resources)
+        assert not is_resource_filtered("123", audit_resources)
@@ -1,13 +1,16 @@
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from time import mktime
 
 import pytest
+from detect_secrets.settings import get_settings
 from mock import patch
 
 from prowler.lib.utils.utils import (
     detect_secrets_scan,
+    detect_secrets_scan_bulk,
     file_exists,
     get_file_permissions,
     hash_sha512,
@@ -124,6 +127,48 @@ class Test_detect_secrets_scan:
         data = ""
         assert detect_secrets_scan(data) is None
 
+    def test_detect_secrets_scan_filename(self):
+        data = "database:\n  password: password\n"
+        secrets_detected = detect_secrets_scan(data, "config.yaml")
+        assert len(secrets_detected) == 1
+        assert secrets_detected[0]["filename"] == "config.yaml"
+        assert secrets_detected[0]["line_number"] == 2
+        # Files that are not text are not scanned
+        assert detect_secrets_scan(data, "image.png") is None
+
+    def test_detect_secrets_scan_settings(self):
+        original_settings = get_settings().json()
+        assert detect_secrets_scan("password=password")
+        # The detect-secrets settings are only changed during the scan
+        assert get_settings().json() == original_settings
+
+    def test_detect_secrets_scan_threads(self):
+        data_list = ["password=password", "no secrets", "\npassword=password"] * 20
+        # The scans do not change any global state, so they run concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            secrets_detected = list(executor.map(detect_secrets_scan, data_list))
+        assert secrets_detected == [detect_secrets_scan(data) for data in data_list]
+
+    def test_detect_secrets_scan_encoding(self):
+        # The data is read like the original file encoded with raw_unicode_escape
+        assert detect_secrets_scan("password=password\nname=café") is None
+        assert detect_secrets_scan("password=password\nname=日本")
+
+    def test_detect_secrets_scan_bulk(self):
+        data_list = ["password=password", "", "no secrets", "\npassword=password"]
+        secrets_detected = detect_secrets_scan_bulk(data_list)
+        assert secrets_detected == [detect_secrets_scan(data) for data in data_list]
+        assert secrets_detected[1] is None
+        assert secrets_detected[3][0]["line_number"] == 2
+
+    def test_detect_secrets_scan_bulk_processes(self):
+        data_list = ["password=password", "no secrets"]
+        with patch(
+            "prowler.lib.utils.utils.DETECT_SECRETS_PROCESSES_THRESHOLD", 0
+        ), patch("prowler.lib.utils.utils.os.cpu_count", return_value=2):
+            secrets_detected = detect_secrets_scan_bulk(data_list)
+        assert secrets_detected == [detect_secrets_scan(data) for data in data_list]
+
 
 class Test_hash_sha512:
     def test_hash_sha512(self):
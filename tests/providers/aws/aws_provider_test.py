@@ -20,6 +20,7 @@ from prowler.providers.aws.aws_provider import (
     create_sts_session,
     get_aws_available_regions,
     get_aws_region_for_sts,
+    get_aws_regions_by_service,
     validate_aws_credentials,
 )
 from prowler.providers.aws.config import (
@@ -624,6 +625,34 @@ aws:
 
         assert response == {}
 
+    @mock_aws
+    def test_generate_regional_clients_reuses_clients(self):
+        arguments = Namespace()
+        arguments.region = [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1]
+        aws_provider = AwsProvider(arguments)
+
+        ec2_clients = aws_provider.generate_regional_clients("ec2")
+        assert aws_provider.generate_regional_clients("ec2") == ec2_clients
+        assert (
+            aws_provider.get_client("ec2", AWS_REGION_EU_WEST_1)
+            is ec2_clients[AWS_REGION_EU_WEST_1]
+        )
+        assert ec2_clients[AWS_REGION_EU_WEST_1].region == AWS_REGION_EU_WEST_1
+
+        logs_clients = aws_provider.generate_regional_clients("logs")
+        assert (
+            logs_clients[AWS_REGION_EU_WEST_1] is not ec2_clients[AWS_REGION_EU_WEST_1]
+        )
+
+        # A new session gets its own clients
+        aws_provider._session.current_session = session.Session(
+            region_name=AWS_REGION_EU_WEST_1
+        )
+        assert (
+            aws_provider.get_client("ec2", AWS_REGION_EU_WEST_1)
+            is not ec2_clients[AWS_REGION_EU_WEST_1]
+        )
+
     @mock_aws
     def test_get_default_region(self):
         arguments = Namespace()
@@ -696,6 +725,7 @@ aws:
         arguments.region = [AWS_REGION_US_EAST_1]
         aws_provider = AwsProvider(arguments)
 
+        get_aws_regions_by_service.cache_clear()
         with patch(
             "prowler.providers.aws.aws_provider.parse_json_file",
             return_value={
@@ -729,12 +759,14 @@ aws:
             assert aws_provider.get_available_aws_service_regions("ec2") == {
                 AWS_REGION_US_EAST_1
             }
+        get_aws_regions_by_service.cache_clear()
 
     @mock_aws
     def test_get_available_aws_service_regions_with_all_regions_audited(self):
         arguments = Namespace()
         aws_provider = AwsProvider(arguments)
 
+        get_aws_regions_by_service.cache_clear()
         with patch(
             "prowler.providers.aws.aws_provider.parse_json_file",
             return_value={
@@ -766,6 +798,7 @@ aws:
             },
         ):
             assert len(aws_provider.get_available_aws_service_regions("ec2")) == 17
+        get_aws_regions_by_service.cache_clear()
 
     @mock_aws
     def test_get_tagged_resources(self):
@@ -1287,6 +1320,7 @@ aws:
         assert not recovered_regions
 
     def test_get_aws_available_regions(self):
+        get_aws_regions_by_service.cache_clear()
         with patch(
             "prowler.providers.aws.aws_provider.read_aws_regions_file",
             return_value={
@@ -1312,6 +1346,37 @@ aws:
                 "cn-north-1",
                 "us-gov-west-1",
             }
+        get_aws_regions_by_service.cache_clear()
+
+    def test_get_aws_regions_by_service(self):
+        get_aws_regions_by_service.cache_clear()
+        with patch(
+            "prowler.providers.aws.aws_provider.read_aws_regions_file",
+            return_value={
+                "services": {
+                    "acm": {
+                        "regions": {
+                            "aws": [
+                                "af-south-1",
+                                "eu-west-1",
+                            ],
+                            "aws-cn": [
+                                "cn-north-1",
+                            ],
+                        }
+                    }
+                }
+            },
+        ) as read_aws_regions_file:
+            regions_by_service = get_aws_regions_by_service()
+            assert regions_by_service == {
+                ("acm", "aws"): frozenset({"af-south-1", "eu-west-1"}),
+                ("acm", "aws-cn"): frozenset({"cn-north-1"}),
+            }
+            # The AWS services JSON file is read only once
+            assert get_aws_regions_by_service() is regions_by_service
+            read_aws_regions_file.assert_called_once()
+        get_aws_regions_by_service.cache_clear()
 
     def test_get_aws_region_for_sts_input_regions_none_session_region_none(self):
         input_regions = None
@@ -1361,6 +1426,7 @@ aws:
 
         assert session_config.user_agent_extra == BOTO3_USER_AGENT_EXTRA
         assert session_config.retries == {"max_attempts": 3, "mode": "standard"}
+        assert session_config.max_pool_connections == 10
 
     @mock_aws
     def test_set_session_config_10_max_attempts(self):
@@ -1371,6 +1437,25 @@ aws:
         assert session_config.user_agent_extra == BOTO3_USER_AGENT_EXTRA
         assert session_config.retries == {"max_attempts": 10, "mode": "standard"}
 
+    @mock_aws
+    def test_set_session_config_50_max_pool_connections(self):
+        arguments = Namespace()
+        aws_provider = AwsProvider(arguments)
+        session_config = aws_provider.set_session_config(None, 50)
+
+        assert session_config.user_agent_extra == BOTO3_USER_AGENT_EXTRA
+        assert session_config.retries == {"max_attempts": 3, "mode": "standard"}
+        assert session_config.max_pool_connections == 50
+
+    @mock_aws
+    def test_aws_provider_max_pool_connections(self):
+        arguments = Namespace()
+        arguments.aws_max_pool_connections = 50
+        aws_provider = AwsProvider(arguments)
+
+        assert aws_provider.session.session_config.max_pool_connections == 50
+        assert aws_provider.thread_pool._max_workers == 50
+
     @mock_aws
     @patch(
         "prowler.lib.check.check.recover_checks_from_provider",
@@ -0,0 +1,87 @@
+import json
+from argparse import Namespace
+
+from boto3 import client
+from moto import mock_aws
+
+from prowler.providers.aws.lib.quick_inventory.quick_inventory import (
+    get_buckets_per_region,
+    quick_inventory,
+)
+from tests.providers.aws.utils import (
+    AWS_ACCOUNT_NUMBER,
+    AWS_REGION_EU_WEST_1,
+    AWS_REGION_US_EAST_1,
+    set_mocked_aws_provider,
+)
+
+
+class Test_quick_inventory:
+    @mock_aws
+    def test_get_buckets_per_region(self):
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        s3_client.create_bucket(Bucket="bucket-us-east-1")
+        s3_client.put_bucket_tagging(
+            Bucket="bucket-us-east-1",
+            Tagging={"TagSet": [{"Key": "Name", "Value": "bucket"}]},
+        )
+        s3_client.create_bucket(
+            Bucket="bucket-eu-west-1",
+            CreateBucketConfiguration={"LocationConstraint": AWS_REGION_EU_WEST_1},
+        )
+        s3_client.create_bucket(
+            Bucket="bucket-eu-west-2",
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_US_EAST_1, AWS_REGION_EU_WEST_1],
+            profile_region=AWS_REGION_US_EAST_1,
+        )
+
+        assert get_buckets_per_region(
+            aws_provider, [AWS_REGION_US_EAST_1, AWS_REGION_EU_WEST_1]
+        ) == {
+            AWS_REGION_US_EAST_1: [
+                {
+                    "arn": "arn:aws:s3:us-east-1::bucket-us-east-1",
+                    "tags": [{"Key": "Name", "Value": "bucket"}],
+                }
+            ],
+            AWS_REGION_EU_WEST_1: [
+                {"arn": "arn:aws:s3:eu-west-1::bucket-eu-west-1", "tags": []}
+            ],
+        }
+
+    @mock_aws
+    def test_quick_inventory(self, tmp_path):
+        s3_client = client("s3", region_name=AWS_REGION_US_EAST_1)
+        s3_client.create_bucket(Bucket="bucket-us-east-1")
+        ec2_client = client("ec2", region_name=AWS_REGION_EU_WEST_1)
+        vpc_id = ec2_client.create_vpc(
+            CidrBlock="10.0.0.0/16",
+            TagSpecifications=[
+                {"ResourceType": "vpc", "Tags": [{"Key": "Name", "Value": "vpc"}]}
+            ],
+        )["Vpc"]["VpcId"]
+        iam_client = client("iam")
+        iam_client.create_user(UserName="user")
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_US_EAST_1, AWS_REGION_EU_WEST_1],
+            profile_region=AWS_REGION_US_EAST_1,
+        )
+        arguments = Namespace(
+            output_directory=str(tmp_path),
+            output_filename="inventory",
+            output_bucket=None,
+            output_bucket_no_assume=None,
+        )
+
+        quick_inventory(aws_provider, arguments)
+
+        with open(f"{tmp_path}/inventory.json") as inventory_file:
+            inventory = json.load(inventory_file)
+        assert [resource["AWS_ResourceARN"] for resource in inventory] == [
+            f"arn:aws:ec2:{AWS_REGION_EU_WEST_1}:{AWS_ACCOUNT_NUMBER}:vpc/{vpc_id}",
+            f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/user",
+            "arn:aws:s3:us-east-1::bucket-us-east-1",
+        ]
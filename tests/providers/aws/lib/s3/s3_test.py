@@ -6,7 +6,11 @@ from mock import MagicMock
 from moto import mock_aws
 
 from prowler.config.config import csv_file_suffix
-from prowler.providers.aws.lib.s3.s3 import get_s3_object_path, send_to_s3_bucket
+from prowler.providers.aws.lib.s3.s3 import (
+    get_s3_object_path,
+    send_outputs_to_s3_bucket,
+    send_to_s3_bucket,
+)
 
 AWS_ACCOUNT_ID = "123456789012"
 AWS_REGION = "us-east-1"
@@ -97,6 +101,40 @@ class TestS3:
             == "binary/octet-stream"
         )
 
+    @mock_aws
+    def test_send_outputs_to_s3_bucket(self):
+        # Create mock session
+        session = boto3.session.Session(region_name=AWS_REGION)
+
+        # Create mock bucket
+        client = session.client("s3")
+        client.create_bucket(Bucket=S3_BUCKET_NAME)
+
+        # Mocked CSV output files
+        output_directory = f"{ACTUAL_DIRECTORY}/{FIXTURES_DIR_NAME}"
+        filename = f"prowler-output-{AWS_ACCOUNT_ID}"
+
+        # The output file of json-ocsf does not exist
+        assert (
+            send_outputs_to_s3_bucket(
+                filename,
+                output_directory,
+                [OUTPUT_MODE_CSV, OUTPUT_MODE_CIS_1_4_AWS, "json-ocsf"],
+                S3_BUCKET_NAME,
+                session,
+            )
+            == 2
+        )
+
+        bucket_directory = get_s3_object_path(output_directory)
+        assert sorted(
+            s3_object["Key"]
+            for s3_object in client.list_objects_v2(Bucket=S3_BUCKET_NAME)["Contents"]
+        ) == [
+            f"{bucket_directory}/compliance/{filename}_{OUTPUT_MODE_CIS_1_4_AWS}{csv_file_suffix}",
+            f"{bucket_directory}/{OUTPUT_MODE_CSV}/{filename}{csv_file_suffix}",
+        ]
+
     def test_get_s3_object_path_with_prowler(self):
         output_directory = "/Users/admin/prowler/"
         assert (
@@ -9,8 +9,11 @@ from mock import MagicMock, patch
 from prowler.config.config import prowler_version, timestamp_utc
 from prowler.lib.check.models import Check_Report, load_check_metadata
 from prowler.providers.aws.lib.security_hub.security_hub import (
+    Security_Hub_Findings_Batches,
     batch_send_to_security_hub,
+    get_security_hub_enabled_regions,
     prepare_security_hub_findings,
+    resolve_security_hub_previous_findings,
     verify_security_hub_integration_enabled_per_region,
 )
 from tests.providers.aws.utils import (
@@ -161,7 +164,7 @@ class Test_SecurityHub:
                 (
                     "root",
                     WARNING,
-                    f"ClientError -- [70]: An error occurred ({error_code}) when calling the {operation_name} operation: {error_message}",
+                    f"ClientError -- [118]: An error occurred ({error_code}) when calling the {operation_name} operation: {error_message}",
                 )
             ]
 
@@ -221,7 +224,7 @@ class Test_SecurityHub:
                 (
                     "root",
                     ERROR,
-                    f"ClientError -- [70]: An error occurred ({error_code}) when calling the {operation_name} operation: {error_message}",
+                    f"ClientError -- [118]: An error occurred ({error_code}) when calling the {operation_name} operation: {error_message}",
                 )
             ]
 
@@ -247,7 +250,7 @@ class Test_SecurityHub:
                 (
                     "root",
                     ERROR,
-                    f"Exception -- [70]: {error_message}",
+                    f"Exception -- [118]: {error_message}",
                 )
             ]
 
@@ -437,3 +440,256 @@ class Test_SecurityHub:
             )
             == 1
         )
+
+    @patch(
+        "prowler.providers.aws.lib.security_hub.security_hub.SECURITY_HUB_RETRY_DELAY",
+        new=0,
+    )
+    def test_batch_send_to_security_hub_several_regions_with_failed_findings(self):
+        security_hub_findings = {
+            AWS_REGION_EU_WEST_1: [{"Id": f"finding-{i}"} for i in range(150)],
+            AWS_REGION_EU_WEST_2: [{"Id": "finding-eu-west-2"}],
+        }
+        security_hub_clients = {}
+        for region in security_hub_findings:
+            security_hub_clients[region] = MagicMock()
+
+        # The first finding of every batch fails once
+        failed_findings = set()
+
+        def batch_import_findings(Findings):
+            failed = [
+                {"Id": finding["Id"], "ErrorCode": "Error", "ErrorMessage": "Error"}
+                for finding in Findings[:1]
+                if finding["Id"] not in failed_findings
+            ]
+            failed_findings.update(finding["Id"] for finding in failed)
+            return {
+                "FailedCount": len(failed),
+                "SuccessCount": len(Findings) - len(failed),
+                "FailedFindings": failed,
+            }
+
+        security_hub_clients[AWS_REGION_EU_WEST_1].batch_import_findings.side_effect = (
+            batch_import_findings
+        )
+        security_hub_clients[AWS_REGION_EU_WEST_2].batch_import_findings.side_effect = (
+            batch_import_findings
+        )
+        session = MagicMock()
+        session.client.side_effect = lambda service, region_name: security_hub_clients[
+            region_name
+        ]
+
+        assert batch_send_to_security_hub(security_hub_findings, session) == 151
+        # Only the failed findings are sent again
+        assert sorted(
+            len(call.kwargs["Findings"])
+            for call in security_hub_clients[
+                AWS_REGION_EU_WEST_1
+            ].batch_import_findings.call_args_list
+        ) == [1, 1, 50, 100]
+        assert (
+            security_hub_clients[AWS_REGION_EU_WEST_2].batch_import_findings.call_count
+            == 2
+        )
+
+    @patch(
+        "prowler.providers.aws.lib.security_hub.security_hub.SECURITY_HUB_RETRY_DELAY",
+        new=0,
+    )
+    def test_batch_send_to_security_hub_failed_findings_max_retries(self, caplog):
+        security_hub_client = MagicMock()
+        security_hub_client.batch_import_findings.return_value = {
+            "FailedCount": 1,
+            "SuccessCount": 0,
+            "FailedFindings": [
+                {"Id": "finding", "ErrorCode": "Error", "ErrorMessage": "Message"}
+            ],
+        }
+        session = MagicMock()
+        session.client.return_value = security_hub_client
+
+        assert (
+            batch_send_to_security_hub(
+                {AWS_REGION_EU_WEST_1: [{"Id": "finding"}]}, session
+            )
+            == 0
+        )
+        assert security_hub_client.batch_import_findings.call_count == 4
+        assert caplog.record_tuples == [
+            (
+                "root",
+                ERROR,
+                "Failed to send findings to AWS Security Hub -- Error -- Message",
+            )
+        ]
+
+    def test_resolve_security_hub_previous_findings(self):
+        security_hub_client = MagicMock()
+        security_hub_client.get_paginator.return_value.paginate.return_value = [
+            {"Findings": [{"Id": "current-finding"}, {"Id": "previous-finding"}]}
+        ]
+        security_hub_client.batch_import_findings.side_effect = lambda Findings: {
+            "FailedCount": 0,
+            "SuccessCount": len(Findings),
+        }
+        aws_provider = set_mocked_aws_provider()
+        aws_provider._session.current_session = MagicMock()
+        aws_provider._session.current_session.client.return_value = security_hub_client
+
+        assert (
+            resolve_security_hub_previous_findings(
+                {AWS_REGION_EU_WEST_1: [{"Id": "current-finding"}]}, aws_provider
+            )
+            == 1
+        )
+        archived_findings = security_hub_client.batch_import_findings.call_args.kwargs[
+            "Findings"
+        ]
+        assert len(archived_findings) == 1
+        assert archived_findings[0]["Id"] == "previous-finding"
+        assert archived_findings[0]["RecordState"] == "ARCHIVED"
+
+        # The streamed findings only keep their Ids
+        assert (
+            resolve_security_hub_previous_findings(
+                {AWS_REGION_EU_WEST_1: {"current-finding"}}, aws_provider
+            )
+            == 1
+        )
+        archived_findings = security_hub_client.batch_import_findings.call_args.kwargs[
+            "Findings"
+        ]
+        assert [finding["Id"] for finding in archived_findings] == ["previous-finding"]
+
+    @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_get_security_hub_enabled_regions(self, tmp_path):
+        aws_provider = set_mocked_aws_provider(
+            audited_regions=[AWS_REGION_EU_WEST_1, AWS_REGION_EU_WEST_2]
+        )
+
+        with patch(
+            "prowler.providers.aws.lib.security_hub.security_hub.security_hub_cache_file",
+            str(tmp_path / "security_hub_enabled_regions.json"),
+        ):
+            assert get_security_hub_enabled_regions(aws_provider) == [
+                AWS_REGION_EU_WEST_1
+            ]
+
+    def test_get_security_hub_enabled_regions_cache(self, tmp_path):
+        aws_provider = set_mocked_aws_provider(
+            audited_regions=[AWS_REGION_EU_WEST_1, AWS_REGION_EU_WEST_2]
+        )
+
+        with patch(
+            "prowler.providers.aws.lib.security_hub.security_hub.security_hub_cache_file",
+            str(tmp_path / "prowler" / "security_hub_enabled_regions.json"),
+        ), patch(
+            "prowler.providers.aws.lib.security_hub.security_hub.verify_security_hub_integration_enabled_per_region",
+            side_effect=lambda partition, region, session, account: region
+            == AWS_REGION_EU_WEST_1,
+        ) as verify_security_hub_integration:
+            assert get_security_hub_enabled_regions(aws_provider) == [
+                AWS_REGION_EU_WEST_1
+            ]
+            assert verify_security_hub_integration.call_count == 2
+
+            # The cached regions are not verified again
+            assert get_security_hub_enabled_regions(aws_provider) == [
+                AWS_REGION_EU_WEST_1
+            ]
+            assert verify_security_hub_integration.call_count == 2
+
+            # Without cache every region is verified
+            assert get_security_hub_enabled_regions(aws_provider, 0) == [
+                AWS_REGION_EU_WEST_1
+            ]
+            assert verify_security_hub_integration.call_count == 4
+
+    def test_get_security_hub_enabled_regions_errors_not_cached(self, tmp_path):
+        aws_provider = set_mocked_aws_provider(
+            audited_regions=[AWS_REGION_EU_WEST_1, AWS_REGION_EU_WEST_2]
+        )
+
+        with patch(
+            "prowler.providers.aws.lib.security_hub.security_hub.security_hub_cache_file",
+            str(tmp_path / "prowler" / "security_hub_enabled_regions.json"),
+        ), patch(
+            "prowler.providers.aws.lib.security_hub.security_hub.verify_security_hub_integration_enabled_per_region",
+            side_effect=lambda partition, region, session, account: (
+                True if region == AWS_REGION_EU_WEST_1 else None
+            ),
+        ) as verify_security_hub_integration:
+            assert get_security_hub_enabled_regions(aws_provider) == [
+                AWS_REGION_EU_WEST_1
+            ]
+            assert verify_security_hub_integration.call_count == 2
+
+            # The region that could not be verified is verified again
+            assert get_security_hub_enabled_regions(aws_provider) == [
+                AWS_REGION_EU_WEST_1
+            ]
+            assert verify_security_hub_integration.call_count == 3
+            verify_security_hub_integration.assert_called_with(
+                aws_provider.identity.partition,
+                AWS_REGION_EU_WEST_2,
+                aws_provider.session.current_session,
+                aws_provider.identity.account,
+            )
+
+    def test_security_hub_findings_batches(self):
+        enabled_regions = [AWS_REGION_EU_WEST_1]
+        output_options = self.set_mocked_output_options()
+        aws_provider = set_mocked_aws_provider()
+        batches = []
+
+        def mock_batch_import_findings(self, operation_name, kwarg):
+            if operation_name == "BatchImportFindings":
+                batches.append(len(kwarg["Findings"]))
+                return {"FailedCount": 0, "SuccessCount": len(kwarg["Findings"])}
+            return make_api_call(self, operation_name, kwarg)
+
+        with patch(
+            "botocore.client.BaseClient._make_api_call", new=mock_batch_import_findings
+        ):
+            security_hub_findings_batches = Security_Hub_Findings_Batches(
+                aws_provider,
+                output_options,
+                enabled_regions,
+                self.set_mocked_session(AWS_REGION_EU_WEST_1),
+            )
+            security_hub_findings_batches.extend(
+                [self.generate_finding("FAIL", AWS_REGION_EU_WEST_1)] * 60
+            )
+            assert batches == []
+            security_hub_findings_batches.extend(
+                [self.generate_finding("PASS", AWS_REGION_EU_WEST_1)] * 90
+                + [self.generate_finding("FAIL", AWS_REGION_EU_WEST_2)]
+            )
+            # The full batch is sent in the background while the findings are streamed
+            assert len(security_hub_findings_batches._sending_batches) == 1
+            security_hub_findings_batches._sending_batches[0].result()
+            assert batches == [100]
+
+            assert security_hub_findings_batches.send() == 150
+
+        assert batches == [100, 50]
+        assert security_hub_findings_batches.pending_findings_per_region == {
+            AWS_REGION_EU_WEST_1: []
+        }
+        # Only the Ids of the sent findings are kept
+        assert security_hub_findings_batches.findings_ids_per_region == {
+            AWS_REGION_EU_WEST_1: {
+                finding["Id"]
+                for finding in prepare_security_hub_findings(
+                    [
+                        self.generate_finding("FAIL", AWS_REGION_EU_WEST_1),
+                        self.generate_finding("PASS", AWS_REGION_EU_WEST_1),
+                    ],
+                    aws_provider,
+                    output_options,
+                    enabled_regions,
+                )[AWS_REGION_EU_WEST_1]
+            }
+        }
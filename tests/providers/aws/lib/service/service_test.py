@@ -1,5 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 from mock import patch
 
+from prowler.providers.aws.aws_provider import __set_aws_thread_pool_worker__
 from prowler.providers.aws.lib.service.service import AWSService
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_ARN,
@@ -60,3 +64,85 @@ class TestAWSService:
         assert not hasattr(service, "regional_clients")
         assert service.region == AWS_REGION_US_EAST_1
         assert service.client.__class__.__name__ == "CloudFront"
+
+    def test_AWSService_shared_thread_pool_and_client(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("ec2", provider)
+        other_service = AWSService("ec2", provider)
+
+        assert service.thread_pool is provider.thread_pool
+        assert other_service.thread_pool is provider.thread_pool
+        assert service.client is other_service.client
+
+    def test_AWSService_wait_for_job(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("iam", provider, global_service=True)
+        job_statuses = iter(
+            [{"JobStatus": "IN_PROGRESS"} for _ in range(6)]
+            + [{"JobStatus": "COMPLETED"}]
+        )
+
+        with patch("prowler.providers.aws.lib.service.service.sleep") as sleep:
+            job_status = service.__wait_for_job__(
+                lambda: next(job_statuses),
+                lambda job_status: job_status["JobStatus"] != "IN_PROGRESS",
+            )
+
+        assert job_status == {"JobStatus": "COMPLETED"}
+        assert [call.args[0] for call in sleep.call_args_list] == [
+            0.25,
+            0.5,
+            1,
+            2,
+            4,
+            8,
+        ]
+
+    def test_AWSService_wait_for_job_max_delay(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("iam", provider, global_service=True)
+        job_statuses = iter(
+            [{"State": "STARTED"} for _ in range(8)] + [{"State": "COMPLETE"}]
+        )
+
+        with patch("prowler.providers.aws.lib.service.service.sleep") as sleep:
+            service.__wait_for_job__(
+                lambda: next(job_statuses),
+                lambda job_status: job_status["State"] == "COMPLETE",
+            )
+
+        assert max(call.args[0] for call in sleep.call_args_list) == 10
+
+    def test_AWSService_wait_for_job_timeout(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("iam", provider, global_service=True)
+
+        with patch(
+            "prowler.providers.aws.lib.service.service.JOB_POLLING_TIMEOUT", 0
+        ), patch("prowler.providers.aws.lib.service.service.sleep") as sleep:
+            with pytest.raises(TimeoutError):
+                service.__wait_for_job__(
+                    lambda: {"JobStatus": "IN_PROGRESS"},
+                    lambda job_status: job_status["JobStatus"] != "IN_PROGRESS",
+                )
+        sleep.assert_not_called()
+
+    def test_AWSService_nested_threading_call(self):
+        provider = set_mocked_aws_provider()
+        # A single thread would wait forever for the nested calls if they were submitted to the pool
+        provider._thread_pool = ThreadPoolExecutor(
+            max_workers=1, initializer=__set_aws_thread_pool_worker__
+        )
+        service = AWSService("ec2", provider)
+        items = []
+
+        def add_item(item):
+            items.append(item)
+
+        def nested_threading_call(item):
+            service.__threading_call__(add_item, [f"{item}-1", f"{item}-2"])
+
+        service.__threading_call__(nested_threading_call, ["a", "b"])
+        provider.thread_pool.shutdown()
+
+        assert sorted(items) == ["a-1", "a-2", "b-1", "b-2"]
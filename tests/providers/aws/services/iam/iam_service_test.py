@@ -833,6 +833,34 @@ nTTxU4a7x1naFxzYXK1iQ1vMARKMjDb19QEJIEJKZlDK4uS7yMlf1nFS
                     entity=user_name,
                 )
 
+    # Test IAM User Inline Policies keep the users order
+    @mock_aws
+    def test__list_inline_user_policies__many_users(self):
+        # IAM Client
+        iam_client = client("iam")
+        # Create IAM Users with an Inline Policy
+        user_names = [f"test_user_{index}" for index in range(20)]
+        for user_name in user_names:
+            iam_client.create_user(UserName=user_name)
+            iam_client.put_user_policy(
+                UserName=user_name,
+                PolicyName=f"{user_name}_policy",
+                PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+            )
+
+        # IAM client for this test class
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        iam = IAM(aws_provider)
+
+        assert len(iam.users) == 20
+        for user in iam.users:
+            assert user.inline_policies == [f"{user.name}_policy"]
+            assert user.tags == []
+            assert iam.access_keys_metadata[(user.name, user.arn)] == []
+        assert [
+            policy.entity for policy in iam.policies if policy.type == "Inline"
+        ] == [user.name for user in iam.users]
+
     # Test IAM Group Inline Policy
     @mock_aws
     def test__list_inline_group_policies__(self):
@@ -6,6 +6,7 @@ from moto import mock_aws
 from prowler.providers.aws.services.s3.s3_service import S3, S3Control
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
+    AWS_REGION_EU_WEST_1,
     AWS_REGION_US_EAST_1,
     set_mocked_aws_provider,
 )
@@ -66,6 +67,43 @@ class Test_S3_Service:
         )
         assert not s3.buckets[0].object_lock
 
+    # Test S3 List Buckets in several regions
+    @mock_aws
+    def test__list_buckets__several_regions(self):
+        s3_client = client("s3")
+        bucket_names = [f"test-bucket-{index}" for index in range(5)]
+        for index, bucket_name in enumerate(bucket_names):
+            if index % 2:
+                s3_client.create_bucket(
+                    Bucket=bucket_name,
+                    CreateBucketConfiguration={
+                        "LocationConstraint": AWS_REGION_EU_WEST_1
+                    },
+                )
+                s3_client.put_bucket_versioning(
+                    Bucket=bucket_name,
+                    VersioningConfiguration={"Status": "Enabled"},
+                )
+            else:
+                s3_client.create_bucket(Bucket=bucket_name)
+
+        aws_provider = set_mocked_aws_provider([AWS_REGION_EU_WEST_1])
+        s3 = S3(aws_provider)
+
+        assert s3.regions_with_buckets == [
+            AWS_REGION_US_EAST_1,
+            AWS_REGION_EU_WEST_1,
+            AWS_REGION_US_EAST_1,
+            AWS_REGION_EU_WEST_1,
+            AWS_REGION_US_EAST_1,
+        ]
+        assert [bucket.name for bucket in s3.buckets] == [
+            bucket_names[1],
+            bucket_names[3],
+        ]
+        assert all(bucket.region == AWS_REGION_EU_WEST_1 for bucket in s3.buckets)
+        assert all(bucket.versioning for bucket in s3.buckets)
+
     # Test S3 Get Bucket Versioning
     @mock_aws
     def test__get_bucket_versioning__(self):
@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+from unittest.mock import patch
+
+from prowler.providers.azure.lib.service.service import (
+    AzureService,
+    __set_azure_thread_pool_worker__,
+)
+from prowler.providers.azure.models import AzureIdentityInfo
+from tests.providers.azure.azure_fixtures import set_mocked_azure_provider
+
+SUBSCRIPTIONS = {
+    f"subscription-{index}": f"subscription-id-{index}" for index in range(10)
+}
+
+
+class MockManagementClient:
+    def __init__(self, credential, subscription_id, base_url, credential_scopes):
+        self.subscription_id = subscription_id
+
+
+class TestAzureService:
+    def test__subscriptions_threading_call__(self):
+        service = AzureService(
+            MockManagementClient,
+            set_mocked_azure_provider(
+                identity=AzureIdentityInfo(subscriptions=SUBSCRIPTIONS)
+            ),
+        )
+
+        def call(subscription, client):
+            # The first subscriptions finish the last
+            sleep((10 - int(subscription.split("-")[-1])) / 100)
+            if subscription == "subscription-3":
+                raise Exception("Error")
+            return client.subscription_id
+
+        results = service.__subscriptions_threading_call__(call)
+
+        assert list(results) == list(SUBSCRIPTIONS)
+        assert results["subscription-3"] is None
+        for subscription, subscription_id in SUBSCRIPTIONS.items():
+            if subscription != "subscription-3":
+                assert results[subscription] == subscription_id
+
+    def test__threading_call__(self):
+        service = AzureService(
+            MockManagementClient,
+            set_mocked_azure_provider(
+                identity=AzureIdentityInfo(subscriptions=SUBSCRIPTIONS)
+            ),
+        )
+
+        assert service.__threading_call__(lambda item: item * 2, range(100)) == [
+            item * 2 for item in range(100)
+        ]
+
+    def test__threading_call__nested(self):
+        service = AzureService(
+            MockManagementClient,
+            set_mocked_azure_provider(
+                identity=AzureIdentityInfo(subscriptions=SUBSCRIPTIONS)
+            ),
+        )
+
+        def nested_threading_call(subscription, client):
+            return service.__threading_call__(
+                lambda item: f"{client.subscription_id}-{item}", [1, 2]
+            )
+
+        # A single thread would wait forever for the nested calls if they were submitted to the pool
+        thread_pool = ThreadPoolExecutor(
+            max_workers=1, initializer=__set_azure_thread_pool_worker__
+        )
+        with patch(
+            "prowler.providers.azure.lib.service.service.azure_thread_pool",
+            thread_pool,
+        ):
+            results = service.__subscriptions_threading_call__(nested_threading_call)
+        thread_pool.shutdown()
+
+        assert results == {
+            subscription: [f"{subscription_id}-1", f"{subscription_id}-2"]
+            for subscription, subscription_id in SUBSCRIPTIONS.items()
+        }
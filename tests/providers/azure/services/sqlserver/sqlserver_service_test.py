@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from azure.mgmt.sql.models import (
     EncryptionProtector,
@@ -245,3 +245,37 @@ class Test_SqlServer_Service:
             ].security_alert_policies.state
             == "Disabled"
         )
+
+
+def mock_sqlserver_set_clients(*_):
+    clients = {}
+    for subscription in ["subscription-1", "subscription-2"]:
+        client = MagicMock()
+        servers = []
+        for index in range(3):
+            server = MagicMock(
+                id=f"/subscriptions/{subscription}/resourceGroups/resource_group/providers/Microsoft.Sql/servers/{subscription}-server-{index}"
+            )
+            # The name attribute of a MagicMock must be configured after its creation
+            server.configure_mock(name=f"{subscription}-server-{index}")
+            servers.append(server)
+        client.servers.list.return_value = servers
+        client.databases.list_by_server.return_value = []
+        clients[subscription] = client
+    return clients
+
+
+@patch(
+    "prowler.providers.azure.lib.service.service.AzureService.__set_clients__",
+    new=mock_sqlserver_set_clients,
+)
+class Test_SqlServer_Service_Subscriptions:
+    def test__get_sql_servers__several_subscriptions(self):
+        sql_server = SQLServer(set_mocked_azure_provider())
+
+        assert list(sql_server.sql_servers) == ["subscription-1", "subscription-2"]
+        for subscription, servers in sql_server.sql_servers.items():
+            assert [server.name for server in servers] == [
+                f"{subscription}-server-{index}" for index in range(3)
+            ]
+            assert all(server.databases == [] for server in servers)
@@ -42,6 +42,7 @@ def mock_api_client(GCPService, service, api_version, _):
     mock_api_policies_calls(client)
     mock_api_sink_calls(client)
     mock_api_services_calls(client)
+    mock_api_batch_calls(client)
 
     return client
 
@@ -965,3 +966,26 @@ def mock_api_services_calls(client: MagicMock):
         ]
     }
     client.services().list_next.return_value = None
+
+
+def mock_api_batch_calls(client: MagicMock):
+    def mock_new_batch_http_request(callback=None):
+        batch = MagicMock()
+        requests = []
+
+        def mock_add(request, callback=None, request_id=None):
+            requests.append((request, callback, request_id))
+
+        def mock_execute(http=None):
+            for request, request_callback, request_id in requests:
+                try:
+                    response, exception = request.execute(), None
+                except Exception as error:
+                    response, exception = None, error
+                (request_callback or callback)(request_id, response, exception)
+
+        batch.add = mock_add
+        batch.execute = mock_execute
+        return batch
+
+    client.new_batch_http_request = mock_new_batch_http_request
@@ -3,14 +3,20 @@ from datetime import datetime
 from os import rmdir
 
 from freezegun import freeze_time
-from mock import patch
+from mock import MagicMock, patch
 
 from prowler.config.config import (
     default_config_file_path,
     default_fixer_config_file_path,
 )
 from prowler.providers.gcp.gcp_provider import GcpProvider
-from prowler.providers.gcp.models import GCPIdentityInfo, GCPOutputOptions, GCPProject
+from prowler.providers.gcp.models import (
+    GCPIdentityInfo,
+    GCPOrganization,
+    GCPOutputOptions,
+    GCPProject,
+)
+from tests.providers.gcp.gcp_fixtures import mock_api_batch_calls
 
 
 class TestGCPProvider:
@@ -171,3 +177,65 @@ class TestGCPProvider:
         input_project = "prowler-test-project"
         project_to_match = "prowler-test"
         assert not gcp_provider.is_project_matching(input_project, project_to_match)
+
+    def test_update_projects_with_organizations(self):
+        arguments = Namespace()
+        arguments.project_id = []
+        arguments.excluded_project_id = []
+        arguments.list_project_id = False
+        arguments.credentials_file = ""
+        arguments.config_file = default_config_file_path
+        arguments.fixer_config = default_fixer_config_file_path
+
+        projects = {
+            f"test-project-{index}": GCPProject(
+                number=str(index),
+                id=f"test-project-{index}",
+                name=f"test-project-{index}",
+                organization=(
+                    GCPOrganization(
+                        id=f"{index % 2}", name=f"organizations/{index % 2}"
+                    )
+                    if index
+                    else None
+                ),
+                labels=[],
+                lifecycle_state="",
+            )
+            for index in range(5)
+        }
+        with patch(
+            "prowler.providers.gcp.gcp_provider.GcpProvider.setup_session",
+            return_value=None,
+        ), patch(
+            "prowler.providers.gcp.gcp_provider.GcpProvider.get_projects",
+            return_value=projects,
+        ), patch(
+            "prowler.providers.gcp.gcp_provider.GcpProvider.update_projects_with_organizations",
+            return_value=None,
+        ):
+            gcp_provider = GcpProvider(arguments)
+
+        client = MagicMock()
+        mock_api_batch_calls(client)
+
+        def mock_get_organization(name):
+            request = MagicMock()
+            request.execute.return_value = {"displayName": f"{name} display name"}
+            return request
+
+        client.organizations().get = MagicMock(side_effect=mock_get_organization)
+        with patch(
+            "prowler.providers.gcp.gcp_provider.discovery.build",
+            return_value=client,
+        ):
+            gcp_provider.update_projects_with_organizations()
+
+        # Each organization is retrieved only once
+        assert client.organizations().get.call_count == 2
+        assert gcp_provider.projects["test-project-0"].organization is None
+        for index in range(1, 5):
+            assert (
+                gcp_provider.projects[f"test-project-{index}"].organization.display_name
+                == f"organizations/{index % 2} display name"
+            )
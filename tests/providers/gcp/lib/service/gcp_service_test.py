@@ -0,0 +1,208 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Thread
+from unittest.mock import MagicMock, patch
+
+from prowler.providers.gcp.lib.service import service
+from prowler.providers.gcp.lib.service.service import GCPService
+from tests.providers.gcp.gcp_fixtures import (
+    GCP_PROJECT_ID,
+    mock_api_client,
+    set_mocked_gcp_provider,
+)
+
+
+def mock_api_client_with_error(GCPService, service, api_version, _):
+    client = MagicMock()
+    client.services().list().execute.side_effect = Exception("Permission denied")
+    return client
+
+
+class TestGCPService:
+    def setup_method(self):
+        service.enabled_services_per_project.clear()
+        service.enabled_services_futures.clear()
+
+    def test__is_api_active__(self):
+        generated_clients = []
+
+        def generate_client(GCPService, service, api_version, credentials):
+            generated_clients.append(service)
+            return mock_api_client(GCPService, service, api_version, credentials)
+
+        with patch.object(GCPService, "__generate_client__", new=generate_client):
+            artifacts = GCPService(
+                "artifacts", set_mocked_gcp_provider(project_ids=[GCP_PROJECT_ID])
+            )
+            compute = GCPService(
+                "compute", set_mocked_gcp_provider(project_ids=[GCP_PROJECT_ID])
+            )
+
+        assert artifacts.project_ids == [GCP_PROJECT_ID]
+        assert compute.project_ids == []
+        # The enabled services of the project are listed only once
+        assert generated_clients.count("serviceusage") == 1
+        assert service.enabled_services_per_project[GCP_PROJECT_ID] == [
+            {"name": "artifacts.googleapis.com", "title": "artifacts.googleapis.com"},
+            {"name": "bigquery.googleapis.com", "title": "bigquery.googleapis.com"},
+        ]
+
+    def test__is_api_active__error(self):
+        with patch(
+            "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+            new=mock_api_client_with_error,
+        ):
+            artifacts = GCPService(
+                "artifacts", set_mocked_gcp_provider(project_ids=[GCP_PROJECT_ID])
+            )
+
+        assert artifacts.project_ids == []
+        assert service.enabled_services_per_project[GCP_PROJECT_ID] is None
+
+    def test__batch_execute__(self):
+        with patch(
+            "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+            new=mock_api_client,
+        ):
+            compute = GCPService(
+                "compute", set_mocked_gcp_provider(project_ids=[GCP_PROJECT_ID])
+            )
+
+        def mock_request(project_id, page):
+            request = MagicMock()
+            request.project_id = project_id
+            request.page = page
+            if project_id == "project-error":
+                request.execute.side_effect = Exception("Permission denied")
+            else:
+                request.execute.return_value = {"items": [f"{project_id}-{page}"]}
+            return request
+
+        def mock_list_next(previous_request, previous_response):
+            # Only the first project has a second page
+            if (
+                previous_request.project_id == "project-0"
+                and previous_request.page == 0
+            ):
+                return mock_request("project-0", 1)
+            return None
+
+        project_ids = [f"project-{index}" for index in range(150)] + ["project-error"]
+        items = {}
+        with patch("prowler.providers.gcp.lib.service.service.GCP_BATCH_SIZE", 100):
+            compute.__batch_execute__(
+                {project_id: mock_request(project_id, 0) for project_id in project_ids},
+                lambda project_id, response: items.setdefault(project_id, []).extend(
+                    response["items"]
+                ),
+                list_next=mock_list_next,
+            )
+
+        assert len(items) == 150
+        assert items["project-0"] == ["project-0-0", "project-0-1"]
+        assert items["project-149"] == ["project-149-0"]
+        assert "project-error" not in items
+
+    def test__threading_call__(self):
+        with patch(
+            "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+            new=mock_api_client,
+        ):
+            artifacts = GCPService(
+                "artifacts", set_mocked_gcp_provider(project_ids=[GCP_PROJECT_ID])
+            )
+
+        results = []
+
+        def call(value):
+            if value == 3:
+                raise Exception("Error")
+            results.append(value)
+
+        artifacts.__threading_call__(call, range(10))
+
+        assert sorted(results) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+
+    def test__threading_call__nested(self):
+        with patch(
+            "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+            new=mock_api_client,
+        ):
+            artifacts = GCPService(
+                "artifacts", set_mocked_gcp_provider(project_ids=[GCP_PROJECT_ID])
+            )
+
+        items = []
+
+        def add_item(item):
+            items.append(item)
+
+        def nested_threading_call(item):
+            artifacts.__threading_call__(add_item, [f"{item}-1", f"{item}-2"])
+
+        # A single thread would wait forever for the nested calls if they were submitted to the pool
+        thread_pool = ThreadPoolExecutor(
+            max_workers=1, initializer=service.__set_gcp_thread_pool_worker__
+        )
+        with patch(
+            "prowler.providers.gcp.lib.service.service.gcp_thread_pool", thread_pool
+        ):
+            artifacts.__threading_call__(nested_threading_call, ["a", "b"])
+        thread_pool.shutdown()
+
+        assert sorted(items) == ["a-1", "a-2", "b-1", "b-2"]
+
+    def test__get_enabled_services__concurrent(self):
+        with patch(
+            "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+            new=mock_api_client,
+        ):
+            artifacts = GCPService(
+                "artifacts", set_mocked_gcp_provider(project_ids=[GCP_PROJECT_ID])
+            )
+        service.enabled_services_per_project.clear()
+
+        listed_project_ids = []
+        slow_project_listed = Event()
+
+        def list_enabled_services(project_id):
+            listed_project_ids.append(project_id)
+            if project_id == "slow-project":
+                slow_project_listed.wait(timeout=5)
+            return [{"name": f"{project_id}.googleapis.com", "title": project_id}]
+
+        with patch.object(
+            artifacts, "__list_enabled_services__", new=list_enabled_services
+        ):
+            slow_service = Thread(
+                target=artifacts.__get_enabled_services__, args=(["slow-project"],)
+            )
+            slow_service.start()
+            # The other projects are not blocked by the listing in progress
+            enabled_services = artifacts.__get_enabled_services__(["fast-project"])
+            assert slow_service.is_alive()
+            slow_project_listed.set()
+            slow_service.join()
+            # The listings are shared
+            artifacts.__get_enabled_services__(["slow-project", "fast-project"])
+
+        assert enabled_services == {
+            "fast-project": [
+                {"name": "fast-project.googleapis.com", "title": "fast-project"}
+            ]
+        }
+        assert sorted(listed_project_ids) == ["fast-project", "slow-project"]
+        assert service.enabled_services_futures == {}
+
+    def test_get_client(self):
+        credentials = MagicMock()
+        service.get_client.cache_clear()
+        with patch(
+            "prowler.providers.gcp.lib.service.service.discovery.build_from_document"
+        ) as build_from_document:
+            client = service.get_client("compute", "v1", credentials)
+            assert service.get_client("compute", "v1", credentials) is client
+            service.get_client("compute", "v1", MagicMock())
+            service.get_client("serviceusage", "v1", credentials)
+        service.get_client.cache_clear()
+
+        assert build_from_document.call_count == 3